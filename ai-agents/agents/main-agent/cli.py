@@ -3,7 +3,6 @@
 CLI 인터페이스 - 기존 main_agent.py의 대화형 기능을 위한 CLI
 """
 
-from langchain.memory import ConversationBufferMemory
 from langchain_openai import ChatOpenAI
 import json
 import uuid
@@ -18,6 +17,7 @@ from core.profile_extractor import (
     REQUIRED_KEYS
 )
 from core.location_processor import extract_location_request_from_llm
+from core.conversation_memory import ConversationMemory
 from core.agent_builders import build_place_agent_json, build_rag_agent_json
 from utils.file_manager import FileManager
 
@@ -54,7 +54,7 @@ def main():
     session_id = str(uuid.uuid4())
     print(f"\n===== DayToCourse 사용자 정보 입력 =====\n세션 ID: {session_id}\n")
     
-    memory = ConversationBufferMemory()
+    memory = ConversationMemory()
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, openai_api_key=openai_api_key) if openai_api_key else None
     file_manager = FileManager()
     profile = {}
@@ -1,9 +1,15 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
+import asyncio
 import uuid
 import json
 from datetime import datetime
 
+from core.conversation_memory import recent_within_budget
+
+# 비동기 빌더에서 동시에 보낼 semantic_query LLM 요청 수
+SEMANTIC_QUERY_CONCURRENCY = 4
+
 def generate_chat_summary_for_rag(session_info, llm):
     """전체 대화를 요약해서 핵심 요구사항 추출"""
     chat_history = session_info.get('chat_history', [])
@@ -12,7 +18,8 @@ def generate_chat_summary_for_rag(session_info, llm):
     if not user_messages:
         return ""
     
-    all_chat = ' '.join(user_messages)
+    # 대화가 길어져도 프롬프트 크기가 일정하도록 최근 메시지만 토큰 예산 안에서 사용
+    all_chat = ' '.join(recent_within_budget(user_messages))
     
     prompt = f"""사용자의 전체 대화를 분석해서 데이트 장소 추천을 위한 핵심 요구사항만 간결하게 추출하세요.
 
@@ -317,6 +324,29 @@ def build_rag_agent_json(place_response, profile, location_request, openai_api_k
     
     return filled_json
 
+async def build_rag_agent_json_async(place_response, profile, location_request, openai_api_key, user_course_planning=None, session_info=None):
+    """RAG Agent용 JSON 생성 (비동기) - semantic_query 생성과 JSON 채우기를 동시에 실행"""
+    
+    locations = place_response.get("locations", [])
+    if not locations:
+        print("[ERROR] build_rag_agent_json_async - locations 데이터 없음")
+        return None
+    
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3, openai_api_key=openai_api_key)
+    
+    # 1. 모든 데이터 수집
+    collected_data = _collect_all_data(place_response, profile, location_request, session_info, llm)
+    
+    # 2. JSON 템플릿 정의
+    json_template = _get_json_template()
+    
+    # 3. semantic_query 생성과 나머지 필드 채우기를 병렬 실행 후 결합
+    query_texts, filled_json = await asyncio.gather(
+        _agenerate_semantic_queries_with_gpt(collected_data, llm),
+        _afill_json_with_gpt(collected_data, json_template, llm)
+    )
+    return _apply_semantic_queries(filled_json, collected_data, query_texts)
+
 def _collect_all_data(place_response, profile, location_request, session_info, llm):
     """모든 데이터 수집"""
     locations = place_response.get("locations", [])
@@ -361,18 +391,9 @@ def _collect_all_data(place_response, profile, location_request, session_info, l
         "request_id": place_response.get("request_id", f"req-{datetime.now().strftime('%Y%m%d%H%M%S')}")
     }
 
-def _generate_semantic_queries_with_gpt(collected_data, llm):
-    """GPT로 semantic_query 생성"""
-    locations = collected_data['raw_locations']
-    chat_content = '\n'.join(collected_data['user_chat'])
-    
-    semantic_queries = []
-    
-    for idx, loc in enumerate(locations):
-        # Place Agent에서 받은 실제 카테고리 사용
-        category = loc.get('venue_category', loc.get('category', '카페'))
-        
-        prompt = f"""사용자 채팅 내용:
+def _build_semantic_query_prompt(chat_content, category):
+    """semantic_query 생성 프롬프트"""
+    return f"""사용자 채팅 내용:
 {chat_content}
 
 카테고리: {category}
@@ -391,6 +412,19 @@ def _generate_semantic_queries_with_gpt(collected_data, llm):
 "연인과 함께 로맨틱한 분위기에서 특별한 저녁 식사를 즐길 수 있는 음식점. 소중한 사람과 깊은 대화를 나누며 기념일 같은 순간을 만들어주는 곳. 고급스러운 인테리어와 분위기 좋은 조명이 어우러져 특별한 데이트를 연출할 수 있습니다. 맛있는 요리와 함께 여유로운 시간을 보내며 서로의 마음을 나눌 수 있는 공간. 오랫동안 기억에 남을 소중한 추억을 만들 수 있는 완벽한 장소입니다."
 
 **생성된 검색 문구 (4-5문장):**"""
+
+def _generate_semantic_queries_with_gpt(collected_data, llm):
+    """GPT로 semantic_query 생성"""
+    locations = collected_data['raw_locations']
+    chat_content = '\n'.join(collected_data['user_chat'])
+    
+    semantic_queries = []
+    
+    for idx, loc in enumerate(locations):
+        # Place Agent에서 받은 실제 카테고리 사용
+        category = loc.get('venue_category', loc.get('category', '카페'))
+        
+        prompt = _build_semantic_query_prompt(chat_content, category)
         
         try:
             result = llm.invoke([HumanMessage(content=prompt)])
@@ -405,6 +439,35 @@ def _generate_semantic_queries_with_gpt(collected_data, llm):
     
     return semantic_queries
 
+async def _agenerate_semantic_queries_with_gpt(collected_data, llm):
+    """GPT로 semantic_query 생성 (비동기) - 카테고리별 요청을 동시 실행
+
+    프롬프트가 카테고리와 채팅 내용에만 의존하므로 같은 카테고리는 한 번만 생성한다.
+
+    Returns:
+        locations 순서에 맞춘 검색 문구 리스트 (실패 시 기본 문구)
+    """
+    locations = collected_data['raw_locations']
+    chat_content = '\n'.join(collected_data['user_chat'])
+    categories = [loc.get('venue_category', loc.get('category', '카페')) for loc in locations]
+    semaphore = asyncio.Semaphore(SEMANTIC_QUERY_CONCURRENCY)
+    
+    async def generate(category):
+        try:
+            async with semaphore:
+                result = await llm.ainvoke([HumanMessage(content=_build_semantic_query_prompt(chat_content, category))])
+            print(f"[DEBUG] semantic_query 생성 완료: {category}")
+            return result.content.strip()
+        except Exception as e:
+            print(f"[ERROR] semantic_query 생성 실패: {str(e)}")
+            # 실패시 기본 문구 사용
+            return f"{category}에서 편안하고 좋은 시간을 보낼 수 있는 곳"
+    
+    unique_categories = list(dict.fromkeys(categories))
+    results = await asyncio.gather(*(generate(category) for category in unique_categories))
+    query_by_category = dict(zip(unique_categories, results))
+    return [query_by_category[category] for category in categories]
+
 def _get_json_template():
     """JSON 템플릿 반환"""
     return {
@@ -455,13 +518,19 @@ def _get_json_template():
         }
     }
 
-def _fill_json_with_gpt(collected_data, json_template, llm):
-    """GPT로 JSON 채우기"""
-    
-    # semantic_query는 새롭게 생성
-    semantic_queries = _generate_semantic_queries_with_gpt(collected_data, llm)
+def _build_fill_prompt(collected_data, json_template, semantic_queries=None):
+    """JSON 채우기 프롬프트 (semantic_queries가 없으면 semantic_query는 빈 문자열로 요청)"""
+    if semantic_queries is None:
+        query_section = ""
+        query_instruction = "2. semantic_query는 별도로 생성되므로 빈 문자열(\"\")로 두세요"
+    else:
+        query_section = f"""
+**새로 생성된 semantic_query들:**
+{chr(10).join(semantic_queries)}
+"""
+        query_instruction = "2. semantic_query는 위에 새로 생성된 문구들을 그대로 사용하세요"
     
-    prompt = f"""다음 수집된 정보를 바탕으로 JSON 템플릿의 모든 '채워주세요' 부분을 실제 데이터로 채워주세요.
+    return f"""다음 수집된 정보를 바탕으로 JSON 템플릿의 모든 '채워주세요' 부분을 실제 데이터로 채워주세요.
 
 **Place Agent 응답:**
 {chr(10).join(collected_data['place_agent_response'])}
@@ -471,32 +540,38 @@ def _fill_json_with_gpt(collected_data, json_template, llm):
 
 **사용자 채팅:**
 {chr(10).join(collected_data['user_chat'])}
-
-**새로 생성된 semantic_query들:**
-{chr(10).join(semantic_queries)}
-
+{query_section}
 **채워야 할 JSON 템플릿:**
 {json.dumps(json_template, ensure_ascii=False, indent=2)}
 
 **지시사항:**
 1. 모든 '채워주세요' 부분을 위의 수집된 정보로 정확히 채워주세요
-2. semantic_query는 위에 새로 생성된 문구들을 그대로 사용하세요
+{query_instruction}
 3. search_targets 배열은 장소 개수만큼 생성하세요
 4. 숫자값은 따옴표 없이, 문자값은 따옴표와 함께 반환하세요 (단, budget_range는 반드시 문자열로 처리)
 5. timestamp는 현재 시간으로 ISO 형식으로 생성하세요
 6. course_planning 부분은 그대로 유지하세요
 
 **완성된 JSON만 반환해주세요:**"""
+
+def _parse_filled_json(text):
+    """GPT 응답 텍스트에서 JSON 파싱"""
+    json_str = text.strip()
+    if json_str.startswith('```json'):
+        json_str = json_str.replace('```json', '').replace('```', '').strip()
+    return json.loads(json_str)
+
+def _fill_json_with_gpt(collected_data, json_template, llm):
+    """GPT로 JSON 채우기"""
+    
+    # semantic_query는 새롭게 생성
+    semantic_queries = _generate_semantic_queries_with_gpt(collected_data, llm)
+    
+    prompt = _build_fill_prompt(collected_data, json_template, semantic_queries)
     
     try:
         result = llm.invoke([HumanMessage(content=prompt)])
-        json_str = result.content.strip()
-        
-        # JSON 파싱 시도
-        if json_str.startswith('```json'):
-            json_str = json_str.replace('```json', '').replace('```', '').strip()
-        
-        filled_json = json.loads(json_str)
+        filled_json = _parse_filled_json(result.content)
         print(f"[DEBUG] GPT로 JSON 채우기 성공")
         return filled_json
         
@@ -505,6 +580,32 @@ def _fill_json_with_gpt(collected_data, json_template, llm):
         # 실패시 fallback으로 기본 구조 반환
         return _create_fallback_json(collected_data)
 
+async def _afill_json_with_gpt(collected_data, json_template, llm):
+    """GPT로 JSON 채우기 (비동기) - semantic_query 제외, 이후 _apply_semantic_queries로 결합"""
+    prompt = _build_fill_prompt(collected_data, json_template)
+    
+    try:
+        result = await llm.ainvoke([HumanMessage(content=prompt)])
+        filled_json = _parse_filled_json(result.content)
+        print("[DEBUG] GPT로 JSON 채우기 성공 (semantic_query 제외)")
+        return filled_json
+        
+    except Exception as e:
+        print(f"[ERROR] GPT JSON 채우기 실패: {str(e)}")
+        return _create_fallback_json(collected_data)
+
+def _apply_semantic_queries(filled_json, collected_data, query_texts):
+    """search_targets에 장소 순서대로 semantic_query 결합"""
+    search_targets = filled_json.get("search_targets") or []
+    if len(search_targets) != len(query_texts):
+        print(f"[WARNING] search_targets({len(search_targets)})와 장소 수({len(query_texts)}) 불일치 - 기본 구조로 재구성")
+        search_targets = _create_fallback_json(collected_data)["search_targets"]
+        filled_json["search_targets"] = search_targets
+    
+    for target, query in zip(search_targets, query_texts):
+        target["semantic_query"] = query
+    return filled_json
+
 def _create_fallback_json(collected_data):
     """GPT 실패시 fallback JSON 생성"""
     locations = collected_data['raw_locations']
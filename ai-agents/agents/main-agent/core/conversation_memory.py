@@ -0,0 +1,98 @@
+"""
+토큰 예산 기반 대화 메모리
+- 최근 대화는 토큰 예산 안에서만 원문 유지
+- 예산을 넘긴 오래된 대화는 요약 대기열로 옮기고, 응답 경로 밖(백그라운드)에서 누적 요약에 합침
+- 프롬프트에 들어가는 buffer 크기가 대화 길이와 무관하게 일정
+"""
+
+import os
+from typing import Any, Awaitable, Callable, Dict, List
+
+from pydantic import BaseModel, PrivateAttr
+
+MEMORY_MAX_TOKENS = int(os.getenv("MEMORY_MAX_TOKENS", 800))
+SUMMARY_MAX_CHARS = int(os.getenv("MEMORY_SUMMARY_MAX_CHARS", 400))
+
+ROLE_LABELS = {"human": "Human", "ai": "AI"}
+
+Summarizer = Callable[[str, List[Dict[str, str]]], Awaitable[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한글 등 비ASCII 1자 ≈ 1토큰, ASCII 4자 ≈ 1토큰)"""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def format_messages(messages: List[Dict[str, str]]) -> str:
+    return "\n".join(f"{ROLE_LABELS.get(m['role'], m['role'])}: {m['content']}" for m in messages)
+
+
+def recent_within_budget(texts: List[str], max_tokens: int = MEMORY_MAX_TOKENS) -> List[str]:
+    """가장 최근 것부터 토큰 예산 안에 들어가는 텍스트만 (원래 순서로) 반환"""
+    selected = []
+    used = 0
+    for text in reversed(texts):
+        cost = estimate_tokens(text)
+        if selected and used + cost > max_tokens:
+            break
+        selected.append(text)
+        used += cost
+    return list(reversed(selected))
+
+
+def extractive_summary(previous_summary: str, messages: List[Dict[str, str]],
+                       max_chars: int = SUMMARY_MAX_CHARS) -> str:
+    """LLM 없이 만드는 요약 (최근 내용을 우선해 길이 제한)"""
+    combined = " / ".join(filter(None, [previous_summary] + [m["content"] for m in messages if m["role"] == "human"]))
+    return combined[-max_chars:]
+
+
+class ConversationMemory(BaseModel):
+    """ConversationBufferMemory 대체: 최근 대화 창 + 누적 요약"""
+
+    summary: str = ""
+    recent: List[Dict[str, str]] = []
+    pending: List[Dict[str, str]] = []
+    max_tokens: int = MEMORY_MAX_TOKENS
+
+    _summarizing: bool = PrivateAttr(default=False)
+
+    def save_context(self, inputs: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        """LangChain 메모리와 같은 방식으로 한 턴 저장"""
+        self.recent.append({"role": "human", "content": str(next(iter(inputs.values()), ""))})
+        self.recent.append({"role": "ai", "content": str(next(iter(outputs.values()), ""))})
+        self._trim()
+
+    def _trim(self) -> None:
+        while len(self.recent) > 2 and sum(estimate_tokens(m["content"]) for m in self.recent) > self.max_tokens:
+            self.pending.append(self.recent.pop(0))
+
+    @property
+    def buffer(self) -> str:
+        """프롬프트용 대화 문맥 (누적 요약 + 최근 대화)"""
+        recent = format_messages(self.recent)
+        if self.summary:
+            return f"이전 대화 요약: {self.summary}\n{recent}"
+        return recent
+
+    def needs_summary(self) -> bool:
+        return bool(self.pending) and not self._summarizing
+
+    async def summarize(self, summarizer: Summarizer) -> bool:
+        """요약 대기열을 누적 요약에 합침 (동시에 한 번만 실행)"""
+        if not self.needs_summary():
+            return False
+        self._summarizing = True
+        batch = list(self.pending)
+        try:
+            summary = await summarizer(self.summary, batch)
+        except Exception as e:
+            print(f"[WARNING] 대화 요약 실패, 추출 요약 사용: {e}")
+            summary = extractive_summary(self.summary, batch)
+        finally:
+            self._summarizing = False
+        self.summary = (summary or "").strip()[:SUMMARY_MAX_CHARS]
+        # 요약하는 동안 새로 밀려난 메시지는 다음 요약에서 처리
+        self.pending = self.pending[len(batch):]
+        return True
@@ -0,0 +1,358 @@
+"""
+필드별 규칙 기반(결정적) 파서
+- "ENFP", "20대", "대중교통", "3시간"처럼 정형화된 답변은 LLM 없이 정규식/사전으로 처리
+- 각 파서는 (값, 신뢰도) 또는 None(판단 불가)을 반환
+- 신뢰도가 RULE_CONFIDENCE_THRESHOLD 미만이거나 None이면 호출 측에서 LLM으로 넘김
+"""
+
+import os
+import re
+from collections import defaultdict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+RULE_CONFIDENCE_THRESHOLD = float(os.getenv("FIELD_RULE_CONFIDENCE_THRESHOLD", 0.85))
+
+ParseResult = Optional[Tuple[Any, float]]
+
+# 고유어/한자어 수사
+NATIVE_UNITS = {
+    "한": 1, "하나": 1, "두": 2, "둘": 2, "세": 3, "셋": 3, "석": 3, "네": 4, "넷": 4, "넉": 4,
+    "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10,
+}
+NATIVE_TENS = {"열": 10, "스물": 20, "스무": 20, "서른": 30, "마흔": 40, "쉰": 50, "예순": 60, "일흔": 70, "여든": 80, "아흔": 90}
+SINO_DIGITS = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9}
+
+_NATIVE_UNIT_PATTERN = "|".join(sorted(NATIVE_UNITS, key=len, reverse=True))
+_NATIVE_TENS_PATTERN = "|".join(sorted(NATIVE_TENS, key=len, reverse=True))
+# 한글 수사 앞에 다른 한글이 붙어 있으면(예: "두세", "여섯") 잘못 잘라 읽지 않도록 제외
+_KOREAN_NUMBER = rf"(?<![가-힣])(?:(?:{_NATIVE_TENS_PATTERN})(?:{_NATIVE_UNIT_PATTERN})?|{_NATIVE_UNIT_PATTERN}|[일이삼사오육칠팔구]?십[일이삼사오육칠팔구]?|[일이삼사오육칠팔구])"
+_NUMBER = rf"(\d+|{_KOREAN_NUMBER})"
+
+PUNCTUATION = re.compile(r"[\s.,!?~^;:'\"()\[\]]+")
+# 범위 구분자(~, -)는 남기고 정리 (범위 판단용)
+PUNCTUATION_KEEP_RANGE = re.compile(r"[\s.,!?^;:'\"()\[\]]+")
+# 값의 범위: "2~3개", "3-5만원", "10에서 20만원", "2시간부터 3시간까지" (unit은 첫 숫자 뒤 단위)
+RANGE_PATTERN = re.compile(rf"{_NUMBER}(?P<unit>[가-힣]{{0,2}}?)(?:~|-|–|〜|에서|부터){_NUMBER}")
+# 범위로 답하면 값 하나로 고를 수 없는 필드 (LLM에 맡김)
+RANGE_FIELDS = {"age", "budget", "duration", "place_count"}
+
+
+def _compact(text: str) -> str:
+    """공백/문장부호 제거 후 소문자화"""
+    return PUNCTUATION.sub("", str(text)).lower()
+
+
+def _compact_keep_range(text: str) -> str:
+    return PUNCTUATION_KEEP_RANGE.sub("", str(text)).lower()
+
+
+def is_value_range(text: str) -> bool:
+    """값의 범위를 말한 답인지 ("5시부터 10시"처럼 시각 범위는 데이트 시간 계산에 쓰므로 제외)"""
+    return any(match.group("unit") != "시" for match in RANGE_PATTERN.finditer(_compact_keep_range(text)))
+
+
+def korean_to_int(token: str) -> Optional[int]:
+    """숫자/한글 수사 문자열을 정수로 변환 ("3", "세", "스물다섯", "이십오", "십")"""
+    token = token.strip()
+    if token.isdigit():
+        return int(token)
+    if token in NATIVE_UNITS:
+        return NATIVE_UNITS[token]
+    for tens_word in sorted(NATIVE_TENS, key=len, reverse=True):
+        if token.startswith(tens_word):
+            rest = token[len(tens_word):]
+            if not rest:
+                return NATIVE_TENS[tens_word]
+            if rest in NATIVE_UNITS:
+                return NATIVE_TENS[tens_word] + NATIVE_UNITS[rest]
+            return None
+    match = re.fullmatch(r"([일이삼사오육칠팔구]?)(십)?([일이삼사오육칠팔구]?)", token)
+    if match and any(match.groups()):
+        tens, ten, ones = match.groups()
+        if not ten:
+            return SINO_DIGITS.get(ones) if ones and not tens else None
+        return SINO_DIGITS.get(tens, 1) * 10 + SINO_DIGITS.get(ones, 0)
+    return None
+
+
+def _lexicon_match(text: str, lexicon: Dict[str, str], exact: Dict[str, str] = None,
+                   partial_confidence: float = 0.9) -> ParseResult:
+    """사전 매칭: 한 가지 값만 가리키면 채택, 여러 값이 섞여 있으면 판단 불가"""
+    compact = _compact(text)
+    if exact and compact in exact:
+        return exact[compact], 0.95
+    if compact in lexicon:
+        return lexicon[compact], 0.95
+    found = {value for keyword, value in lexicon.items() if keyword in compact}
+    if len(found) == 1:
+        return found.pop(), partial_confidence
+    return None
+
+
+# ---------------------------------------------------------------------------
+# 필드별 파서
+# ---------------------------------------------------------------------------
+
+MBTI_NICKNAMES = {
+    "엔프피": "ENFP", "엔프제": "ENFJ", "엔티피": "ENTP", "엔티제": "ENTJ",
+    "인프피": "INFP", "인프제": "INFJ", "인티피": "INTP", "인티제": "INTJ",
+    "엣프피": "ESFP", "엣프제": "ESFJ", "엣티피": "ESTP", "엣티제": "ESTJ",
+    "잇프피": "ISFP", "잇프제": "ISFJ", "잇티피": "ISTP", "잇티제": "ISTJ",
+    "에스프피": "ESFP", "에스프제": "ESFJ", "에스티피": "ESTP", "에스티제": "ESTJ",
+    "이스프피": "ISFP", "이스프제": "ISFJ", "이스티피": "ISTP", "이스티제": "ISTJ",
+}
+MBTI_PATTERN = re.compile(r"(?<![a-z])([ei][ns][ft][jp])(?![a-z])", re.IGNORECASE)
+
+
+def parse_mbti(text: str) -> ParseResult:
+    matches = {m.upper() for m in MBTI_PATTERN.findall(text)}
+    matches |= {code for nickname, code in MBTI_NICKNAMES.items() if nickname in _compact(text)}
+    if len(matches) == 1:
+        return matches.pop(), 0.95
+    return None
+
+
+AGE_DECADE_OFFSETS = {"초반": 2, "중반": 5, "후반": 8}
+
+
+def parse_age(text: str) -> ParseResult:
+    compact = _compact(text)
+    decade = re.search(r"(\d)0대(초반|중반|후반)?", compact)
+    if decade:
+        base = int(decade.group(1)) * 10
+        qualifier = decade.group(2)
+        # "20대"만 말한 경우는 중반으로 간주 (추정값이므로 신뢰도 낮춤)
+        return base + AGE_DECADE_OFFSETS.get(qualifier, 5), 0.95 if qualifier else 0.85
+    match = re.fullmatch(rf"(?:만)?{_NUMBER}(?:살|세)?(?:이에요|예요|입니다|요)?", compact)
+    if match:
+        age = korean_to_int(match.group(1))
+        if age is not None:
+            return age, 0.95
+    match = re.search(rf"{_NUMBER}(?:살|세)", compact)
+    if match:
+        age = korean_to_int(match.group(1))
+        if age is not None:
+            return age, 0.9
+    return None
+
+
+# 연인을 가리키는 표현 ("남자친구"는 "남자"와 "친구"를 모두 포함)
+PARTNER_KEYWORDS = ("남자친구", "여자친구", "남친", "여친")
+
+GENDER_LEXICON = {"남자": "남", "남성": "남", "male": "남", "man": "남", "여자": "여", "여성": "여", "female": "여", "woman": "여"}
+GENDER_EXACT = {"남": "남", "여": "여", "m": "남", "f": "여"}
+
+
+def parse_gender(text: str) -> ParseResult:
+    # "남자친구랑 가요"는 상대를 말한 것이므로 성별로 보지 않음
+    if any(keyword in _compact(text) for keyword in PARTNER_KEYWORDS):
+        return None
+    # 문장 속 일부 일치("남자인데요", "human")는 규칙만으로 확정하지 않고 LLM 확인
+    return _lexicon_match(text, GENDER_LEXICON, GENDER_EXACT, partial_confidence=0.8)
+
+
+TRANSPORTATION_LEXICON = {
+    "지하철": "지하철", "전철": "지하철", "대중교통": "지하철", "버스": "버스",
+    "자가용": "자가용", "자동차": "자가용", "운전": "자가용", "렌트": "자가용", "택시": "택시",
+    "도보": "도보", "걸어서": "도보", "걷기": "도보", "뚜벅": "도보", "자전거": "자전거", "따릉이": "자전거",
+}
+TRANSPORTATION_EXACT = {"차": "자가용", "car": "자가용", "subway": "지하철", "bus": "버스", "taxi": "택시", "walk": "도보"}
+
+
+def parse_transportation(text: str) -> ParseResult:
+    return _lexicon_match(text, TRANSPORTATION_LEXICON, TRANSPORTATION_EXACT)
+
+
+RELATIONSHIP_LEXICON = {
+    "연인": "연인", "남친": "연인", "여친": "연인", "남자친구": "연인", "여자친구": "연인",
+    "애인": "연인", "커플": "연인", "사귀": "연인", "부부": "연인", "썸": "썸",
+    "소개팅": "소개팅", "소개": "소개팅", "첫만남": "소개팅", "친구": "친구",
+}
+
+
+def parse_relationship_stage(text: str) -> ParseResult:
+    compact = _compact(text)
+    # "남자친구/여자친구"는 "친구"도 포함하므로 연인 표현을 먼저 확인
+    for keyword in PARTNER_KEYWORDS:
+        if keyword in compact:
+            return "연인", 0.9
+    return _lexicon_match(text, RELATIONSHIP_LEXICON)
+
+
+TIME_SLOT_LEXICON = {
+    "오전": "오전", "아침": "오전", "모닝": "오전", "브런치": "오전",
+    "오후": "오후", "점심": "오후", "낮": "오후", "저녁": "저녁", "퇴근": "저녁",
+    "밤": "밤", "새벽": "밤", "야간": "밤",
+}
+
+
+def parse_time_slot(text: str) -> ParseResult:
+    return _lexicon_match(text, TIME_SLOT_LEXICON)
+
+
+CAR_OWNED_EXACT = {
+    "예": True, "네": True, "응": True, "y": True, "yes": True, "true": True, "소유": True,
+    "있어요": True, "있어": True, "있음": True, "있습니다": True,
+    "아니오": False, "아니요": False, "아니": False, "n": False, "no": False, "false": False,
+    "없어요": False, "없어": False, "없음": False, "없습니다": False,
+}
+# "네", "없어"처럼 짧은 답은 다른 문장에도 흔하므로 차량 언급이 있을 때만 부분 매칭
+CAR_OWNED_PATTERN = re.compile(r"(?:차|자차|자가용|자동차)(?:가|는|를|도)?(있|없|소유|안)")
+
+
+def parse_car_owned(text: str) -> ParseResult:
+    compact = _compact(text)
+    if compact in CAR_OWNED_EXACT:
+        return CAR_OWNED_EXACT[compact], 0.95
+    match = CAR_OWNED_PATTERN.search(compact)
+    if match:
+        return match.group(1) in ("있", "소유"), 0.9
+    return None
+
+
+def parse_budget(text: str) -> ParseResult:
+    compact = _compact(text).replace("원", "")
+    qualifier = next((q for q in ("이하", "이상", "이내", "정도") if q in compact), "")
+    match = re.search(rf"{_NUMBER}만", compact)
+    if match:
+        amount = korean_to_int(match.group(1))
+    else:
+        won = re.fullmatch(r"(\d{4,})(?:이하|이상|이내|정도)?", compact.replace(",", ""))
+        if not won or int(won.group(1)) % 10000:
+            return None
+        amount = int(won.group(1)) // 10000
+    if not amount:
+        return None
+    suffix = f" {qualifier}" if qualifier in ("이하", "이상", "이내") else ""
+    return f"{amount}만원{suffix}", 0.95
+
+
+DURATION_KEYWORDS = {"반나절": "반나절", "하루종일": "하루종일", "종일": "하루종일", "하루": "하루종일", "온종일": "하루종일"}
+
+
+def parse_hours(text: str) -> Optional[Tuple[int, float]]:
+    """시간 표현에서 총 시간(정수) 추출 ("3시간", "세 시간", "4", "5시부터 10시까지")"""
+    compact = _compact(text)
+    if compact.isdigit():
+        return int(compact), 0.9
+    # "2시간 반", "1시간 30분"처럼 정수로 떨어지지 않는 표현은 LLM에 맡김
+    if re.search(r"시간반|\d+분", compact):
+        return None
+    hours = {korean_to_int(m) for m in re.findall(rf"{_NUMBER}시간", compact)}
+    hours.discard(None)
+    if len(hours) == 1:
+        return hours.pop(), 0.95
+    if hours:
+        return None
+    span = re.search(r"(\d{1,2})시(?:부터|에서|~|-).*?(\d{1,2})시", _compact_keep_range(text))
+    if span:
+        start, end = int(span.group(1)), int(span.group(2))
+        # 오후/밤 표기가 섞여도 12시간제 기준 차이로 계산
+        diff = (end - start) % 12
+        if diff:
+            return diff, 0.9
+    return None
+
+
+def parse_duration(text: str) -> ParseResult:
+    """데이트 시간 → "X시간" / "반나절" / "하루종일" (GPTFieldProcessor duration 스펙)"""
+    compact = _compact(text)
+    hours = parse_hours(text)
+    if hours:
+        return f"{hours[0]}시간", hours[1]
+    for keyword, value in DURATION_KEYWORDS.items():
+        if keyword in compact:
+            return value, 0.9
+    return None
+
+
+def parse_duration_bucket(text: str) -> ParseResult:
+    """데이트 시간 → 추천 구간 (1-4시간 → "X시간", 5-6시간 → "반나절", 7시간 이상 → "하루종일")"""
+    hours = parse_hours(text)
+    if hours and hours[0] > 0:
+        total = hours[0]
+        if total <= 4:
+            return f"{total}시간", hours[1]
+        return ("반나절" if total <= 6 else "하루종일"), hours[1]
+    parsed = parse_duration(text)
+    if parsed and parsed[0] in ("반나절", "하루종일"):
+        return parsed
+    return None
+
+
+def parse_place_count(text: str) -> ParseResult:
+    compact = _compact(text)
+    if compact.isdigit():
+        return int(compact), 0.95
+    counts = {korean_to_int(m) for m in re.findall(rf"{_NUMBER}(?:개|곳|군데|코스)", compact)}
+    counts.discard(None)
+    if len(counts) == 1:
+        return counts.pop(), 0.95
+    return None
+
+
+FIELD_PARSERS: Dict[str, Callable[[str], ParseResult]] = {
+    "age": parse_age,
+    "gender": parse_gender,
+    "mbti": parse_mbti,
+    "duration": parse_duration,
+    "place_count": parse_place_count,
+    "relationship_stage": parse_relationship_stage,
+    "budget": parse_budget,
+    "time_slot": parse_time_slot,
+    "car_owned": parse_car_owned,
+    "transportation": parse_transportation,
+}
+
+
+def parse_field(field_name: str, user_input: str) -> ParseResult:
+    """필드 규칙 파서 실행 (파서가 없거나 판단 불가면 None)"""
+    parser = FIELD_PARSERS.get(field_name)
+    if parser is None or not user_input or not str(user_input).strip():
+        return None
+    if field_name in RANGE_FIELDS and is_value_range(str(user_input)):
+        return None
+    try:
+        return parser(str(user_input))
+    except Exception as e:
+        print(f"[WARNING] 규칙 파싱 실패 - {field_name}: {e}")
+        return None
+
+
+# ---------------------------------------------------------------------------
+# 파싱 지표
+# ---------------------------------------------------------------------------
+
+class FieldParseStats:
+    """필드별 규칙/LLM 처리 건수와 규칙 신뢰도 집계"""
+
+    def __init__(self):
+        self._counts = defaultdict(lambda: {"rule": 0, "llm": 0, "rule_confidence_sum": 0.0})
+
+    def record(self, field_name: str, source: str, confidence: float = 0.0):
+        entry = self._counts[field_name]
+        entry[source] += 1
+        if source == "rule":
+            entry["rule_confidence_sum"] += confidence
+
+    def snapshot(self) -> Dict[str, Any]:
+        fields = {}
+        for field_name, entry in self._counts.items():
+            total = entry["rule"] + entry["llm"]
+            fields[field_name] = {
+                "rule": entry["rule"],
+                "llm": entry["llm"],
+                "rule_rate": round(entry["rule"] / total, 3) if total else 0.0,
+                "avg_rule_confidence": round(entry["rule_confidence_sum"] / entry["rule"], 3) if entry["rule"] else 0.0,
+            }
+        rule_total = sum(f["rule"] for f in fields.values())
+        llm_total = sum(f["llm"] for f in fields.values())
+        return {
+            "rule": rule_total,
+            "llm": llm_total,
+            "rule_rate": round(rule_total / (rule_total + llm_total), 3) if rule_total + llm_total else 0.0,
+            "fields": fields,
+        }
+
+
+field_parse_stats = FieldParseStats()
@@ -4,9 +4,13 @@ import json
 from typing import Dict, Any, Optional, Union
 import re
 
+from core.field_rules import RULE_CONFIDENCE_THRESHOLD, field_parse_stats, parse_field
+
 class GPTFieldProcessor:
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, result_cache=None):
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, openai_api_key=openai_api_key)
+        # (필드, 입력) → GPT 처리 결과 공유 캐시 (get/set 인터페이스, 없으면 캐시하지 않음)
+        self.result_cache = result_cache
         
         # 필드별 처리 규칙 정의
         self.field_specs = {
@@ -116,6 +120,24 @@ class GPTFieldProcessor:
 
         spec = self.field_specs[field_name]
         
+        # 규칙 기반 파서 우선 (정형화된 답변은 LLM 호출 없이 처리)
+        rule_result = self._process_with_rules(field_name, user_input, spec)
+        if rule_result is not None:
+            return rule_result
+        
+        if self.result_cache is not None:
+            cached = await self.result_cache.aget((field_name, user_input))
+            if cached is not None:
+                print(f"[GPT_PROCESSOR] 캐시 사용 - {field_name}: '{user_input}' → '{cached['value']}'")
+                return {
+                    "success": True,
+                    "value": cached["value"],
+                    "original": user_input,
+                    "confidence": cached["confidence"],
+                    "error_message": None
+                }
+        
+        field_parse_stats.record(field_name, "llm")
         prompt = self._build_processing_prompt(field_name, user_input, spec)
         
         try:
@@ -148,6 +170,8 @@ class GPTFieldProcessor:
                     processed_value = self._validate_and_convert(response_data.get("value"), spec)
                     
                     print(f"[GPT_PROCESSOR] 처리 성공 - {field_name}: '{user_input}' → '{processed_value}' (신뢰도: {confidence})")
+                    if self.result_cache is not None:
+                        await self.result_cache.aset((field_name, user_input), {"value": processed_value, "confidence": confidence})
                     
                     return {
                         "success": True,
@@ -178,6 +202,34 @@ class GPTFieldProcessor:
                 "error_message": f"필드 처리 실패: {str(e)}"
             }
 
+    def _process_with_rules(self, field_name: str, user_input: str, spec: Dict) -> Optional[Dict[str, Any]]:
+        """규칙 파서 결과가 충분히 확실하면 처리 결과 반환, 아니면 None (LLM으로 위임)"""
+        parsed = parse_field(field_name, user_input)
+        if parsed is None or parsed[1] < RULE_CONFIDENCE_THRESHOLD:
+            return None
+        
+        value, confidence = parsed
+        try:
+            processed_value = self._validate_and_convert(value, spec)
+        except ValueError as e:
+            # 규칙 파서가 잘못 읽었을 수도 있으므로 실패 처리하지 않고 LLM으로 위임
+            print(f"[RULE_PROCESSOR] 검증 실패, LLM으로 위임 - {field_name}: '{user_input}' → '{value}' ({e})")
+            return None
+        
+        field_parse_stats.record(field_name, "rule", confidence)
+        print(f"[RULE_PROCESSOR] 처리 성공 - {field_name}: '{user_input}' → '{processed_value}' (신뢰도: {confidence})")
+        return {
+            "success": True,
+            "value": processed_value,
+            "original": user_input,
+            "confidence": confidence,
+            "error_message": None
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """필드별 규칙/LLM 처리 지표"""
+        return field_parse_stats.snapshot()
+
     def _build_processing_prompt(self, field_name: str, user_input: str, spec: Dict) -> str:
         """필드별 GPT 프롬프트 생성"""
         
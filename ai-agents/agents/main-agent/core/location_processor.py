@@ -19,9 +19,9 @@ def clean_area(area):
             result.append(a)
     return result
 
-def extract_location_request_from_llm(llm, user_message, address_hint=None):
-    """사용자 입력에서 데이트 장소 위치 정보를 구조화"""
-    prompt = (
+def _build_location_prompt(user_message, address_hint=None):
+    """위치 정보 구조화 프롬프트"""
+    return (
         "아래 사용자의 입력에서 데이트 장소 위치 정보를 구조화해줘.\n"
         "- reference_areas에는 반드시 장소명(예: '강남', '홍대입구역')만 넣고, '근처', '부근', '인근', '사이', '중간' 등 위치 특성 단어는 절대 포함하지 마세요.\n"
         "- 위치 특성 단어(근처, 부근, 인근, 사이, 중간 등)는 반드시 proximity_type/proximity_preference에만 넣으세요.\n"
@@ -38,9 +38,21 @@ def extract_location_request_from_llm(llm, user_message, address_hint=None):
         + (f"address 힌트: {address_hint}\n" if address_hint else "") +
         "반드시 JSON만 출력해줘."
     )
-    result = llm.invoke([HumanMessage(content=prompt)])
+
+def extract_location_request_from_llm(llm, user_message, address_hint=None):
+    """사용자 입력에서 데이트 장소 위치 정보를 구조화"""
+    result = llm.invoke([HumanMessage(content=_build_location_prompt(user_message, address_hint))])
+    return _parse_location_request(result.content, user_message)
+
+async def aextract_location_request_from_llm(llm, user_message, address_hint=None):
+    """extract_location_request_from_llm의 비동기 버전 (이벤트 루프 블로킹 없음)"""
+    result = await llm.ainvoke([HumanMessage(content=_build_location_prompt(user_message, address_hint))])
+    return _parse_location_request(result.content, user_message)
+
+def _parse_location_request(content, user_message):
+    """LLM 응답 파싱 + 위치 정보 후처리"""
     try:
-        location_request = json.loads(result.content)
+        location_request = json.loads(content)
     except Exception:
         location_request = {}
     
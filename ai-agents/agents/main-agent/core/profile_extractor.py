@@ -30,9 +30,9 @@ def rule_based_gender_relationship(user_message, extracted):
             extracted["relationship_stage"] = "친구"
     return extracted
 
-def extract_profile_from_llm(llm, user_message):
-    """LLM을 사용하여 사용자 메시지에서 프로필 정보 추출"""
-    prompt = (
+def _build_profile_prompt(user_message):
+    """프로필 추출 프롬프트"""
+    return (
         "아래 사용자의 답변에서 나이, 성별, MBTI, 데이트 장소, 상대방과의 관계, 장소 분위기, 예산, 데이트 시간대, 데이트 시간(몇시간), 방문 장소 개수를 추출해서 "
         "각 항목별로 key:value 형태로 JSON으로 출력해줘. "
         "\n**중요한 변환 규칙:**\n"
@@ -52,16 +52,28 @@ def extract_profile_from_llm(llm, user_message):
         f"답변: {user_message}\n"
         "반드시 JSON만 출력해줘."
     )
-    result = llm.invoke([HumanMessage(content=prompt)])
+
+def _parse_profile(content, user_message):
+    """LLM 응답 파싱 + 규칙 기반 보정"""
     try:
-        profile = json.loads(result.content)
+        profile = json.loads(content)
     except Exception:
         profile = {k: "" for k in REQUIRED_KEYS}
     
     profile = rule_based_gender_relationship(user_message, profile)
     return profile
 
-def llm_correct_field(llm, key, value):
+def extract_profile_from_llm(llm, user_message):
+    """LLM을 사용하여 사용자 메시지에서 프로필 정보 추출"""
+    result = llm.invoke([HumanMessage(content=_build_profile_prompt(user_message))])
+    return _parse_profile(result.content, user_message)
+
+async def aextract_profile_from_llm(llm, user_message):
+    """extract_profile_from_llm의 비동기 버전 (이벤트 루프 블로킹 없음)"""
+    result = await llm.ainvoke([HumanMessage(content=_build_profile_prompt(user_message))])
+    return _parse_profile(result.content, user_message)
+
+def _build_correction_prompt(key, value):
     """각 항목별 교정 프롬프트"""
     field_desc = {
         "age": "나이(숫자, 10~100세 사이)",
@@ -76,7 +88,7 @@ def llm_correct_field(llm, key, value):
         "place_count": "방문 장소 개수(예: 2개, 3개, 4개 등)"
     }[key]
     
-    prompt = (
+    return (
         f"입력값: '{value}'\n"
         f"이 값이 {field_desc}에 적합한지 확인하고, 오타나 비정상 입력이면 올바른 값으로 교정해줘. "
         f"교정이 불가능하면 빈 문자열만 출력해.\n"
@@ -99,5 +111,8 @@ def llm_correct_field(llm, key, value):
         f"입력값: '{value}'\n"
         f"교정값만 출력해줘."
     )
-    result = llm.invoke([HumanMessage(content=prompt)])
-    return result.content.strip().replace('"', '').replace("'", "")
\ No newline at end of file
+
+def llm_correct_field(llm, key, value):
+    """LLM으로 항목 값 교정"""
+    result = llm.invoke([HumanMessage(content=_build_correction_prompt(key, value))])
+    return result.content.strip().replace('"', '').replace("'", "")
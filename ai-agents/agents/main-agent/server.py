@@ -4,10 +4,11 @@ Main Agent FastAPI Server
 """
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Header
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import os
-import requests
+import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel
 from typing import Dict, List, Optional
@@ -20,6 +21,13 @@ from main_agent import MainAgent
 from models.request_models import MainAgentRequest, NewSessionRequest, SendMessageRequest
 from models.response_models import MainAgentResponse, NewSessionResponse, SendMessageResponse, ResponseMessage, SessionInfo, CourseData
 from services.main_agent_service import MainAgentService
+from services.agent_client import agent_client
+from services.session_store import create_session_store, session_scoped
+from services.session_index import create_session_index
+from core.field_rules import field_parse_stats
+from services.llm_cache import llm_cache_stats
+from services.category_archetypes import category_archetypes
+from services.recommendation_jobs import FINISHED_STATUSES, QueueFullError, job_queue
 
 load_dotenv()
 
@@ -27,6 +35,18 @@ load_dotenv()
 PORT = int(os.getenv("MAIN_AGENT_PORT", 8001))
 PLACE_AGENT_URL = os.getenv("PLACE_AGENT_URL", "http://localhost:8002")
 RAG_AGENT_URL = os.getenv("RAG_AGENT_URL", "http://localhost:8003")
+# 에이전트 요청/응답 전체 JSON 출력 (디버깅할 때만 - 기본은 요약 한 줄)
+DEBUG_AGENT_PAYLOADS = os.getenv("DEBUG_AGENT_PAYLOADS", "false").lower() == "true"
+
+
+def log_payload(label: str, payload) -> None:
+    """추천 경로의 큰 페이로드 로그 (기본: 키/크기 요약, DEBUG_AGENT_PAYLOADS=true면 전체 JSON 한 줄)"""
+    if DEBUG_AGENT_PAYLOADS:
+        print(f"[DEBUG] {label}: {json.dumps(payload, ensure_ascii=False, default=str)}")
+    elif isinstance(payload, dict):
+        print(f"[DEBUG] {label}: keys={list(payload.keys())}")
+    else:
+        print(f"[DEBUG] {label}: {type(payload).__name__}")
 
 app = FastAPI(
     title="Main Agent API",
@@ -47,14 +67,39 @@ app.add_middleware(
 agent = MainAgent(os.getenv("OPENAI_API_KEY"))
 main_agent_service = MainAgentService(os.getenv("OPENAI_API_KEY"))
 
-# 임시 메모리 저장소
-SESSIONS = {}  # session_id -> session_info
-MESSAGES = {}  # session_id -> List[message]
-
-async def execute_recommendation_flow(main_resp, session_info=None):
-    """Place Agent → RAG Agent 추천 플로우 실행"""
+@app.on_event("startup")
+async def startup_event():
+    """오프라인 워밍한 카테고리 추천 유형 테이블 적재"""
+    category_archetypes.load_seed()
+    job_queue.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """추천 워커와 에이전트 간 공유 HTTP 클라이언트 정리"""
+    await job_queue.stop()
+    await agent_client.aclose()
+
+# 세션 저장소 (SESSION_STORE_URL로 memory/sqlite/redis 선택)
+SESSIONS = create_session_store("sessions")  # session_id -> session_info
+MESSAGES = create_session_store("messages")  # session_id -> List[message]
+SESSION_INDEX = create_session_index(sessions=SESSIONS)  # user_id -> 최근 활동 순 session_id
+
+async def commit_session(session_id: str):
+    """요청 처리 중 수정한 세션/메시지를 저장소와 사용자별 인덱스에 반영 (저장소 I/O는 스레드에서)"""
+    await SESSIONS.acommit(session_id)
+    await MESSAGES.acommit(session_id)
+    session = await SESSIONS.aget(session_id)
+    if session:
+        await SESSION_INDEX.aupsert_session(session)
+
+async def execute_recommendation_flow(main_resp, session_info=None, progress=None):
+    """Place Agent → RAG Agent 추천 플로우 실행 (progress: 단계별 진행 알림 콜백)"""
+    async def report(stage: str, message: str):
+        if progress is not None:
+            await progress(stage, message)
+    
     try:
-        from core.agent_builders import build_place_agent_json, build_rag_agent_json
+        from core.agent_builders import build_place_agent_json, build_rag_agent_json_async
         
         profile_dict = main_resp.profile.dict()
         location_dict = main_resp.location_request.dict()
@@ -81,26 +126,22 @@ async def execute_recommendation_flow(main_resp, session_info=None):
             session_info=session_info  # 🔥 CRITICAL: session_info 전달
         )
         
-        print(f"[DEBUG] ===== Place Agent Request =====")
-        print(json.dumps(place_request, ensure_ascii=False, indent=2))
-        print(f"[DEBUG] ==============================")
+        log_payload("Place Agent Request", place_request)
         
         print(f"[DEBUG] Place Agent API 호출: {PLACE_AGENT_URL}/place-agent")
-        place_response = requests.post(
-            f"{PLACE_AGENT_URL}/place-agent",
-            json=place_request,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
+        await report("place_agent", "주변 장소를 검색하고 있습니다")
+        try:
+            place_response = await agent_client.post("place", "/place-agent", place_request, timeout=30)
+        except httpx.HTTPError as e:
+            print(f"[ERROR] Place Agent 연결 실패: {type(e).__name__}: {e}")
+            return None
         
         if place_response.status_code != 200:
             print(f"[ERROR] Place Agent 호출 실패: HTTP {place_response.status_code}")
             return None
             
         place_result = place_response.json()
-        print(f"[DEBUG] ===== Place Agent Response =====")
-        print(json.dumps(place_result, ensure_ascii=False, indent=2))
-        print(f"[DEBUG] ===============================")
+        log_payload("Place Agent Response", place_result)
         print(f"[DEBUG] Place Agent 응답 성공")
         
         if not place_result.get("success"):
@@ -108,12 +149,13 @@ async def execute_recommendation_flow(main_resp, session_info=None):
             return None
         
         # Step 2: RAG Agent 호출 (이미 받은 결과 사용 또는 새로 생성)
+        await report("rag_request", f"장소 {len(place_result.get('locations', []))}곳을 찾았습니다. 코스 조건을 정리하고 있습니다")
         if hasattr(main_resp, 'rag_agent_request') and main_resp.rag_agent_request:
             print(f"[DEBUG] 이미 받은 RAG Agent 요청 사용 (중복 생성 방지)")
             rag_request = main_resp.rag_agent_request
         else:
             print(f"[DEBUG] RAG Agent 요청 생성")
-            rag_request = build_rag_agent_json(
+            rag_request = await build_rag_agent_json_async(
                 place_response=place_result,
                 profile=profile_dict,
                 location_request=location_dict,
@@ -121,21 +163,19 @@ async def execute_recommendation_flow(main_resp, session_info=None):
                 session_info=session_info  # 채팅 기반 RAG 문구 생성을 위한 세션 정보 전달
             )
         
-        print(f"[DEBUG] ===== RAG Agent Request =====")
         # API 키는 마스킹해서 출력
         rag_request_safe = dict(rag_request)
         if "openai_api_key" in rag_request_safe:
             rag_request_safe["openai_api_key"] = "sk-***" + rag_request_safe["openai_api_key"][-10:]
-        print(json.dumps(rag_request_safe, ensure_ascii=False, indent=2))
-        print(f"[DEBUG] ============================")
+        log_payload("RAG Agent Request", rag_request_safe)
         
         print(f"[DEBUG] RAG Agent API 호출: {RAG_AGENT_URL}/recommend-course")
-        rag_response = requests.post(
-            f"{RAG_AGENT_URL}/recommend-course",
-            json=rag_request,
-            headers={"Content-Type": "application/json"},
-            timeout=60
-        )
+        await report("rag_agent", "데이트 코스를 구성하고 있습니다")
+        try:
+            rag_response = await agent_client.post("rag", "/recommend-course", rag_request, timeout=60)
+        except httpx.HTTPError as e:
+            print(f"[ERROR] RAG Agent 연결 실패: {type(e).__name__}: {e}")
+            return None
         
         if rag_response.status_code != 200:
             print(f"[ERROR] RAG Agent 호출 실패: HTTP {rag_response.status_code}")
@@ -143,9 +183,7 @@ async def execute_recommendation_flow(main_resp, session_info=None):
             
         try:
             rag_result = rag_response.json()
-            print(f"[DEBUG] ===== RAG Agent Response (FULL) =====")
-            print(json.dumps(rag_result, ensure_ascii=False, indent=2))
-            print(f"[DEBUG] =====================================")
+            log_payload("RAG Agent Response", rag_result)
             
             if rag_result is None:
                 print("[ERROR] RAG Agent 응답이 None입니다")
@@ -169,8 +207,7 @@ async def execute_recommendation_flow(main_resp, session_info=None):
                     "message": rag_result.get("message", "")[:100] if rag_result.get("message") else "No message"
                 })
             
-            print(json.dumps(rag_summary, ensure_ascii=False, indent=2))
-            print(f"[DEBUG] ============================")
+            print(f"[DEBUG] RAG Agent 응답 요약: {json.dumps(rag_summary, ensure_ascii=False)}")
             print(f"[DEBUG] RAG Agent 응답 성공")
             
         except json.JSONDecodeError as e:
@@ -280,7 +317,10 @@ async def health_check():
         "status": "healthy", 
         "service": "main-agent",
         "port": PORT,
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "field_parsing": field_parse_stats.snapshot(),
+        "llm_cache": llm_cache_stats(),
+        "recommendation_jobs": job_queue.stats()
     }
 
 @app.get("/")
@@ -295,6 +335,7 @@ async def root():
 
 # 1. 새 채팅 세션 시작
 @app.post("/chat/new-session", response_model=NewSessionResponse)
+@session_scoped
 async def new_session(req: NewSessionRequest):
     session_id = f"sess_{uuid.uuid4().hex[:12]}"
     now = datetime.datetime.now().isoformat() + "Z"
@@ -335,6 +376,7 @@ async def new_session(req: NewSessionRequest):
     MESSAGES[session_id].append({"message_id": 2, "message_type": "ASSISTANT", "message_content": assistant_msg, "sent_at": now})
     SESSIONS[session_id]["message_count"] = 2
     SESSIONS[session_id]["preview_message"] = assistant_msg
+    await commit_session(session_id)
     response = ResponseMessage(
         message=assistant_msg,
         message_type="INFORMATION_GATHERING",
@@ -359,10 +401,12 @@ async def new_session(req: NewSessionRequest):
 
 # 2. 메시지 전송
 @app.post("/chat/send-message", response_model=SendMessageResponse)
+@session_scoped
 async def send_message(req: SendMessageRequest):
-    session = SESSIONS.get(req.session_id)
+    session = await SESSIONS.aget(req.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    await MESSAGES.aget(req.session_id)
     now = datetime.datetime.now().isoformat() + "Z"
     msg_id = len(MESSAGES[req.session_id]) + 1
     MESSAGES[req.session_id].append({"message_id": msg_id, "message_type": "USER", "message_content": req.message, "sent_at": now})
@@ -393,7 +437,7 @@ async def send_message(req: SendMessageRequest):
                 print(f"[DEBUG] MainAgentService에서 place_agent_request 반환됨 - 직접 실행 가능")
                 # session_info를 가져와서 추천 실행 (향후 확장 가능)
                 from services.main_agent_service import SESSION_INFO
-                current_session_info = SESSION_INFO.get(req.session_id, {})
+                current_session_info = await SESSION_INFO.aget(req.session_id, {})
                 print(f"[DEBUG] 직접 실행용 session_info 준비: {bool(current_session_info.get('location_clustering'))}")
             
             assistant_msg = "✨ **모든 정보가 수집되었습니다!** ✨\n\n이제 맞춤 데이트 코스를 생성할 준비가 완료되었어요.\n📍 추천을 시작하시려면 '추천 시작' 버튼을 눌러주세요!"
@@ -417,6 +461,7 @@ async def send_message(req: SendMessageRequest):
         session["has_course"] = True
         session["preview_message"] = assistant_msg
         session["session_status"] = "COMPLETED"
+    await commit_session(req.session_id)
     response = ResponseMessage(
         message=assistant_msg,
         message_type=message_type,
@@ -441,41 +486,57 @@ async def send_message(req: SendMessageRequest):
 
 # 3. 세션 목록 조회
 @app.get("/chat/sessions/user/{user_id}")
-def get_sessions(user_id: str, limit: int = Query(10), offset: int = Query(0), status: str = Query("all")):
-    sessions = [s for s in SESSIONS.values() if s["user_id"] == user_id]
-    # 상태 필터링
-    if status != "all":
-        sessions = [s for s in sessions if s["session_status"] == status]
-    total_count = len(sessions)
-    has_more = total_count > (offset + limit)
+async def get_sessions(user_id: str, limit: int = Query(10, ge=1, le=100), offset: int = Query(0, ge=0),
+                       status: str = Query("all"), cursor: Optional[str] = Query(None)):
+    """사용자 세션 목록 (최근 활동 순, 인덱스 기반 O(페이지 크기) 조회, 목록 조회는 세션 만료 시간을 갱신하지 않음)"""
+    sessions = []
+    SESSIONS.purge_expired()
+    try:
+        # 만료된 세션은 인덱스에서 정리하고 다음 항목으로 채움
+        while len(sessions) < limit:
+            session_ids, next_cursor = await SESSION_INDEX.apage(user_id, status, limit - len(sessions), cursor, offset)
+            for sid in session_ids:
+                session = await SESSIONS.apeek(sid)
+                if session is None:
+                    await SESSION_INDEX.aremove(user_id, sid)
+                    continue
+                sessions.append(session)
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return {
         "success": True,
-        "sessions": sessions[offset:offset+limit],
+        "sessions": sessions,
         "pagination": {
-            "total_count": total_count,
+            "total_count": await SESSION_INDEX.acount(user_id, status),
             "limit": limit,
             "offset": offset,
-            "has_more": has_more
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor
         }
     }
 
 # 4. 세션 상세 조회
 @app.get("/chat/sessions/{session_id}")
-def get_session(session_id: str):
-    session = SESSIONS.get(session_id)
+async def get_session(session_id: str):
+    session = await SESSIONS.aget(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
     return {
         "success": True,
         "session": session,
-        "messages": MESSAGES[session_id]
+        "messages": await MESSAGES.aget(session_id, [])
     }
 
 # 5. 세션 삭제
 @app.delete("/chat/sessions/{session_id}")
-def delete_session(session_id: str):
-    SESSIONS.pop(session_id, None)
-    MESSAGES.pop(session_id, None)
+async def delete_session(session_id: str):
+    session = await SESSIONS.apop(session_id, None)
+    await MESSAGES.apop(session_id, None)
+    if session:
+        await SESSION_INDEX.aremove(session["user_id"], session_id)
     return {
         "success": True,
         "message": "채팅 세션이 성공적으로 삭제되었습니다.",
@@ -485,40 +546,114 @@ def delete_session(session_id: str):
 
 # 6. 추천 시작
 @app.post("/chat/start-recommendation")
+@session_scoped
 async def start_recommendation(request: dict):
-    """세션별 추천 플로우 시작"""
+    """세션별 추천 플로우 시작 - 작업 ID를 즉시 반환하고 워커가 실행 (wait=true면 완료까지 대기)"""
+    session_id = request.get("session_id")
+    if not session_id:
+        return {
+            "success": False,
+            "message": "session_id가 필요합니다.",
+            "error_code": "MISSING_SESSION_ID"
+        }
+    
+    session = await SESSIONS.aget(session_id)
+    if not session:
+        return {
+            "success": False,
+            "message": "세션을 찾을 수 없습니다.",
+            "session_id": session_id,
+            "error_code": "SESSION_NOT_FOUND"
+        }
+    
+    print(f"[DEBUG] 추천 시작 요청 - session_id: {session_id}")
+    
+    from services.main_agent_service import SESSION_INFO
+    session_info = await SESSION_INFO.aget(session_id, {})
+    
+    if 'profile' not in session_info:
+        return {
+            "success": False,
+            "message": "프로필 정보가 없습니다. 먼저 채팅을 통해 정보를 입력해주세요.",
+            "session_id": session_id,
+            "error_code": "INCOMPLETE_PROFILE"
+        }
+    
     try:
-        session_id = request.get("session_id")
-        if not session_id:
-            return {
-                "success": False,
-                "message": "session_id가 필요합니다.",
-                "error_code": "MISSING_SESSION_ID"
-            }
-        
-        session = SESSIONS.get(session_id)
-        if not session:
-            return {
-                "success": False,
-                "message": "세션을 찾을 수 없습니다.",
-                "session_id": session_id,
-                "error_code": "SESSION_NOT_FOUND"
-            }
-        
-        # 세션에서 마지막 MainAgentService 응답을 시뮬레이션
-        # 실제로는 SESSION_INFO에서 프로필 정보를 가져와야 함
-        print(f"[DEBUG] 추천 시작 요청 - session_id: {session_id}")
-        
-        # 임시로 MainAgentService에서 프로필 정보 가져오기
+        job = await job_queue.submit(session_id)
+    except QueueFullError as e:
+        print(f"[WARNING] 추천 작업 대기열 가득 참: {e}")
+        return JSONResponse(status_code=503, content={
+            "success": False,
+            "message": "현재 추천 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+            "session_id": session_id,
+            "error_code": "QUEUE_FULL"
+        })
+    
+    if request.get("wait"):
+        # 기존 동기 방식 클라이언트 호환
+        job = await job_queue.wait(job["job_id"])
+        return job["result"]
+    
+    return JSONResponse(status_code=202, content=_job_summary(job))
+
+def _job_summary(job: dict) -> dict:
+    """작업 상태 응답 (완료 시 추천 결과 포함)"""
+    summary = {
+        "success": True,
+        "job_id": job["job_id"],
+        "session_id": job["session_id"],
+        "status": job["status"],
+        "stage": job["stage"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"],
+        "status_url": f"/chat/recommendation-jobs/{job['job_id']}",
+        "events_url": f"/chat/recommendation-jobs/{job['job_id']}/events"
+    }
+    if job["status"] in FINISHED_STATUSES:
+        summary["result"] = job["result"]
+    return summary
+
+@app.get("/chat/recommendation-jobs/{job_id}")
+def get_recommendation_job(job_id: str):
+    """추천 작업 상태 조회 (폴링)"""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    summary = _job_summary(job)
+    summary["events"] = job["events"]
+    return summary
+
+@app.get("/chat/recommendation-jobs/{job_id}/events")
+async def stream_recommendation_job(job_id: str, last_event_id: Optional[str] = Header(None)):
+    """추천 작업 단계별 진행 이벤트 (SSE, 작업 종료 시 result 이벤트 후 종료)"""
+    if not await job_queue.aget(job_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    after_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else 0
+    
+    async def event_stream():
+        async for event in job_queue.events(job_id, after_seq=after_seq):
+            yield f"id: {event['seq']}\nevent: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        job = await job_queue.aget(job_id)
+        if job:
+            yield f"event: result\ndata: {json.dumps(_job_summary(job), ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@session_scoped
+async def run_recommendation_job(session_id: str, progress) -> dict:
+    """추천 작업 실행 (워커에서 호출)"""
+    try:
+        session = await SESSIONS.aget(session_id)
         from services.main_agent_service import SESSION_INFO
-        session_info = SESSION_INFO.get(session_id, {})
-        
-        if 'profile' not in session_info:
+        session_info = await SESSION_INFO.aget(session_id, {})
+        if not session or 'profile' not in session_info:
             return {
                 "success": False,
-                "message": "프로필 정보가 없습니다. 먼저 채팅을 통해 정보를 입력해주세요.",
+                "message": "세션 또는 프로필 정보를 찾을 수 없습니다.",
                 "session_id": session_id,
-                "error_code": "INCOMPLETE_PROFILE"
+                "error_code": "SESSION_NOT_FOUND"
             }
         
         profile = session_info['profile']
@@ -543,7 +678,7 @@ async def start_recommendation(request: dict):
         mock_response = MockMainAgentResponse(profile, location_request)
         
         print(f"[DEBUG] 추천 플로우 실행 시작 (session_info 포함)")
-        course_data = await execute_recommendation_flow(mock_response, session_info)  # 🔥 CRITICAL: session_info 전달
+        course_data = await execute_recommendation_flow(mock_response, session_info, progress=progress)  # 🔥 CRITICAL: session_info 전달
         
         print(f"[DEBUG] 추천 플로우 실행 완료, course_data: {course_data is not None}")
         
@@ -552,6 +687,7 @@ async def start_recommendation(request: dict):
             session["has_course"] = True
             session["session_status"] = "COMPLETED"
             session["last_activity_at"] = datetime.datetime.now().isoformat() + "Z"
+            await commit_session(session_id)
             
             # Place Agent 응답에서 places 정보 추출
             places_list = course_data.get("places", [])
@@ -594,9 +730,7 @@ async def start_recommendation(request: dict):
             }
             
             # 최종 JSON 출력
-            print(f"\n[DEBUG] ===== FINAL RESPONSE JSON =====")
-            print(json.dumps(final_response, ensure_ascii=False, indent=2))
-            print(f"[DEBUG] ===============================")
+            log_payload("Final Response", final_response)
             
             return final_response
         else:
@@ -620,6 +754,8 @@ async def start_recommendation(request: dict):
             }
         }
 
+job_queue.runner = run_recommendation_job
+
 # 7. 헬스체크
 @app.get("/chat/health")
 def health():
@@ -648,7 +784,7 @@ async def get_session_profile(session_id: str):
     """세션의 프로필 데이터를 반환"""
     try:
         from services.main_agent_service import SESSION_INFO
-        session_info = SESSION_INFO.get(session_id, {})
+        session_info = await SESSION_INFO.aget(session_id, {})
         
         if 'profile' not in session_info:
             return {
@@ -0,0 +1,124 @@
+"""
+에이전트 간(A2A) 공유 비동기 HTTP 클라이언트
+- 프로세스 전체에서 httpx.AsyncClient 1개 재사용 (keep-alive 커넥션 풀)
+- 에이전트별 동시 요청 수 제한 (세마포어)
+- 에이전트별 타임아웃, 연결 실패/일시적 오류에 한해 지터 포함 재시도
+"""
+
+import asyncio
+import os
+import random
+from typing import Any, Dict, Optional
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 에이전트별 기본 설정 (base_url, 요청 타임아웃, 동시 요청 수)
+AGENT_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "place": {
+        "base_url": os.getenv("PLACE_AGENT_URL", "http://localhost:8002"),
+        "timeout": float(os.getenv("PLACE_AGENT_TIMEOUT", 30)),
+        "max_concurrency": int(os.getenv("PLACE_AGENT_MAX_CONCURRENCY", 10)),
+    },
+    "rag": {
+        "base_url": os.getenv("RAG_AGENT_URL", "http://localhost:8003"),
+        "timeout": float(os.getenv("RAG_AGENT_TIMEOUT", 60)),
+        "max_concurrency": int(os.getenv("RAG_AGENT_MAX_CONCURRENCY", 5)),
+    },
+}
+
+CONNECT_TIMEOUT = 5.0
+MAX_RETRIES = int(os.getenv("AGENT_MAX_RETRIES", 2))
+RETRY_BASE_DELAY = 0.3
+RETRY_MAX_DELAY = 3.0
+
+# 게이트웨이/일시적 과부하 응답만 재시도 (처리 중 실패는 재시도하지 않음)
+RETRYABLE_STATUS = {502, 503, 504}
+# 요청이 상대에게 도달하지 못한 경우만 재시도 (읽기 타임아웃은 중복 처리 위험으로 제외)
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.RemoteProtocolError)
+
+
+class AgentClient:
+    """에이전트 간 통신용 공유 비동기 클라이언트"""
+
+    def __init__(self, configs: Dict[str, Dict[str, Any]] = None, max_retries: int = MAX_RETRIES):
+        self.configs = configs or AGENT_CONFIGS
+        self.max_retries = max_retries
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 httpx 클라이언트 반환 (최초 호출 시 생성)"""
+        if self._client is None or self._client.is_closed:
+            total = sum(cfg["max_concurrency"] for cfg in self.configs.values())
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(max(cfg["timeout"] for cfg in self.configs.values()), connect=CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=total, max_keepalive_connections=total),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._client
+
+    def _get_semaphore(self, agent: str) -> asyncio.Semaphore:
+        """에이전트별 동시 요청 제한 세마포어 (이벤트 루프 안에서 지연 생성)"""
+        if agent not in self._semaphores:
+            limit = self.configs.get(agent, {}).get("max_concurrency", 5)
+            self._semaphores[agent] = asyncio.Semaphore(limit)
+        return self._semaphores[agent]
+
+    def url_for(self, agent: str, path: str) -> str:
+        """에이전트 base_url + 경로"""
+        return f"{self.configs[agent]['base_url'].rstrip('/')}{path}"
+
+    async def request(self, agent: str, method: str, url: str, json: Any = None,
+                      timeout: Optional[float] = None) -> httpx.Response:
+        """
+        재시도 포함 HTTP 요청
+
+        Args:
+            agent: 동시성 제한/기본 타임아웃을 적용할 에이전트 이름 ("place", "rag")
+            method: HTTP 메서드
+            url: 전체 URL
+            json: 요청 본문
+            timeout: 요청 타임아웃(초), 미지정 시 에이전트 기본값
+
+        Returns:
+            httpx.Response (상태 코드 확인은 호출자 책임)
+        """
+        read_timeout = timeout or self.configs.get(agent, {}).get("timeout", 30)
+        request_timeout = httpx.Timeout(read_timeout, connect=CONNECT_TIMEOUT)
+        client = self._get_client()
+
+        attempt = 0
+        while True:
+            try:
+                async with self._get_semaphore(agent):
+                    response = await client.request(method, url, json=json, timeout=request_timeout)
+                if response.status_code not in RETRYABLE_STATUS or attempt >= self.max_retries:
+                    return response
+                print(f"⚠️ [{agent}] HTTP {response.status_code} - 재시도 {attempt + 1}/{self.max_retries}")
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                print(f"⚠️ [{agent}] 연결 오류({type(e).__name__}) - 재시도 {attempt + 1}/{self.max_retries}")
+
+            # 지수 백오프 + Full Jitter
+            await asyncio.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))))
+            attempt += 1
+
+    async def post(self, agent: str, path: str, payload: Dict[str, Any],
+                   timeout: Optional[float] = None) -> httpx.Response:
+        """에이전트 base_url 기준 JSON POST"""
+        return await self.request(agent, "POST", self.url_for(agent, path), json=payload, timeout=timeout)
+
+    async def aclose(self):
+        """공유 클라이언트 종료 (서버 shutdown 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._semaphores.clear()
+
+
+# 공유 인스턴스
+agent_client = AgentClient()
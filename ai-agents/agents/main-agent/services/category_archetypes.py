@@ -0,0 +1,235 @@
+"""
+프로필 유형(archetype)별 카테고리 추천 테이블
+- (시간대, 데이트 시간, 장소 개수, 관계, 분위기)가 같으면 사실상 같은 추천이므로 유형별로 미리 계산해 재사용
+- 핫패스는 테이블 조회만 하고, 오래된 항목은 기존 값을 바로 반환한 뒤 백그라운드에서 갱신
+- 오프라인 워밍: python -m services.category_archetypes --warm [--output data/category_archetypes.json]
+- 서버 시작 시 시드 파일(CATEGORY_ARCHETYPE_SEED)이 있으면 테이블에 적재
+
+테이블은 LLM 결과 캐시(LLM_CACHE_URL)에 저장되므로 sqlite/redis면 재시작 후에도 유지된다.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from core.field_rules import parse_duration_bucket, parse_relationship_stage, parse_time_slot
+from models.smart_models import CategoryRecommendation
+from services.llm_cache import LLMResultCache, get_llm_cache
+
+load_dotenv()
+
+CATEGORY_ARCHETYPE_TTL_SECONDS = int(os.getenv("CATEGORY_ARCHETYPE_TTL_SECONDS", 30 * 86400))
+CATEGORY_ARCHETYPE_REFRESH_SECONDS = int(os.getenv("CATEGORY_ARCHETYPE_REFRESH_SECONDS", 86400))
+CATEGORY_ARCHETYPE_SEED = os.getenv(
+    "CATEGORY_ARCHETYPE_SEED",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "category_archetypes.json")
+)
+WARM_CONCURRENCY = 4
+
+ArchetypeKey = Tuple[str, str, int, str, str]
+
+# 워밍 대상 유형 (관계/분위기 ""는 미입력)
+TIME_SLOTS = ["오전", "오후", "저녁", "밤"]
+DURATIONS = ["1시간", "2시간", "3시간", "4시간", "반나절", "하루종일"]
+PLACE_COUNTS = [1, 2, 3, 4, 5]
+RELATIONSHIP_STAGES = ["", "연인", "썸", "친구", "소개팅"]
+ATMOSPHERES = ["", "로맨틱", "조용한", "아늑한", "활기찬", "트렌디한"]
+
+# 데이트 시간별 최대 장소 수 (카테고리 생성기의 제약과 동일, 위반 조합은 워밍하지 않음)
+MAX_PLACES = {"1시간": 1, "2시간": 2, "3시간": 3, "4시간": 3, "반나절": 4, "하루종일": 5}
+
+ATMOSPHERE_KEYWORDS = {
+    "로맨틱": ["로맨틱", "낭만", "분위기있", "설레"],
+    "조용한": ["조용", "차분", "한적", "잔잔"],
+    "아늑한": ["아늑", "포근", "편안", "따뜻"],
+    "활기찬": ["활기", "신나", "북적", "액티브", "에너지"],
+    "트렌디한": ["트렌디", "힙", "감성", "핫플", "요즘"],
+}
+
+
+def normalize_atmosphere(value: Any) -> Optional[str]:
+    """분위기 표현을 대표 분위기로 정규화 (미입력 "", 분류 불가 None)"""
+    if not value:
+        return ""
+    compact = str(value).replace(" ", "")
+    matches = [name for name, keywords in ATMOSPHERE_KEYWORDS.items() if any(k in compact for k in keywords)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def archetype_key(profile_data: Dict, place_count: int) -> Optional[ArchetypeKey]:
+    """프로필 → 유형 키 (규칙으로 확실히 분류되지 않으면 None, 이 경우 캐시하지 않음)"""
+    # 카테고리 생성기와 같은 기본값 (시간대 저녁, 3시간)
+    time_slot = parse_time_slot(profile_data.get("time_slot") or "저녁")
+    duration = parse_duration_bucket(profile_data.get("duration") or "3시간")
+    relationship = profile_data.get("relationship_stage") or ""
+    if relationship:
+        relationship = parse_relationship_stage(relationship)
+    atmosphere = normalize_atmosphere(profile_data.get("atmosphere"))
+    if not time_slot or not duration or relationship is None or atmosphere is None:
+        return None
+    return (time_slot[0], duration[0], int(place_count), relationship[0] if relationship else "", atmosphere)
+
+
+def archetype_profile(key: ArchetypeKey) -> Dict[str, Any]:
+    """유형 대표 프로필 (워밍/백그라운드 갱신 시 LLM 입력)"""
+    time_slot, duration, _, relationship, atmosphere = key
+    profile = {"time_slot": time_slot, "duration": duration}
+    if relationship:
+        profile["relationship_stage"] = relationship
+    if atmosphere:
+        profile["atmosphere"] = atmosphere
+    return profile
+
+
+def all_archetypes() -> List[ArchetypeKey]:
+    """워밍 대상 전체 유형 (시간-장소 제약을 만족하는 조합만)"""
+    return [
+        (time_slot, duration, place_count, relationship, atmosphere)
+        for time_slot, duration, place_count, relationship, atmosphere in itertools.product(
+            TIME_SLOTS, DURATIONS, PLACE_COUNTS, RELATIONSHIP_STAGES, ATMOSPHERES
+        )
+        if place_count <= MAX_PLACES[duration]
+    ]
+
+
+class CategoryArchetypeTable:
+    """유형 키 → 카테고리 추천 테이블 (stale-while-revalidate)"""
+
+    def __init__(self, cache: LLMResultCache = None, refresh_after: float = CATEGORY_ARCHETYPE_REFRESH_SECONDS):
+        self.cache = cache or get_llm_cache("category_archetype", ttl_seconds=CATEGORY_ARCHETYPE_TTL_SECONDS)
+        self.refresh_after = refresh_after
+        self._refreshing = set()
+        self._tasks = set()
+
+    @staticmethod
+    def _cache_key(key: ArchetypeKey) -> Tuple[str, ...]:
+        return tuple(str(part) for part in key)
+
+    def _from_entry(self, entry: Optional[Dict[str, Any]]) -> Optional[Tuple[List[CategoryRecommendation], bool]]:
+        if not entry:
+            return None
+        recommendations = [CategoryRecommendation(**rec) for rec in entry["recommendations"]]
+        stale = time.time() - entry.get("generated_at", 0) > self.refresh_after
+        return recommendations, stale
+
+    def _to_entry(self, recommendations: List[CategoryRecommendation], generated_at: float = None) -> Dict[str, Any]:
+        return {
+            "generated_at": generated_at or time.time(),
+            "recommendations": [rec.model_dump() for rec in recommendations],
+        }
+
+    def lookup(self, key: ArchetypeKey) -> Optional[Tuple[List[CategoryRecommendation], bool]]:
+        """(추천 목록, 갱신 필요 여부) 반환, 없으면 None"""
+        return self._from_entry(self.cache.get(self._cache_key(key)))
+
+    async def alookup(self, key: ArchetypeKey) -> Optional[Tuple[List[CategoryRecommendation], bool]]:
+        """lookup의 비동기 버전 (요청 경로에서 사용)"""
+        return self._from_entry(await self.cache.aget(self._cache_key(key)))
+
+    def store(self, key: ArchetypeKey, recommendations: List[CategoryRecommendation],
+              generated_at: float = None) -> bool:
+        """유형 추천 저장 (장소 개수가 맞지 않는 결과는 저장하지 않음)"""
+        if len(recommendations) != key[2]:
+            return False
+        self.cache.set(self._cache_key(key), self._to_entry(recommendations, generated_at))
+        return True
+
+    async def astore(self, key: ArchetypeKey, recommendations: List[CategoryRecommendation],
+                     generated_at: float = None) -> bool:
+        """store의 비동기 버전"""
+        if len(recommendations) != key[2]:
+            return False
+        await self.cache.aset(self._cache_key(key), self._to_entry(recommendations, generated_at))
+        return True
+
+    def schedule_refresh(self, key: ArchetypeKey,
+                         regenerate: Callable[[ArchetypeKey], Awaitable[Optional[List[CategoryRecommendation]]]]) -> None:
+        """응답 경로 밖에서 유형 추천 재생성 (같은 유형은 동시에 한 번만)"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def _refresh():
+            try:
+                await regenerate(key)
+                print(f"[CATEGORY_ARCHETYPE] 백그라운드 갱신 완료: {key}")
+            except Exception as e:
+                print(f"[WARNING] 카테고리 유형 갱신 실패 {key}: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(_refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def load_seed(self, path: str = CATEGORY_ARCHETYPE_SEED) -> int:
+        """오프라인 워밍 결과(JSON)를 테이블에 적재 (이미 있는 유형은 유지)"""
+        if not path or not os.path.exists(path):
+            return 0
+        with open(path, "r", encoding="utf-8") as f:
+            seed = json.load(f)
+        loaded = 0
+        for item in seed.get("archetypes", []):
+            key = tuple(item["key"][:2]) + (int(item["key"][2]),) + tuple(item["key"][3:])
+            if self.cache.store.get(self.cache.make_key(*self._cache_key(key))) is not None:
+                continue
+            if self.store(key, [CategoryRecommendation(**rec) for rec in item["recommendations"]],
+                          generated_at=item.get("generated_at")):
+                loaded += 1
+        print(f"[CATEGORY_ARCHETYPE] 시드 적재: {loaded}개 ({path})")
+        return loaded
+
+
+category_archetypes = CategoryArchetypeTable()
+
+
+async def warm(openai_api_key: str, keys: List[ArchetypeKey] = None, output: str = None,
+               concurrency: int = WARM_CONCURRENCY) -> int:
+    """전체 유형 추천을 미리 생성해 테이블에 저장 (오프라인 실행용)"""
+    from services.intelligent_category_generator import IntelligentCategoryGenerator
+
+    keys = keys or all_archetypes()
+    semaphore = asyncio.Semaphore(concurrency)
+    results: Dict[ArchetypeKey, List[CategoryRecommendation]] = {}
+
+    async def _warm_one(key: ArchetypeKey):
+        async with semaphore:
+            # 생성기는 폴백 여부를 인스턴스에 기록하므로 유형마다 새로 생성
+            recommendations = await IntelligentCategoryGenerator(openai_api_key).generate_for_archetype(key)
+            if recommendations:
+                results[key] = recommendations
+                print(f"[CATEGORY_ARCHETYPE] 워밍 {len(results)}/{len(keys)}: {key}")
+
+    await asyncio.gather(*[_warm_one(key) for key in keys])
+
+    if output:
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        now = time.time()
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"archetypes": [
+                {"key": list(key), "generated_at": now, "recommendations": [rec.model_dump() for rec in recs]}
+                for key, recs in results.items()
+            ]}, f, ensure_ascii=False, indent=2)
+        print(f"[CATEGORY_ARCHETYPE] 시드 파일 저장: {output}")
+    return len(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="카테고리 추천 유형 테이블 워밍")
+    parser.add_argument("--warm", action="store_true", help="전체 유형 추천 생성")
+    parser.add_argument("--output", default=CATEGORY_ARCHETYPE_SEED, help="시드 JSON 저장 경로")
+    parser.add_argument("--limit", type=int, default=None, help="생성할 유형 수 제한")
+    args = parser.parse_args()
+
+    if args.warm:
+        targets = all_archetypes()[:args.limit] if args.limit else None
+        count = asyncio.run(warm(os.getenv("OPENAI_API_KEY"), keys=targets, output=args.output))
+        print(f"✅ {count}개 유형 워밍 완료")
+    else:
+        print(f"전체 유형 수: {len(all_archetypes())}")
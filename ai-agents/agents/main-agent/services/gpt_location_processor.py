@@ -3,15 +3,25 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from services.llm_cache import LLMResultCache
 
 class GPTLocationProcessor:
-    def __init__(self, openai_api_key: str):
+    def __init__(self, openai_api_key: str, result_cache: Optional[LLMResultCache] = None):
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, openai_api_key=openai_api_key)
+        # (요청, 장소 개수) → 배치 결과 공유 캐시
+        self.result_cache = result_cache
     
     async def process_location_clustering(self, user_input: str, place_count: int) -> Dict[str, Any]:
         """GPT가 장소 배치 요청을 JSON으로 직접 처리"""
         
+        if self.result_cache is not None:
+            cached = await self.result_cache.aget((user_input, place_count))
+            if cached is not None:
+                print(f"[GPT_LOCATION] 캐시 사용: {len(cached['groups'])}개 그룹")
+                return cached
+        
         prompt = f"""
         당신은 데이트 코스 장소 배치 전문가입니다.
         사용자의 요청을 분석하여 정해진 JSON 스키마에 맞게 장소 배치 정보를 작성해주세요.
@@ -76,6 +86,8 @@ class GPTLocationProcessor:
                 print(f"[WARNING] 장소 번호 불일치: 예상={expected_places}, 실제={all_places}")
             
             print(f"[GPT_LOCATION] 장소 배치 처리 성공: {len(data['groups'])}개 그룹")
+            if self.result_cache is not None:
+                await self.result_cache.aset((user_input, place_count), data)
             return data
             
         except Exception as e:
@@ -8,11 +8,14 @@ from langchain_core.messages import HumanMessage
 import json
 from typing import Dict, List, Any, Optional
 from models.smart_models import CategoryRecommendation
+from services.category_archetypes import archetype_key, archetype_profile, category_archetypes
 import re
 
 class IntelligentCategoryGenerator:
     def __init__(self, openai_api_key: str):
+        self.openai_api_key = openai_api_key
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3, openai_api_key=openai_api_key)
+        self._used_fallback = False  # 마지막 생성이 emergency fallback이었는지 (유형 테이블에 저장하지 않음)
         
         # 시간대별 카테고리 적합성 가이드
         self.time_compatibility = {
@@ -80,6 +83,39 @@ class IntelligentCategoryGenerator:
                 # 사용자에게 선택권 제공 (자동 조정 안함)
                 raise ValueError(f"CONSTRAINT_VIOLATION:{constraint_result['message']}")
         
+        # 같은 유형(시간대/시간/개수/관계/분위기)의 추천이 테이블에 있으면 LLM 호출 없이 사용
+        key = archetype_key(profile_data, place_count)
+        if key is not None:
+            cached = await category_archetypes.alookup(key)
+            if cached is not None:
+                recommendations, stale = cached
+                if stale:
+                    category_archetypes.schedule_refresh(key, self._regenerate_archetype)
+                print(f"[INTELLIGENT_CATEGORY] 유형 테이블 사용: {key}")
+                return recommendations
+        
+        recommendations = await self._generate_categories(profile_data, place_count, conversation_context)
+        if key is not None:
+            # 이 결과는 사용자 프로필/대화로 만든 것이므로 공유 테이블에는 유형 대표 프로필로 따로 생성해 저장
+            category_archetypes.schedule_refresh(key, self._regenerate_archetype)
+        return recommendations
+
+    async def generate_for_archetype(self, key: tuple) -> Optional[List[CategoryRecommendation]]:
+        """유형 대표 프로필로 추천을 생성해 테이블에 저장 (워밍/백그라운드 갱신용, 폴백 결과는 저장하지 않음)"""
+        recommendations = await self._generate_categories(archetype_profile(key), key[2], "")
+        if self._used_fallback or not await category_archetypes.astore(key, recommendations):
+            return None
+        return recommendations
+
+    async def _regenerate_archetype(self, key: tuple) -> Optional[List[CategoryRecommendation]]:
+        # 폴백 여부 플래그가 요청 처리와 섞이지 않도록 별도 인스턴스 사용
+        return await IntelligentCategoryGenerator(self.openai_api_key).generate_for_archetype(key)
+
+    async def _generate_categories(self, profile_data: Dict, place_count: int,
+                                   conversation_context: str) -> List[CategoryRecommendation]:
+        """LLM 기반 카테고리 생성 (응답 검증 → 재시도 → 흐름 수정 → emergency fallback)"""
+        self._used_fallback = False
+        
         # 필수 데이터 추출
         essential_data = self._extract_essential_data(profile_data)
         time_slot = essential_data.get("time_slot", "저녁")
@@ -370,6 +406,7 @@ JSON만 응답:
 
     async def _emergency_fallback(self, essential_data: Dict, place_count: int) -> List[CategoryRecommendation]:
         """완전 실패 시 최소한의 동적 추천"""
+        self._used_fallback = True
         time_slot = essential_data.get("time_slot", "저녁")
         compatibility = self.time_compatibility.get(time_slot, self.time_compatibility["저녁"])
         
@@ -0,0 +1,196 @@
+"""
+LLM 결과 캐시 (세션과 무관하게 프로세스/워커 전체에서 공유)
+- 같은 입력("엔프피", "5시부터 10시까지" 등)에 대한 구조화된 LLM 결과를 모든 사용자가 재사용
+- 세션 저장소와 같은 백엔드 사용: memory(LRU + TTL), sqlite/redis(재시작 후에도 유지)
+- 캐시별 hit/miss 카운터는 /api/health의 llm_cache로 노출
+
+LLM_CACHE_URL 환경변수로 백엔드를 선택한다 (미지정 시 SESSION_STORE_URL).
+실패/판단 불가(None) 결과는 저장하지 않는다.
+async 코드에서는 aget/aset/aget_or_compute를 사용한다 (sqlite/redis I/O를 스레드에서 실행).
+영속 백엔드는 최근 결과를 프로세스 안에 잠시(RECENT_TTL_SECONDS) 보관해, 같은 턴에서 async로 읽은 값을
+동기 코드가 다시 읽을 때 이벤트 루프에서 백엔드를 호출하지 않는다.
+"""
+
+import copy
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+from services.session_store import SESSION_STORE_URL, MemorySessionStore, SessionStore, create_session_store
+
+load_dotenv()
+
+LLM_CACHE_URL = os.getenv("LLM_CACHE_URL", SESSION_STORE_URL)
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 86400))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 20000))
+
+# 이보다 긴 입력은 해시로 키 생성 (백엔드 키 길이 제한)
+MAX_RAW_KEY_LENGTH = 128
+
+# 영속 백엔드의 프로세스 내 최근 결과 (다른 프로세스의 갱신은 이 시간 안에 반영)
+RECENT_MAX_ENTRIES = 256
+RECENT_TTL_SECONDS = 60
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_input(value: Any) -> str:
+    """캐시 키용 입력 정규화 (앞뒤 공백 제거, 연속 공백 축약, 소문자화)"""
+    return _WHITESPACE.sub(" ", str(value)).strip().lower()
+
+
+class LLMResultCache:
+    """정규화된 입력 → 구조화된 LLM 결과 캐시"""
+
+    def __init__(self, name: str, url: str = None, max_entries: int = LLM_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = LLM_CACHE_TTL_SECONDS):
+        self.name = name
+        # 요청 턴과 무관한 공유 캐시이므로 session_scope()에 모으지 않고 바로 저장
+        self.store: SessionStore = create_session_store(
+            f"llm_cache:{name}", url or LLM_CACHE_URL, max_entries=max_entries, ttl_seconds=ttl_seconds, scoped=False
+        )
+        # memory 백엔드는 저장소 자체가 프로세스 내 LRU이므로 최근 결과를 따로 두지 않음
+        self._recent: Optional["OrderedDict[str, tuple]"] = (
+            None if isinstance(self.store, MemorySessionStore) else OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def make_key(self, *parts: Any) -> str:
+        key = "|".join(normalize_input(part) for part in parts)
+        if len(key) > MAX_RAW_KEY_LENGTH:
+            return "sha1:" + hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return key
+
+    def _recent_get(self, key: str) -> Optional[Any]:
+        if self._recent is None:
+            return None
+        item = self._recent.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+    def _remember(self, key: str, value: Any) -> None:
+        if self._recent is None or value is None:
+            return
+        self._recent[key] = (time.monotonic() + RECENT_TTL_SECONDS, value)
+        self._recent.move_to_end(key)
+        while len(self._recent) > RECENT_MAX_ENTRIES:
+            self._recent.popitem(last=False)
+
+    def _found(self, value: Optional[Any]) -> Optional[Any]:
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        # memory 백엔드는 같은 객체를 보관하므로 호출 측 수정이 캐시에 번지지 않도록 복사본 사용 (set도 동일)
+        return copy.deepcopy(value)
+
+    def get(self, parts: tuple) -> Optional[Any]:
+        """캐시 조회 (없거나 저장소 오류면 None)"""
+        key = self.make_key(*parts)
+        value = self._recent_get(key)
+        if value is None:
+            try:
+                value = self.store.get(key)
+            except Exception as e:
+                self.errors += 1
+                print(f"[WARNING] LLM 캐시 조회 실패 ({self.name}): {e}")
+                value = None
+            self._remember(key, value)
+        return self._found(value)
+
+    async def aget(self, parts: tuple) -> Optional[Any]:
+        """get의 비동기 버전 (영속 백엔드 조회는 스레드에서)"""
+        key = self.make_key(*parts)
+        value = self._recent_get(key)
+        if value is None:
+            try:
+                value = await self.store.aget(key)
+            except Exception as e:
+                self.errors += 1
+                print(f"[WARNING] LLM 캐시 조회 실패 ({self.name}): {e}")
+                value = None
+            self._remember(key, value)
+        return self._found(value)
+
+    def set(self, parts: tuple, value: Any) -> None:
+        """결과 저장 (None은 저장하지 않음)"""
+        if value is None:
+            return
+        key = self.make_key(*parts)
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+        try:
+            self.store[key] = value
+        except Exception as e:
+            self.errors += 1
+            print(f"[WARNING] LLM 캐시 저장 실패 ({self.name}): {e}")
+
+    async def aset(self, parts: tuple, value: Any) -> None:
+        """set의 비동기 버전 (영속 백엔드 저장은 스레드에서)"""
+        if value is None:
+            return
+        key = self.make_key(*parts)
+        value = copy.deepcopy(value)
+        self._remember(key, value)
+        try:
+            await self.store.aset(key, value)
+        except Exception as e:
+            self.errors += 1
+            print(f"[WARNING] LLM 캐시 저장 실패 ({self.name}): {e}")
+
+    def get_or_compute(self, parts: tuple, compute: Callable[[], Any]) -> Any:
+        cached = self.get(parts)
+        if cached is not None:
+            return cached
+        value = compute()
+        self.set(parts, value)
+        return value
+
+    async def aget_or_compute(self, parts: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        cached = await self.aget(parts)
+        if cached is not None:
+            return cached
+        value = await compute()
+        await self.aset(parts, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "store": self.store.stats(),
+        }
+
+
+_caches: Dict[str, LLMResultCache] = {}
+
+
+def get_llm_cache(name: str, **kwargs) -> LLMResultCache:
+    """이름별 공유 LLM 캐시 (프로세스당 1개, kwargs는 최초 생성 시에만 적용)"""
+    if name not in _caches:
+        _caches[name] = LLMResultCache(name, **kwargs)
+    return _caches[name]
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    """전체 LLM 캐시 hit/miss 집계"""
+    caches = {name: cache.stats() for name, cache in _caches.items()}
+    hits = sum(c["hits"] for c in caches.values())
+    misses = sum(c["misses"] for c in caches.values())
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        "caches": caches,
+    }
@@ -1,5 +1,6 @@
-from langchain.memory import ConversationBufferMemory
 from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage
+import asyncio
 import os
 import uuid
 import json
@@ -7,17 +8,22 @@ from typing import Optional, Dict, Any, Tuple
 
 from core.profile_extractor import (
     extract_profile_from_llm, 
+    aextract_profile_from_llm, 
     rule_based_gender_relationship, 
     llm_correct_field, 
     REQUIRED_KEYS
 )
-from core.location_processor import extract_location_request_from_llm
+from core.location_processor import extract_location_request_from_llm, aextract_location_request_from_llm
+from core.field_rules import RULE_CONFIDENCE_THRESHOLD, parse_duration_bucket
+from core.conversation_memory import ConversationMemory, extractive_summary, format_messages, SUMMARY_MAX_CHARS
 from core.agent_builders import (
     build_place_agent_json, 
     build_rag_agent_json
 )
 from models.request_models import MainAgentRequest, UserProfile, LocationRequest
 from models.response_models import MainAgentResponse
+from services.session_store import SessionStore, create_session_store, session_scope
+from services.llm_cache import LLMResultCache, get_llm_cache
 
 # 시간-장소 개수 지능형 제약 시스템
 TIME_PLACE_CONSTRAINTS = {
@@ -64,8 +70,8 @@ FIELD_QUESTION_DICT = {
     "place_count": "🔢 몇 개의 장소를 방문하고 싶으세요?\n예시: 2개, 3개 등"
 }
 
-# 세션별 정보 누적용 임시 메모리 (실제 서비스에서는 DB/Redis 권장)
-SESSION_INFO: Dict[str, Dict[str, Any]] = {}
+# 세션별 정보 누적 저장소 (SESSION_STORE_URL로 memory/sqlite/redis 선택)
+SESSION_INFO: SessionStore = create_session_store("session_info")
 
 class MainAgentService:
     def __init__(self, openai_api_key: Optional[str] = None):
@@ -78,17 +84,16 @@ class MainAgentService:
                 print(f"[DEBUG] LLM 초기화 성공")
             except Exception as e:
                 print(f"[ERROR] LLM 초기화 실패: {str(e)}")
-        self.memory_sessions: Dict[str, ConversationBufferMemory] = {}
-        self.llm_correction_cache: Dict[str, Dict[str, str]] = {}  # session_id -> {(field, value): corrected
+        self.memory_sessions: SessionStore = create_session_store("memory")
+        self._background_tasks = set()  # 응답 경로 밖에서 실행 중인 대화 요약 작업
+        # (필드, 값) → GPT 보정 결과는 세션과 무관하므로 전체 사용자가 공유
+        self.llm_correction_cache: LLMResultCache = get_llm_cache("field_correction")
+        self.duration_llm_cache: LLMResultCache = get_llm_cache("duration")
     
     def get_llm_corrected(self, session_id: str, key: str, value: str) -> str:
-        cache = self.llm_correction_cache.setdefault(session_id, {})
-        cache_key = f"{key}:{value}"
-        if cache_key in cache:
-            return cache[cache_key]
-        corrected = llm_correct_field(self.llm, key, value)
-        cache[cache_key] = corrected
-        return corrected
+        return self.llm_correction_cache.get_or_compute(
+            (key, value), lambda: llm_correct_field(self.llm, key, value)
+        )
     
     def get_smart_recommendations_for_duration(self, duration: str) -> dict:
         """데이트 시간에 따른 스마트 추천 - 동적 계산"""
@@ -127,18 +132,46 @@ class MainAgentService:
             return {"max_places": 6, "recommended_places": 5, "categories": ["카페", "음식점", "문화시설", "쇼핑", "야외활동", "엔터테인먼트"]}
     
     def _normalize_duration(self, duration: str) -> str:
-        """GPT 기반 시간 표현 정규화"""
+        """시간 표현 정규화 (GPT 결과는 _anormalize_duration이 미리 저장한 duration_llm_cache에서만 조회)"""
         duration = duration.strip()
         
-        # GPT로 시간 파싱 시도
+        # 규칙으로 확실히 해석되는 표현은 GPT 호출 없이 처리
+        rule_result = self._rule_normalize_duration(duration)
+        if rule_result:
+            return rule_result
+        
+        # 동기 경로는 이벤트 루프에서 실행되므로 GPT를 직접 호출하지 않음
         if self.llm:
-            try:
-                gpt_result = self._parse_duration_with_gpt(duration)
-                if gpt_result:
-                    return gpt_result
-            except Exception as e:
-                print(f"[WARNING] GPT 시간 파싱 실패, 기존 로직 사용: {e}")
+            gpt_result = self.duration_llm_cache.get((duration,))
+            if gpt_result:
+                return gpt_result
         
+        return self._keyword_normalize_duration(duration)
+    
+    async def _anormalize_duration(self, duration: str) -> str:
+        """_normalize_duration의 비동기 버전 - 결과를 캐시해 이후 동기 호출은 LLM 없이 처리"""
+        duration = duration.strip()
+        
+        rule_result = self._rule_normalize_duration(duration)
+        if rule_result:
+            return rule_result
+        
+        if self.llm:
+            gpt_result = await self._aparse_duration_with_gpt(duration)
+            if gpt_result:
+                return gpt_result
+        
+        return self._keyword_normalize_duration(duration)
+    
+    def _rule_normalize_duration(self, duration: str) -> Optional[str]:
+        """규칙 기반 시간 정규화 (GPT 프롬프트와 같은 구간: 1-4시간 → "X시간", 5-6시간 → 반나절, 7시간 이상 → 하루종일)"""
+        parsed = parse_duration_bucket(duration)
+        if parsed and parsed[1] >= RULE_CONFIDENCE_THRESHOLD:
+            return parsed[0]
+        return None
+    
+    def _keyword_normalize_duration(self, duration: str) -> str:
+        """키워드 기반 시간 표현 정규화"""
         # 기존 키워드 기반 로직 (폴백)
         if any(word in duration for word in ["1시간", "한시간"]):
             return "1시간"
@@ -155,9 +188,9 @@ class MainAgentService:
         else:
             return "3시간"  # 기본값
     
-    def _parse_duration_with_gpt(self, duration_input: str) -> str:
-        """GPT를 사용한 시간 범위 파싱"""
-        prompt = f"""
+    def _build_duration_prompt(self, duration_input: str) -> str:
+        """시간 범위 파싱 프롬프트"""
+        return f"""
 다음 시간 표현을 분석해서 정확한 시간을 JSON 형태로 반환해주세요.
 
 입력: "{duration_input}"
@@ -176,21 +209,28 @@ class MainAgentService:
 - 5-6시간 → "반나절" 
 - 7시간 이상 → "하루종일"
 """
+    
+    def _parse_duration_response(self, result_text: str) -> Optional[str]:
+        """GPT 시간 파싱 응답에서 normalized_duration 추출"""
+        import re
         
+        # JSON 부분만 추출
+        json_match = re.search(r'\{[^}]+\}', result_text.strip())
+        if json_match:
+            result_json = json.loads(json_match.group())
+            return result_json.get("normalized_duration", "3시간")
+        return None
+    
+    async def _aparse_duration_with_gpt(self, duration_input: str) -> Optional[str]:
+        """GPT를 사용한 시간 범위 파싱 (결과는 duration_llm_cache에 저장)"""
+        cached = await self.duration_llm_cache.aget((duration_input,))
+        if cached is not None:
+            return cached
         try:
-            response = self.llm.invoke(prompt)
-            result_text = response.content.strip()
-            
-            # JSON 파싱
-            import json
-            import re
-            
-            # JSON 부분만 추출
-            json_match = re.search(r'\{[^}]+\}', result_text)
-            if json_match:
-                result_json = json.loads(json_match.group())
-                return result_json.get("normalized_duration", "3시간")
-            
+            response = await self.llm.ainvoke(self._build_duration_prompt(duration_input))
+            result = self._parse_duration_response(response.content)
+            await self.duration_llm_cache.aset((duration_input,), result)
+            return result
         except Exception as e:
             print(f"[ERROR] GPT 시간 파싱 실패: {e}")
             
@@ -249,6 +289,13 @@ class MainAgentService:
         # 기존 정규화 함수 사용
         return self._normalize_duration(user_input)
     
+    async def _anormalize_duration_input(self, user_input: str) -> str:
+        """_normalize_duration_input의 비동기 버전 (GPT 파싱이 필요한 경우에만 await)"""
+        user_input = user_input.strip()
+        if not user_input.isdigit():
+            await self._anormalize_duration(user_input)
+        return self._normalize_duration_input(user_input)
+    
     def _normalize_place_count_input(self, user_input: str) -> str:
         """사용자 place_count 입력을 정규화"""
         user_input = user_input.strip()
@@ -491,7 +538,7 @@ class MainAgentService:
         
         # GPT 기반 처리로 완전 대체
         if not hasattr(self, 'location_processor'):
-            self.location_processor = GPTLocationProcessor(self.openai_api_key)
+            self.location_processor = GPTLocationProcessor(self.openai_api_key, result_cache=get_llm_cache("location_clustering"))
         
         return await self.location_processor.process_location_clustering(user_input, place_count)
     
@@ -1015,11 +1062,43 @@ class MainAgentService:
         
         return "no_modification", "이해하지 못했어요. 구체적으로 무엇을 바꾸고 싶으신지 말씀해주세요."
     
-    def get_or_create_memory(self, session_id: str) -> ConversationBufferMemory:
+    def get_or_create_memory(self, session_id: str) -> ConversationMemory:
         """세션별 메모리 관리"""
-        if session_id not in self.memory_sessions:
-            self.memory_sessions[session_id] = ConversationBufferMemory()
-        return self.memory_sessions[session_id]
+        memory = self.memory_sessions.get(session_id)
+        if memory is None:
+            memory = ConversationMemory()
+            self.memory_sessions[session_id] = memory
+        return memory
+    
+    def schedule_memory_summary(self, session_id: str, memory: ConversationMemory):
+        """토큰 예산을 넘긴 대화가 있으면 백그라운드에서 누적 요약 갱신"""
+        if not memory.needs_summary():
+            return
+        task = asyncio.ensure_future(self._refresh_memory_summary(session_id, memory))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _refresh_memory_summary(self, session_id: str, memory: ConversationMemory):
+        if await memory.summarize(self._summarize_conversation):
+            await self.memory_sessions.acommit(session_id)
+            print(f"[DEBUG] 대화 요약 갱신 완료: {session_id} ({len(memory.summary)}자)")
+    
+    async def _summarize_conversation(self, previous_summary: str, messages: list) -> str:
+        """이전 요약 + 창에서 밀려난 대화를 하나의 짧은 요약으로 합침"""
+        if not self.llm:
+            return extractive_summary(previous_summary, messages)
+        prompt = f"""데이트 코스 추천 상담 대화의 누적 요약을 갱신하세요.
+
+**이전 요약:**
+{previous_summary or "(없음)"}
+
+**추가된 대화:**
+{format_messages(messages)}
+
+사용자의 조건, 선호, 변경 요청 등 이후 추천에 필요한 정보만 {SUMMARY_MAX_CHARS}자 이내 한국어로 요약하세요.
+**요약:**"""
+        result = await self.llm.ainvoke([HumanMessage(content=prompt)])
+        return result.content.strip()
     
     def extract_and_validate_profile(self, user_message: str, session_id: str) -> UserProfile:
         """사용자 메시지에서 프로필 추출 및 검증"""
@@ -1188,15 +1267,12 @@ class MainAgentService:
         
         return place_json, rag_json
     
-    def _call_place_agent(self, profile, location_request, max_travel_time, session_info):
+    async def _call_place_agent(self, profile, location_request, max_travel_time, session_info):
         """실제 Place Agent 호출"""
-        import requests
-        import os
         from core.agent_builders import build_place_agent_json
+        from services.agent_client import agent_client
         
         try:
-            PLACE_AGENT_URL = os.getenv("PLACE_AGENT_URL", "http://localhost:8002")
-            
             # Place Agent 요청 생성
             place_request = build_place_agent_json(
                 profile.model_dump(), 
@@ -1205,15 +1281,10 @@ class MainAgentService:
                 session_info
             )
             
-            print(f"[DEBUG] _call_place_agent - Place Agent 호출: {PLACE_AGENT_URL}/place-agent")
+            print(f"[DEBUG] _call_place_agent - Place Agent 호출: {agent_client.url_for('place', '/place-agent')}")
             
-            # 실제 Place Agent 호출
-            place_response = requests.post(
-                f"{PLACE_AGENT_URL}/place-agent",
-                json=place_request,
-                headers={"Content-Type": "application/json"},
-                timeout=30
-            )
+            # 실제 Place Agent 호출 (공유 비동기 클라이언트)
+            place_response = await agent_client.post("place", "/place-agent", place_request, timeout=30)
             
             if place_response.status_code != 200:
                 print(f"[ERROR] _call_place_agent - Place Agent 호출 실패: HTTP {place_response.status_code}")
@@ -1233,14 +1304,28 @@ class MainAgentService:
             return None
     
     async def process_request(self, request: MainAgentRequest) -> MainAgentResponse:
+        """요청 처리 후 이번 턴에 수정된 세션 상태를 저장소에 반영"""
+        request.session_id = request.session_id or str(uuid.uuid4())
+        async with session_scope():
+            # 이번 턴에 쓸 상태를 스레드에서 미리 읽어 두면 이후 동기 접근은 루프에서 I/O 없이 처리됨
+            await SESSION_INFO.aget(request.session_id)
+            await self.memory_sessions.aget(request.session_id)
+            try:
+                return await self._process_request(request)
+            finally:
+                await SESSION_INFO.acommit(request.session_id)
+                await self.memory_sessions.acommit(request.session_id)
+    
+    async def _process_request(self, request: MainAgentRequest) -> MainAgentResponse:
         try:
             print(f"[DEBUG] MainAgentService.process_request 시작: {request.user_message[:50]}...")
-            session_id = request.session_id or str(uuid.uuid4())
+            session_id = request.session_id
             memory = self.get_or_create_memory(session_id)
             memory.save_context(
                 {"input": "사용자 요청"}, 
                 {"output": request.user_message}
             )
+            self.schedule_memory_summary(session_id, memory)
             session_info = SESSION_INFO.get(session_id, {})
             if 'profile' not in session_info:
                 session_info['profile'] = UserProfile()
@@ -1264,9 +1349,9 @@ class MainAgentService:
             if not hasattr(self, 'intent_analyzer'):
                 self.intent_analyzer = IntentAnalyzer(self.openai_api_key)
             if not hasattr(self, 'field_processor'):
-                self.field_processor = GPTFieldProcessor(self.openai_api_key)
+                self.field_processor = GPTFieldProcessor(self.openai_api_key, result_cache=get_llm_cache("field"))
             if not hasattr(self, 'location_processor'):
-                self.location_processor = GPTLocationProcessor(self.openai_api_key)
+                self.location_processor = GPTLocationProcessor(self.openai_api_key, result_cache=get_llm_cache("location_clustering"))
             needs_optional_info_ask = session_info.get("_needs_optional_info_ask", False)
             optional_info_pending = session_info.get("_optional_info_pending", False)
             optional_idx = session_info.get("_optional_idx", 0)
@@ -1280,8 +1365,13 @@ class MainAgentService:
                     print(f"[ERROR] LLM이 초기화되지 않음")
                     raise Exception("OpenAI API 키가 설정되지 않았거나 LLM 초기화에 실패했습니다.")
                 
-                print(f"[DEBUG] extract_profile_from_llm 호출 시작")
-                extracted = extract_profile_from_llm(self.llm, request.user_message)
+                # 프로필 추출과 위치 정보 추출은 서로 독립적이므로 동시에 실행
+                # (위치 힌트는 기존 프로필 주소 사용, 메시지 속 지역은 위치 추출이 직접 인식)
+                print(f"[DEBUG] 프로필/위치 정보 동시 추출 시작")
+                extracted, location_data = await asyncio.gather(
+                    aextract_profile_from_llm(self.llm, request.user_message),
+                    aextract_location_request_from_llm(self.llm, request.user_message, address_hint=profile.address or "서울")
+                )
                 print(f"[DEBUG] extract_profile_from_llm 완료: {extracted}")
                 extracted = rule_based_gender_relationship(request.user_message, extracted)
                 print(f"[DEBUG] rule_based_gender_relationship 완료: {extracted}")
@@ -1293,8 +1383,7 @@ class MainAgentService:
                 if not profile.address:
                     profile.address = "서울"
                 
-                # 위치 정보 추출 및 address 보완
-                location_data = extract_location_request_from_llm(self.llm, request.user_message, address_hint=profile.address)
+                # 위치 정보로 address 보완
                 if location_data.get("reference_areas"):
                     profile.address = location_data["reference_areas"][0]
                 location_request = self.safe_create_location_request(location_data, profile.address)
@@ -1365,7 +1454,7 @@ class MainAgentService:
                                     else:
                                         # 정상 처리로 간주 - 기존 로직 사용
                                         if last_asked == "duration":
-                                            normalized_duration = self._normalize_duration_input(user_input)
+                                            normalized_duration = await self._anormalize_duration_input(user_input)
                                             setattr(profile, last_asked, normalized_duration)
                                         elif last_asked == "place_count":
                                             normalized_place_count = self._normalize_place_count_input(user_input)
@@ -1382,7 +1471,7 @@ class MainAgentService:
                                 print(f"[ERROR] GPT 필드 처리 완전 실패: {e}")
                                 # 최종 폴백 - 기존 로직만 사용
                                 if last_asked == "duration":
-                                    normalized_duration = self._normalize_duration_input(user_input)
+                                    normalized_duration = await self._anormalize_duration_input(user_input)
                                     setattr(profile, last_asked, normalized_duration)
                                 elif last_asked == "place_count":
                                     normalized_place_count = self._normalize_place_count_input(user_input)
@@ -1418,7 +1507,7 @@ class MainAgentService:
                             suggestions=missing_fields
                         )
                 # 위치 정보는 null로 처리, 장소배치에서 구체적으로 설정
-                location_data = extract_location_request_from_llm(self.llm, request.user_message, address_hint=profile.address)
+                location_data = await aextract_location_request_from_llm(self.llm, request.user_message, address_hint=profile.address)
                 if not profile.address and location_data.get("reference_areas"):
                     profile.address = location_data["reference_areas"][0]
                 
@@ -1426,6 +1515,9 @@ class MainAgentService:
                 location_request = self.safe_create_location_request(location_data, profile.address or "서울")
 
             # 3. 필수 정보가 모두 입력된 후, 스마트 추천 및 검증
+            # 이후 동기 헬퍼들이 사용하는 시간 정규화 결과를 비동기로 미리 캐시
+            if profile.duration:
+                await self._anormalize_duration(str(profile.duration))
             missing_fields = [k for k in REQUIRED_KEYS if not getattr(profile, k)]
             if missing_fields:
                 # 누락 필드가 있으면 그 필드만 재질문(키워드 기반)
@@ -1797,6 +1889,7 @@ class MainAgentService:
                                 # 시간 변경 - 새로운 시간으로 카테고리 재생성
                                 new_duration = fallback_result[2] if len(fallback_result) > 2 else "4시간"
                                 profile.duration = new_duration
+                                await self._anormalize_duration(str(new_duration))
                                 
                                 # 장소 개수 파싱
                                 import re
@@ -1943,7 +2036,7 @@ class MainAgentService:
                         # GPT가 직접 장소 배치 JSON 생성
                         from services.gpt_location_processor import GPTLocationProcessor
                         if not hasattr(self, 'location_processor'):
-                            self.location_processor = GPTLocationProcessor(self.openai_api_key)
+                            self.location_processor = GPTLocationProcessor(self.openai_api_key, result_cache=get_llm_cache("location_clustering"))
                         
                         clustering_info = await self.location_processor.process_location_clustering(user_input, place_count)
                         
@@ -2,115 +2,88 @@
 RAG Agent와의 A2A 통신 클라이언트
 """
 
-import httpx
 import json
 import asyncio
 from typing import Dict, Any, Optional
 import os
 from dotenv import load_dotenv
 
+from services.agent_client import AgentClient, agent_client
+
 load_dotenv()
 
 class RagAgentClient:
     """RAG Agent와의 HTTP 통신 클라이언트"""
-    
-    def __init__(self, base_url: str = None, timeout: int = 30):
+
+    def __init__(self, base_url: str = None, timeout: int = 30, client: AgentClient = None):
         self.base_url = base_url or os.getenv("RAG_AGENT_URL", "http://localhost:8000")
         self.timeout = timeout
-        
+        # 호출마다 새 커넥션을 만들지 않고 공유 클라이언트 사용
+        self.client = client or agent_client
+
     async def health_check(self) -> Dict[str, Any]:
         """RAG Agent 헬스 체크"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(f"{self.base_url}/health")
-                return {
-                    "status": "healthy" if response.status_code == 200 else "unhealthy",
-                    "status_code": response.status_code,
-                    "response": response.json() if response.status_code == 200 else response.text
-                }
-            except Exception as e:
-                return {
-                    "status": "error",
-                    "error": str(e)
-                }
-    
+        try:
+            response = await self.client.request("rag", "GET", f"{self.base_url}/health", timeout=self.timeout)
+            return {
+                "status": "healthy" if response.status_code == 200 else "unhealthy",
+                "status_code": response.status_code,
+                "response": response.json() if response.status_code == 200 else response.text
+            }
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+
+    async def _post(self, path: str, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """RAG Agent POST 요청 공통 처리"""
+        try:
+            response = await self.client.request(
+                "rag", "POST", f"{self.base_url}{path}",
+                json=request_data, timeout=self.timeout
+            )
+
+            return {
+                "success": response.status_code == 200,
+                "status_code": response.status_code,
+                "data": response.json() if response.status_code == 200 else None,
+                "error": response.text if response.status_code != 200 else None
+            }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     async def search_places(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """장소 검색 요청"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/api/search/places",
-                    json=request_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                return {
-                    "success": response.status_code == 200,
-                    "status_code": response.status_code,
-                    "data": response.json() if response.status_code == 200 else None,
-                    "error": response.text if response.status_code != 200 else None
-                }
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-    
+        return await self._post("/api/search/places", request_data)
+
     async def generate_course(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """코스 생성 요청"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/api/course/generate",
-                    json=request_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                return {
-                    "success": response.status_code == 200,
-                    "status_code": response.status_code,
-                    "data": response.json() if response.status_code == 200 else None,
-                    "error": response.text if response.status_code != 200 else None
-                }
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
+        return await self._post("/api/course/generate", request_data)
 
     async def process_rag_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
         """전체 RAG 처리 요청 (실제 구현된 엔드포인트 사용)"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # RAG Agent의 실제 구현된 엔드포인트로 요청
-                response = await client.post(
-                    f"{self.base_url}/recommend-course",
-                    json=request_data,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                return {
-                    "success": response.status_code == 200,
-                    "status_code": response.status_code,
-                    "data": response.json() if response.status_code == 200 else None,
-                    "error": response.text if response.status_code != 200 else None
-                }
-                
-            except Exception as e:
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
+        # RAG Agent의 실제 구현된 엔드포인트로 요청
+        return await self._post("/recommend-course", request_data)
 
 # 동기 버전 (기존 코드 호환성용)
+# asyncio.run()마다 이벤트 루프가 새로 생기므로 루프 전용 클라이언트를 만들고 종료
+async def _run_with_temporary_client(method_name: str, *args, base_url: str = None) -> Dict[str, Any]:
+    transport = AgentClient()
+    try:
+        client = RagAgentClient(base_url, client=transport)
+        return await getattr(client, method_name)(*args)
+    finally:
+        await transport.aclose()
+
 def sync_health_check(base_url: str = None) -> Dict[str, Any]:
     """동기 헬스 체크"""
-    client = RagAgentClient(base_url)
-    return asyncio.run(client.health_check())
+    return asyncio.run(_run_with_temporary_client("health_check", base_url=base_url))
 
 def sync_process_rag_request(request_data: Dict[str, Any], base_url: str = None) -> Dict[str, Any]:
     """동기 RAG 요청 처리"""
-    client = RagAgentClient(base_url)
-    return asyncio.run(client.process_rag_request(request_data))
\ No newline at end of file
+    return asyncio.run(_run_with_temporary_client("process_rag_request", request_data, base_url=base_url))
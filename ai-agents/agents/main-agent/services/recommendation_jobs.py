@@ -0,0 +1,226 @@
+"""
+코스 추천 백그라운드 작업 큐
+- /chat/start-recommendation은 작업 ID만 즉시 반환하고, 워커 풀이 Place Agent → RAG 요청 생성 → RAG Agent 플로우를 실행
+- 동시에 실행되는 무거운 추천 플로우 수를 워커 수(RECOMMENDATION_WORKERS)로 제한
+- 클라이언트는 작업 상태를 폴링하거나 SSE로 단계별 진행 이벤트를 구독
+
+작업 상태는 세션 저장소(SESSION_STORE_URL)에 저장하므로 sqlite/redis면 다른 워커 프로세스에서도 조회할 수 있다.
+작업 상태는 요청의 session_scope()에 모으지 않고 (scoped=False) 갱신할 때마다 스레드에서 바로 저장한다.
+"""
+
+import asyncio
+import contextvars
+import datetime
+import os
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+from services.session_store import create_session_store
+
+load_dotenv()
+
+RECOMMENDATION_WORKERS = int(os.getenv("RECOMMENDATION_WORKERS", 4))
+RECOMMENDATION_QUEUE_SIZE = int(os.getenv("RECOMMENDATION_QUEUE_SIZE", 100))
+RECOMMENDATION_JOB_TTL_SECONDS = int(os.getenv("RECOMMENDATION_JOB_TTL_SECONDS", 3600))
+# 다른 프로세스에서 실행 중인 작업을 SSE로 구독할 때의 저장소 폴링 간격
+REMOTE_POLL_INTERVAL = 1.0
+
+FINISHED_STATUSES = ("completed", "failed")
+
+ProgressCallback = Callable[[str, str], Awaitable[None]]
+JobRunner = Callable[[str, ProgressCallback], Awaitable[Dict[str, Any]]]
+
+
+class QueueFullError(Exception):
+    """대기 중인 추천 작업이 너무 많음"""
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat() + "Z"
+
+
+class RecommendationJobQueue:
+    """추천 플로우 작업 큐 + 워커 풀"""
+
+    def __init__(self, runner: JobRunner = None, workers: int = RECOMMENDATION_WORKERS,
+                 max_queue: int = RECOMMENDATION_QUEUE_SIZE):
+        self.runner = runner
+        self.workers = workers
+        self.max_queue = max_queue
+        self.jobs = create_session_store("recommendation_jobs", ttl_seconds=RECOMMENDATION_JOB_TTL_SECONDS, scoped=False)
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers = []
+        self._conditions: Dict[str, asyncio.Condition] = {}  # 이 프로세스에서 실행하는 작업의 이벤트 알림
+        self._active_by_session: Dict[str, str] = {}  # session_id -> 진행 중인 job_id (중복 요청 방지)
+        self.running = 0
+
+    def start(self):
+        """워커 시작 (이벤트 루프 안에서 호출, 이미 실행 중이면 무시)"""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        loop = asyncio.get_running_loop()
+        # 요청 핸들러에서 처음 시작돼도 그 요청의 session_scope()를 물려받지 않도록 빈 컨텍스트에서 실행
+        self._workers = [contextvars.Context().run(loop.create_task, self._worker(i)) for i in range(self.workers)]
+        print(f"[RECOMMENDATION_JOBS] 워커 {self.workers}개 시작")
+
+    async def stop(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def submit(self, session_id: str) -> Dict[str, Any]:
+        """작업 등록 후 즉시 반환 (같은 세션의 작업이 진행 중이면 그 작업 반환)"""
+        self.start()
+        active_id = self._active_by_session.get(session_id)
+        if active_id:
+            active = await self.jobs.aget(active_id)
+            if active and active["status"] not in FINISHED_STATUSES:
+                return active
+
+        if self._queue.full():
+            raise QueueFullError(f"대기 중인 추천 작업이 {self.max_queue}개를 넘었습니다")
+
+        job_id = f"job_{uuid.uuid4().hex[:12]}"
+        now = _now()
+        job = {
+            "job_id": job_id,
+            "session_id": session_id,
+            "status": "queued",
+            "stage": "queued",
+            "events": [{"seq": 1, "stage": "queued", "message": "추천 작업이 대기열에 등록되었습니다", "at": now}],
+            "result": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        # 워커가 꺼내기 전에 저장소에 있어야 함
+        await self.jobs.aset(job_id, job)
+        self._conditions[job_id] = asyncio.Condition()
+        self._active_by_session[session_id] = job_id
+        self._queue.put_nowait(job_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.jobs.get(job_id)
+
+    async def aget(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.jobs.aget(job_id)
+
+    async def _release(self, job_id: str, session_id: str = None):
+        """작업 추적 정보 정리 + 대기 중인 구독자 깨우기"""
+        if session_id is None:
+            session_id = next((sid for sid, jid in self._active_by_session.items() if jid == job_id), None)
+        if session_id is not None and self._active_by_session.get(session_id) == job_id:
+            del self._active_by_session[session_id]
+        condition = self._conditions.pop(job_id, None)
+        if condition is not None:
+            async with condition:
+                condition.notify_all()
+
+    async def _update(self, job_id: str, stage: str, message: str, status: str = None,
+                      result: Dict[str, Any] = None):
+        """작업 상태 갱신 + 진행 이벤트 추가 + 구독자 알림"""
+        job = await self.jobs.aget(job_id)
+        if job is None:
+            return
+        now = _now()
+        job["stage"] = stage
+        if status:
+            job["status"] = status
+        if result is not None:
+            job["result"] = result
+        job["updated_at"] = now
+        job["events"].append({"seq": len(job["events"]) + 1, "stage": stage, "message": message, "at": now})
+        await self.jobs.aset(job_id, job)
+
+        condition = self._conditions.get(job_id)
+        if condition is not None:
+            async with condition:
+                condition.notify_all()
+
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self._queue.get()
+            job = await self.jobs.aget(job_id)
+            try:
+                if job is None:
+                    # 만료/삭제된 작업 - 대기 중인 요청이 멈추지 않도록 정리
+                    print(f"[WARNING] 추천 작업을 저장소에서 찾을 수 없음 ({job_id})")
+                    await self._release(job_id)
+                    continue
+                self.running += 1
+                await self._update(job_id, "started", "추천 플로우를 시작합니다", status="running")
+
+                async def progress(stage: str, message: str):
+                    await self._update(job_id, stage, message)
+
+                try:
+                    result = await self.runner(job["session_id"], progress)
+                except Exception as e:
+                    print(f"[ERROR] 추천 작업 실패 ({job_id}): {e}")
+                    result = {
+                        "success": False,
+                        "message": "추천 생성 중 예상치 못한 오류가 발생했습니다.",
+                        "error_code": "INTERNAL_ERROR",
+                        "error_details": {"error_type": type(e).__name__, "error_message": str(e)},
+                    }
+                if result.get("success"):
+                    await self._update(job_id, "completed", "데이트 코스 추천이 완료되었습니다", status="completed", result=result)
+                else:
+                    await self._update(job_id, "failed", result.get("message", "추천 생성에 실패했습니다"), status="failed", result=result)
+            finally:
+                if job is not None:
+                    self.running -= 1
+                    await self._release(job_id, job["session_id"])
+                self._queue.task_done()
+
+    async def wait(self, job_id: str, timeout: float = None) -> Optional[Dict[str, Any]]:
+        """작업이 끝날 때까지 대기 후 최종 상태 반환"""
+        final = None
+
+        async def _consume():
+            nonlocal final
+            async for _ in self.events(job_id):
+                pass
+            final = await self.jobs.aget(job_id)
+
+        await asyncio.wait_for(_consume(), timeout)
+        return final
+
+    async def events(self, job_id: str, after_seq: int = 0) -> AsyncIterator[Dict[str, Any]]:
+        """진행 이벤트 스트림 (after_seq 이후 이벤트부터, 작업 종료 시 끝남)"""
+        seen = after_seq
+        while True:
+            job = await self.jobs.aget(job_id)
+            if job is None:
+                return
+            for event in job["events"][seen:]:
+                yield event
+            seen = len(job["events"])
+            if job["status"] in FINISHED_STATUSES:
+                return
+
+            condition = self._conditions.get(job_id)
+            if condition is None:
+                # 다른 프로세스가 실행 중인 작업 - 저장소 폴링
+                await asyncio.sleep(REMOTE_POLL_INTERVAL)
+                continue
+            async with condition:
+                job = await self.jobs.aget(job_id)
+                if job is not None and len(job["events"]) == seen and job["status"] not in FINISHED_STATUSES:
+                    await condition.wait()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+        }
+
+
+job_queue = RecommendationJobQueue()
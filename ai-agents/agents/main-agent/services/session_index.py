@@ -0,0 +1,324 @@
+"""
+사용자별 세션 목록 보조 인덱스
+- user_id -> 마지막 활동 시각 역순으로 정렬된 session_id
+- 세션 생성/갱신/삭제 시 갱신, 커서 기반 페이지네이션으로 전체 세션 수와 무관하게 O(페이지 크기) 조회
+- 세션 저장소와 같은 SESSION_STORE_URL 백엔드(memory/sqlite/redis) 사용
+- memory 인덱스는 세션 저장소에서 LRU/TTL로 밀려난 세션을 함께 제거 (인덱스 크기 <= 저장소 크기)
+- async 코드에서는 a* 메서드 사용 (sqlite/redis는 스레드에서, memory는 루프에서 바로 실행)
+"""
+
+import asyncio
+import base64
+import bisect
+import datetime
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from services.session_store import (
+    SESSION_STORE_URL, MemorySessionStore, RedisBackend, SessionStore, SQLiteBackend, _get_backend
+)
+
+ALL_STATUS = "all"
+
+
+def activity_score(timestamp: Optional[str]) -> float:
+    """ISO 시각 문자열(끝의 Z 허용)을 정렬용 epoch 초로 변환"""
+    if not timestamp:
+        return 0.0
+    try:
+        return datetime.datetime.fromisoformat(timestamp.rstrip("Z")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def encode_cursor(score: float, session_id: str) -> str:
+    """페이지 마지막 항목 (score, session_id)를 불투명 커서 문자열로 변환"""
+    raw = json.dumps([score, session_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """encode_cursor()의 역변환 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, session_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(score), str(session_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+class SessionIndex:
+    """사용자별 세션 인덱스 인터페이스"""
+
+    # 백엔드 I/O가 있으면 async 메서드를 스레드에서 실행
+    blocking_io = True
+
+    def upsert(self, user_id: str, session_id: str, status: str, last_activity_at: str) -> None:
+        raise NotImplementedError
+
+    def remove(self, user_id: str, session_id: str) -> None:
+        raise NotImplementedError
+
+    def page(self, user_id: str, status: str = ALL_STATUS, limit: int = 10,
+             cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        """
+        최근 활동 순 session_id 한 페이지 조회
+
+        Args:
+            cursor: 이전 페이지의 next_cursor (지정 시 offset 무시)
+            offset: 커서 없이 조회할 때 건너뛸 개수 (하위 호환)
+
+        Returns:
+            (session_id 리스트, 다음 페이지 커서 또는 None)
+        """
+        raise NotImplementedError
+
+    def count(self, user_id: str, status: str = ALL_STATUS) -> int:
+        raise NotImplementedError
+
+    def upsert_session(self, session: Dict[str, Any]) -> None:
+        """세션 dict(user_id, session_id, session_status, last_activity_at)로 인덱스 갱신"""
+        self.upsert(session["user_id"], session["session_id"],
+                    session.get("session_status", "ACTIVE"), session.get("last_activity_at"))
+
+    async def _call(self, func, *args):
+        if self.blocking_io:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    async def apage(self, user_id: str, status: str = ALL_STATUS, limit: int = 10,
+                    cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        return await self._call(self.page, user_id, status, limit, cursor, offset)
+
+    async def acount(self, user_id: str, status: str = ALL_STATUS) -> int:
+        return await self._call(self.count, user_id, status)
+
+    async def aremove(self, user_id: str, session_id: str) -> None:
+        await self._call(self.remove, user_id, session_id)
+
+    async def aupsert_session(self, session: Dict[str, Any]) -> None:
+        await self._call(self.upsert_session, session)
+
+
+class MemorySessionIndex(SessionIndex):
+    """프로세스 내 인덱스: (user_id, status)별 (-score, session_id) 정렬 리스트"""
+
+    blocking_io = False
+
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, Tuple[float, str]]] = {}  # user_id -> {session_id: (score, status)}
+        self._sorted: Dict[Tuple[str, str], List[Tuple[float, str]]] = {}
+
+    def _insert(self, user_id: str, status: str, key: Tuple[float, str]):
+        bisect.insort(self._sorted.setdefault((user_id, status), []), key)
+
+    def _discard(self, user_id: str, status: str, key: Tuple[float, str]):
+        entries = self._sorted.get((user_id, status))
+        if not entries:
+            return
+        pos = bisect.bisect_left(entries, key)
+        if pos < len(entries) and entries[pos] == key:
+            entries.pop(pos)
+        if not entries:
+            del self._sorted[(user_id, status)]
+
+    def upsert(self, user_id: str, session_id: str, status: str, last_activity_at: str) -> None:
+        score = activity_score(last_activity_at)
+        user_entries = self._entries.setdefault(user_id, {})
+        previous = user_entries.get(session_id)
+        if previous == (score, status):
+            return
+        if previous is not None:
+            self._remove_entry(user_id, session_id, previous)
+        user_entries[session_id] = (score, status)
+        # 내림차순 정렬을 위해 -score 사용, 동점은 session_id 오름차순
+        key = (-score, session_id)
+        self._insert(user_id, ALL_STATUS, key)
+        self._insert(user_id, status, key)
+
+    def _remove_entry(self, user_id: str, session_id: str, entry: Tuple[float, str]):
+        score, status = entry
+        key = (-score, session_id)
+        self._discard(user_id, ALL_STATUS, key)
+        self._discard(user_id, status, key)
+
+    def remove(self, user_id: str, session_id: str) -> None:
+        user_entries = self._entries.get(user_id, {})
+        entry = user_entries.pop(session_id, None)
+        if entry is not None:
+            self._remove_entry(user_id, session_id, entry)
+        if not user_entries:
+            self._entries.pop(user_id, None)
+
+    def page(self, user_id: str, status: str = ALL_STATUS, limit: int = 10,
+             cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        entries = self._sorted.get((user_id, status), [])
+        if cursor:
+            score, session_id = decode_cursor(cursor)
+            start = bisect.bisect_right(entries, (-score, session_id))
+        else:
+            start = offset
+        window = entries[start:start + limit + 1]
+        items = [session_id for _, session_id in window[:limit]]
+        next_cursor = None
+        if len(window) > limit:
+            last_neg_score, last_id = window[limit - 1]
+            next_cursor = encode_cursor(-last_neg_score, last_id)
+        return items, next_cursor
+
+    def count(self, user_id: str, status: str = ALL_STATUS) -> int:
+        return len(self._sorted.get((user_id, status), []))
+
+
+class SQLiteSessionIndex(SessionIndex):
+    """SQLite 인덱스 테이블 (세션 저장소와 같은 파일/커넥션 사용)"""
+
+    def __init__(self, backend: SQLiteBackend):
+        self.backend = backend
+        with backend._lock:
+            backend._conn.execute(
+                "CREATE TABLE IF NOT EXISTS session_index ("
+                " session_id TEXT PRIMARY KEY, user_id TEXT NOT NULL, status TEXT NOT NULL, last_activity REAL NOT NULL)"
+            )
+            backend._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_session_index_user_activity"
+                " ON session_index(user_id, last_activity DESC, session_id)"
+            )
+            backend._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_session_index_user_status_activity"
+                " ON session_index(user_id, status, last_activity DESC, session_id)"
+            )
+
+    def upsert(self, user_id: str, session_id: str, status: str, last_activity_at: str) -> None:
+        with self.backend._lock:
+            self.backend._conn.execute(
+                "INSERT INTO session_index (session_id, user_id, status, last_activity) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET user_id = excluded.user_id, status = excluded.status, "
+                "last_activity = excluded.last_activity",
+                (session_id, user_id, status, activity_score(last_activity_at))
+            )
+
+    def remove(self, user_id: str, session_id: str) -> None:
+        with self.backend._lock:
+            self.backend._conn.execute("DELETE FROM session_index WHERE session_id = ?", (session_id,))
+
+    def page(self, user_id: str, status: str = ALL_STATUS, limit: int = 10,
+             cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        where = ["user_id = ?"]
+        params: List[Any] = [user_id]
+        if status != ALL_STATUS:
+            where.append("status = ?")
+            params.append(status)
+        if cursor:
+            score, session_id = decode_cursor(cursor)
+            where.append("(last_activity < ? OR (last_activity = ? AND session_id > ?))")
+            params.extend([score, score, session_id])
+            offset = 0
+        sql = (f"SELECT session_id, last_activity FROM session_index WHERE {' AND '.join(where)} "
+               "ORDER BY last_activity DESC, session_id ASC LIMIT ? OFFSET ?")
+        params.extend([limit + 1, offset])
+        with self.backend._lock:
+            rows = self.backend._conn.execute(sql, params).fetchall()
+        items = [row[0] for row in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1][1], rows[limit - 1][0]) if len(rows) > limit else None
+        return items, next_cursor
+
+    def count(self, user_id: str, status: str = ALL_STATUS) -> int:
+        with self.backend._lock:
+            if status == ALL_STATUS:
+                row = self.backend._conn.execute(
+                    "SELECT COUNT(*) FROM session_index WHERE user_id = ?", (user_id,)).fetchone()
+            else:
+                row = self.backend._conn.execute(
+                    "SELECT COUNT(*) FROM session_index WHERE user_id = ? AND status = ?", (user_id, status)).fetchone()
+        return row[0]
+
+
+class RedisSessionIndex(SessionIndex):
+    """Redis 정렬 집합 인덱스: 사용자/상태별 ZSET(score=마지막 활동 시각) + 세션별 상태 해시"""
+
+    def __init__(self, backend: RedisBackend):
+        self.client = backend.client
+        self.prefix = backend.key_prefix + "session_index:"
+
+    def _zkey(self, user_id: str, status: str) -> str:
+        return f"{self.prefix}{user_id}:{status}"
+
+    def _status_key(self, user_id: str) -> str:
+        return f"{self.prefix}{user_id}:status"
+
+    def upsert(self, user_id: str, session_id: str, status: str, last_activity_at: str) -> None:
+        previous = self.client.hget(self._status_key(user_id), session_id)
+        previous = previous.decode("utf-8") if isinstance(previous, bytes) else previous
+        score = activity_score(last_activity_at)
+        pipe = self.client.pipeline()
+        if previous and previous != status:
+            pipe.zrem(self._zkey(user_id, previous), session_id)
+        pipe.hset(self._status_key(user_id), session_id, status)
+        pipe.zadd(self._zkey(user_id, ALL_STATUS), {session_id: score})
+        pipe.zadd(self._zkey(user_id, status), {session_id: score})
+        pipe.execute()
+
+    def remove(self, user_id: str, session_id: str) -> None:
+        status = self.client.hget(self._status_key(user_id), session_id)
+        status = status.decode("utf-8") if isinstance(status, bytes) else status
+        pipe = self.client.pipeline()
+        pipe.hdel(self._status_key(user_id), session_id)
+        pipe.zrem(self._zkey(user_id, ALL_STATUS), session_id)
+        if status:
+            pipe.zrem(self._zkey(user_id, status), session_id)
+        pipe.execute()
+
+    def page(self, user_id: str, status: str = ALL_STATUS, limit: int = 10,
+             cursor: Optional[str] = None, offset: int = 0) -> Tuple[List[str], Optional[str]]:
+        key = self._zkey(user_id, status)
+        start = offset
+        if cursor:
+            score, session_id = decode_cursor(cursor)
+            # 커서 항목이 그대로면 그 순위 다음부터, 이후 갱신되어 이동했으면 점수 기준으로 이어서 조회
+            current = self.client.zscore(key, session_id)
+            rank = self.client.zrevrank(key, session_id) if current is not None and float(current) == score else None
+            if rank is not None:
+                start = rank + 1
+            else:
+                # 같은 점수는 zrevrange 순서(멤버 역순)대로 커서 멤버 뒤의 항목만 이어서 조회
+                ties = int(self.client.zcount(key, score, score))
+                rows = self.client.zrevrangebyscore(key, score, "-inf", start=0, num=limit + 1 + ties, withscores=True)
+                rows = [(member, member_score) for member, member_score in rows
+                        if float(member_score) < score or self._member(member) < session_id]
+                return self._to_page(rows[:limit + 1], limit)
+        rows = self.client.zrevrange(key, start, start + limit, withscores=True)
+        return self._to_page(rows, limit)
+
+    @staticmethod
+    def _member(member) -> str:
+        return member.decode("utf-8") if isinstance(member, bytes) else member
+
+    def _to_page(self, rows, limit: int) -> Tuple[List[str], Optional[str]]:
+        rows = [(self._member(member), float(score)) for member, score in rows]
+        items = [member for member, _ in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1][1], rows[limit - 1][0]) if len(rows) > limit else None
+        return items, next_cursor
+
+    def count(self, user_id: str, status: str = ALL_STATUS) -> int:
+        return int(self.client.zcard(self._zkey(user_id, status)))
+
+
+def create_session_index(url: str = None, sessions: SessionStore = None) -> SessionIndex:
+    """
+    세션 저장소와 같은 백엔드의 사용자별 세션 인덱스 생성
+
+    Args:
+        url: 백엔드 URL (미지정 시 SESSION_STORE_URL)
+        sessions: memory 백엔드일 때 이 저장소에서 밀려난 세션을 인덱스에서도 제거
+    """
+    url = url or SESSION_STORE_URL
+    if url == "memory":
+        index = MemorySessionIndex()
+        if isinstance(sessions, MemorySessionStore):
+            sessions.on_evict = lambda session_id, session: index.remove(session["user_id"], session_id)
+        return index
+    backend = _get_backend(url)
+    if isinstance(backend, SQLiteBackend):
+        return SQLiteSessionIndex(backend)
+    return RedisSessionIndex(backend)
@@ -0,0 +1,573 @@
+"""
+세션 상태 저장소
+- SESSION_INFO / SESSIONS / MESSAGES / 대화 메모리(ConversationMemory)를 같은 인터페이스(dict 호환)로 저장
+- memory: 프로세스 내 LRU + TTL (기본값)
+- sqlite:///경로, redis://호스트:포트/DB: 여러 워커가 공유하는 영속 저장소
+
+SESSION_STORE_URL 환경변수로 백엔드를 선택한다.
+영속 백엔드는 꺼낸 객체를 그대로 수정하는 기존 코드 패턴을 지원하기 위해
+요청 처리 중 꺼낸 객체를 로컬에 보관하고, commit() 시 직렬화해 저장한다.
+
+이벤트 루프 블로킹 방지 (영속 백엔드):
+- async 코드에서는 aget/apop/acommit을 사용한다 (SQLite/Redis 호출을 asyncio.to_thread로 실행)
+- session_scope() 안에서는 꺼낸 값을 턴이 끝날 때까지 고정하고, 동기 쓰기(store[key] = value,
+  commit)는 모아 두었다가 스코프 종료 시 스레드에서 한 번에 저장한다.
+  대화 흐름 중간의 SESSION_INFO[...] = ... 같은 동기 코드는 그대로 두어도 루프에서 I/O가 일어나지 않는다.
+- 다른 태스크/프로세스가 바로 읽어야 하는 값(추천 작업 상태)은 scoped=False 저장소에 aget/aset으로 바로 저장한다.
+- 동기 엔드포인트(def)는 FastAPI가 스레드풀에서 실행하므로 동기 접근을 그대로 사용한다.
+- memory 백엔드는 I/O가 없으므로 async 메서드도 바로 실행한다.
+"""
+
+import asyncio
+import functools
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from dotenv import load_dotenv
+from pydantic import BaseModel
+
+from models.request_models import UserProfile, LocationRequest
+from models.smart_models import CategoryRecommendation
+from core.conversation_memory import ConversationMemory
+
+load_dotenv()
+
+SESSION_STORE_URL = os.getenv("SESSION_STORE_URL", "memory")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 86400))
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", 10000))
+
+# 이 크기 이상의 직렬화 결과만 압축
+COMPRESS_THRESHOLD = 512
+
+# 직렬화 시 타입을 보존할 Pydantic 모델
+_MODEL_REGISTRY = {
+    model.__name__: model for model in (UserProfile, LocationRequest, CategoryRecommendation, ConversationMemory)
+}
+
+
+# ---------------------------------------------------------------------------
+# 직렬화
+# ---------------------------------------------------------------------------
+
+def _encode(value: Any) -> Any:
+    """Pydantic 모델을 {"__m": 모델명, "d": 기본값 제외 필드}로 변환"""
+    if isinstance(value, BaseModel):
+        name = type(value).__name__
+        data = value.model_dump(exclude_defaults=True, warnings=False)
+        if name in _MODEL_REGISTRY:
+            return {"__m": name, "d": _encode(data)}
+        return _encode(data)
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_encode(v) for v in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        model_name = value.get("__m")
+        if model_name in _MODEL_REGISTRY and len(value) == 2:
+            # 대화 중 검증 없이 setattr된 값(예: "3개")을 그대로 복원하기 위해 검증 생략
+            return _MODEL_REGISTRY[model_name].model_construct(**_decode(value["d"]))
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def dumps(value: Any) -> bytes:
+    """세션 값 직렬화 (compact JSON, 큰 값은 zlib 압축)"""
+    raw = json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    if len(raw) >= COMPRESS_THRESHOLD:
+        return b"z" + zlib.compress(raw, 6)
+    return b"j" + raw
+
+
+def loads(payload: bytes) -> Any:
+    """dumps()의 역변환"""
+    kind, body = payload[:1], payload[1:]
+    if kind == b"z":
+        body = zlib.decompress(body)
+    return _decode(json.loads(body.decode("utf-8")))
+
+
+# ---------------------------------------------------------------------------
+# 요청 단위 쓰기 스코프
+# ---------------------------------------------------------------------------
+
+class _WriteScope:
+    """한 턴 동안 영속 저장소에서 꺼낸/저장한 값 ((id(store), key) -> (store, value))"""
+
+    def __init__(self):
+        self.values: Dict[Tuple[int, str], Tuple["PersistentSessionStore", Any]] = {}
+        self.dirty: set = set()
+        self.closed = False
+
+    def flush(self) -> None:
+        for entry in list(self.dirty):
+            store, value = self.values[entry]
+            store._write(entry[1], value)
+            self.dirty.discard(entry)
+
+
+_current_scope: ContextVar[Optional[_WriteScope]] = ContextVar("session_write_scope", default=None)
+
+
+def _active_scope() -> Optional[_WriteScope]:
+    # 스코프가 끝난 뒤에도 남아 있는 백그라운드 태스크(컨텍스트 복사본)는 바로 저장
+    scope = _current_scope.get()
+    return scope if scope is not None and not scope.closed else None
+
+
+@asynccontextmanager
+async def session_scope():
+    """요청 한 턴 동안의 영속 저장소 쓰기를 모아 스코프 종료 시 스레드에서 저장 (중첩 시 바깥 스코프 사용)"""
+    if _active_scope() is not None:
+        yield
+        return
+    scope = _WriteScope()
+    token = _current_scope.set(scope)
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+        scope.closed = True
+        if scope.dirty:
+            await asyncio.to_thread(scope.flush)
+
+
+def session_scoped(func):
+    """async 엔드포인트를 session_scope()로 감싸는 데코레이터"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with session_scope():
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# 저장소 인터페이스
+# ---------------------------------------------------------------------------
+
+class SessionStore(MutableMapping):
+    """세션 저장소 공통 인터페이스 (dict 호환)"""
+
+    def commit(self, key: str) -> None:
+        """요청 처리 중 수정한 값을 저장소에 반영"""
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """조회만 (LRU 순서/만료 시간을 갱신하지 않음, 목록 화면용)"""
+        return self.get(key, default)
+
+    def purge_expired(self) -> int:
+        """만료된 항목 정리 (정리한 개수)"""
+        return 0
+
+    async def apeek(self, key: str, default: Any = None) -> Any:
+        return self.peek(key, default)
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        return self.get(key, default)
+
+    async def aset(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    async def apop(self, key: str, default: Any = None) -> Any:
+        return self.pop(key, default)
+
+    async def acommit(self, key: str) -> None:
+        self.commit(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__, "size": len(self)}
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 내 LRU + TTL 저장소 (마지막 접근 기준 만료)"""
+
+    def __init__(self, max_entries: int = SESSION_MAX_ENTRIES, ttl_seconds: float = SESSION_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.evicted = 0
+        # LRU/TTL로 밀려난 항목 알림 (key, value) - 세션 인덱스 정리용
+        self.on_evict: Optional[Callable[[str, Any], None]] = None
+
+    def _expired(self, expires_at: float) -> bool:
+        return expires_at <= time.monotonic()
+
+    def _evicted(self, key: str, value: Any) -> None:
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        expires_at, value = self._data[key]
+        if self._expired(expires_at):
+            del self._data[key]
+            self._evicted(key, value)
+            raise KeyError(key)
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        self.purge_expired()
+        while len(self._data) > self.max_entries:
+            evicted_key, (_, evicted_value) = self._data.popitem(last=False)
+            self.evicted += 1
+            self._evicted(evicted_key, evicted_value)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        now = time.monotonic()
+        return iter([key for key, (expires_at, _) in self._data.items() if expires_at > now])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def commit(self, key: str) -> None:
+        # 같은 객체를 그대로 보관하므로 만료 시간만 갱신
+        if key in self._data:
+            self[key]
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None or self._expired(item[0]):
+            return default
+        return item[1]
+
+    def purge_expired(self) -> int:
+        # 접근 순서 = 만료 순서 (TTL이 같으므로) - 앞에서부터 만료된 항목만 제거
+        purged = 0
+        while self._data:
+            key, (expires_at, value) = next(iter(self._data.items()))
+            if not self._expired(expires_at):
+                break
+            del self._data[key]
+            purged += 1
+            self._evicted(key, value)
+        return purged
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "size": len(self._data), "max_entries": self.max_entries, "evicted": self.evicted}
+
+
+class PersistentSessionStore(SessionStore):
+    """
+    직렬화 백엔드(SQLite/Redis) 위의 저장소
+
+    꺼낸 객체는 버전과 함께 로컬에 보관하고, 다른 워커가 갱신해 버전이 바뀌었으면 다시 읽는다.
+    """
+
+    def __init__(self, backend: "KeyValueBackend", namespace: str,
+                 ttl_seconds: float = SESSION_TTL_SECONDS, live_cache_size: int = 1024, scoped: bool = True):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.live_cache_size = live_cache_size
+        self.scoped = scoped  # False면 session_scope() 안에서도 바로 저장 (다른 태스크/프로세스가 곧바로 읽는 값)
+        self._live: "OrderedDict[str, Tuple[int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()  # async 메서드가 스레드에서 _live를 갱신
+        self.load_count = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _scope(self) -> Optional[_WriteScope]:
+        return _active_scope() if self.scoped else None
+
+    def _read(self, key: str) -> Any:
+        version = self.backend.version(self._key(key))
+        if version is None:
+            with self._lock:
+                self._live.pop(key, None)
+            raise KeyError(key)
+        with self._lock:
+            live = self._live.get(key)
+            if live is not None and live[0] == version:
+                self._live.move_to_end(key)
+                return live[1]
+        loaded = self.backend.get(self._key(key))
+        if loaded is None:
+            raise KeyError(key)
+        version, payload = loaded
+        value = loads(payload)
+        self.load_count += 1
+        self._remember(key, version, value)
+        return value
+
+    def _write(self, key: str, value: Any) -> None:
+        version = self.backend.set(self._key(key), dumps(value), self.ttl_seconds)
+        self._remember(key, version, value)
+
+    def __getitem__(self, key: str) -> Any:
+        scope = self._scope()
+        if scope is not None and (id(self), key) in scope.values:
+            return scope.values[(id(self), key)][1]
+        value = self._read(key)
+        if scope is not None:
+            scope.values[(id(self), key)] = (self, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        scope = self._scope()
+        if scope is not None:
+            scope.values[(id(self), key)] = (self, value)
+            scope.dirty.add((id(self), key))
+            return
+        self._write(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        scope = self._scope()
+        if scope is not None:
+            scope.values.pop((id(self), key), None)
+            scope.dirty.discard((id(self), key))
+        with self._lock:
+            self._live.pop(key, None)
+        if not self.backend.delete(self._key(key)):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        prefix = f"{self.namespace}:"
+        return (key[len(prefix):] for key in self.backend.keys(prefix))
+
+    def __len__(self) -> int:
+        return self.backend.count(f"{self.namespace}:")
+
+    def __contains__(self, key: object) -> bool:
+        scope = self._scope()
+        if scope is not None and (id(self), str(key)) in scope.values:
+            return True
+        return self.backend.version(self._key(str(key))) is not None
+
+    def _remember(self, key: str, version: int, value: Any) -> None:
+        with self._lock:
+            self._live[key] = (version, value)
+            self._live.move_to_end(key)
+            while len(self._live) > self.live_cache_size:
+                self._live.popitem(last=False)
+
+    def commit(self, key: str) -> None:
+        scope = self._scope()
+        if scope is not None and (id(self), key) in scope.values:
+            scope.dirty.add((id(self), key))
+            return
+        with self._lock:
+            live = self._live.get(key)
+        if live is not None:
+            self._write(key, live[1])
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.__setitem__, key, value)
+
+    async def apeek(self, key: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self.peek, key, default)
+
+    async def apop(self, key: str, default: Any = None) -> Any:
+        return await asyncio.to_thread(self.pop, key, default)
+
+    async def acommit(self, key: str) -> None:
+        """스코프 안에서도 바로 저장 (다른 워커/인덱스가 곧바로 읽어야 하는 경우)"""
+        scope = self._scope()
+        entry = scope.values.get((id(self), key)) if scope is not None else None
+        if entry is not None:
+            scope.dirty.discard((id(self), key))
+            await asyncio.to_thread(self._write, key, entry[1])
+            return
+        await asyncio.to_thread(self.commit, key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self.backend).__name__, "namespace": self.namespace,
+                "live_cached": len(self._live), "loads": self.load_count}
+
+
+# ---------------------------------------------------------------------------
+# 직렬화 백엔드
+# ---------------------------------------------------------------------------
+
+class KeyValueBackend:
+    """버전 관리되는 bytes 저장소 인터페이스"""
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        raise NotImplementedError
+
+    def version(self, key: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> int:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def keys(self, prefix: str) -> Iterator[str]:
+        raise NotImplementedError
+
+    def count(self, prefix: str) -> int:
+        return sum(1 for _ in self.keys(prefix))
+
+
+class SQLiteBackend(KeyValueBackend):
+    """SQLite 파일 백엔드 (같은 호스트의 여러 워커가 공유)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_store ("
+            " key TEXT PRIMARY KEY, version INTEGER NOT NULL, expires_at REAL NOT NULL, payload BLOB NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_session_store_expires ON session_store(expires_at)")
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, payload FROM session_store WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def version(self, key: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM session_store WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "INSERT INTO session_store (key, version, expires_at, payload) VALUES (?, 1, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET version = version + 1, expires_at = excluded.expires_at, "
+                "payload = excluded.payload RETURNING version",
+                (key, time.time() + ttl_seconds, payload)
+            ).fetchone()
+        return row[0]
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM session_store WHERE key = ?", (key,))
+        return cursor.rowcount > 0
+
+    def keys(self, prefix: str) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM session_store WHERE key >= ? AND key < ? AND expires_at > ?",
+                (prefix, prefix + "\uffff", time.time())
+            ).fetchall()
+        return iter([row[0] for row in rows])
+
+    def count(self, prefix: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*) FROM session_store WHERE key >= ? AND key < ? AND expires_at > ?",
+                (prefix, prefix + "\uffff", time.time())
+            ).fetchone()
+        return row[0]
+
+    def purge_expired(self) -> int:
+        """만료된 행 삭제"""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM session_store WHERE expires_at <= ?", (time.time(),))
+        return cursor.rowcount
+
+
+class RedisBackend(KeyValueBackend):
+    """
+    Redis 백엔드 (여러 호스트의 워커가 공유)
+
+    redis-py 호환 클라이언트(hget/hgetall/hincrby/hset/expire/delete/scan_iter/pipeline)면
+    무엇이든 사용할 수 있다. 키마다 해시(v: 버전, p: 직렬화 값)로 저장하고 TTL은 Redis가 관리한다.
+    """
+
+    def __init__(self, client, key_prefix: str = "main-agent:"):
+        self.client = client
+        self.key_prefix = key_prefix
+
+    def get(self, key: str) -> Optional[Tuple[int, bytes]]:
+        data = self.client.hgetall(self.key_prefix + key)
+        if not data or b"p" not in data:
+            return None
+        return int(data[b"v"]), data[b"p"]
+
+    def version(self, key: str) -> Optional[int]:
+        version = self.client.hget(self.key_prefix + key, "v")
+        return int(version) if version is not None else None
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> int:
+        full_key = self.key_prefix + key
+        pipe = self.client.pipeline()
+        pipe.hincrby(full_key, "v", 1)
+        pipe.hset(full_key, "p", payload)
+        pipe.expire(full_key, int(ttl_seconds))
+        version, _, _ = pipe.execute()
+        return int(version)
+
+    def delete(self, key: str) -> bool:
+        return bool(self.client.delete(self.key_prefix + key))
+
+    def keys(self, prefix: str) -> Iterator[str]:
+        skip = len(self.key_prefix)
+        for key in self.client.scan_iter(match=f"{self.key_prefix}{prefix}*"):
+            key = key.decode("utf-8") if isinstance(key, bytes) else key
+            yield key[skip:]
+
+
+# ---------------------------------------------------------------------------
+# 팩토리
+# ---------------------------------------------------------------------------
+
+_backends: Dict[str, KeyValueBackend] = {}
+
+
+def _get_backend(url: str) -> KeyValueBackend:
+    """URL별 공유 백엔드 (프로세스당 URL마다 1개)"""
+    if url not in _backends:
+        if url.startswith("sqlite:///"):
+            _backends[url] = SQLiteBackend(url[len("sqlite:///"):])
+        elif url.startswith("redis://") or url.startswith("rediss://"):
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError("SESSION_STORE_URL이 redis://인 경우 redis 패키지가 필요합니다 (pip install redis)") from e
+            _backends[url] = RedisBackend(redis.Redis.from_url(url))
+        else:
+            raise ValueError(f"지원하지 않는 SESSION_STORE_URL: {url}")
+    return _backends[url]
+
+
+def create_session_store(namespace: str, url: str = None, max_entries: int = SESSION_MAX_ENTRIES,
+                         ttl_seconds: float = SESSION_TTL_SECONDS, scoped: bool = True) -> SessionStore:
+    """
+    네임스페이스별 세션 저장소 생성
+
+    Args:
+        namespace: 저장소 구분 이름 (예: "session_info", "sessions", "messages")
+        url: 백엔드 URL (미지정 시 SESSION_STORE_URL, 기본 "memory")
+        max_entries: memory 백엔드의 최대 세션 수
+        ttl_seconds: 마지막 갱신 이후 만료 시간
+        scoped: False면 session_scope()로 쓰기를 모으지 않음 (작업 상태처럼 다른 태스크가 바로 읽어야 하는 값)
+    """
+    url = url or SESSION_STORE_URL
+    if url == "memory":
+        return MemorySessionStore(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    return PersistentSessionStore(_get_backend(url), namespace, ttl_seconds=ttl_seconds, scoped=scoped)
@@ -1,11 +1,14 @@
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage
 import json
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from models.smart_models import CategoryRecommendation
+from services.category_archetypes import archetype_key, category_archetypes
+from services.intelligent_category_generator import IntelligentCategoryGenerator
 
 class SmartCategoryRecommender:
     def __init__(self, openai_api_key: str):
+        self.openai_api_key = openai_api_key
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.2, openai_api_key=openai_api_key)
         self.categories = ["문화시설", "쇼핑", "술집", "야외활동",
                           "엔터테인먼트", "음식점", "카페", "휴식시설"]
@@ -23,11 +26,21 @@ class SmartCategoryRecommender:
                 # 제약 위반 시 예외 발생시켜서 사용자에게 선택권 제공
                 raise ValueError(f"CONSTRAINT_VIOLATION:{constraint_result['message']}")
 
+        # 같은 유형의 추천이 테이블에 있으면 LLM 호출 없이 사용
+        key = archetype_key(profile_data, place_count)
+        cached = await category_archetypes.alookup(key) if key is not None else None
+        if cached is not None:
+            recommendations, stale = cached
+            if stale:
+                category_archetypes.schedule_refresh(key, self._regenerate_archetype)
+            print(f"[SMART_CATEGORY] 유형 테이블 사용: {key}")
+            return recommendations
+
         # 필수 데이터만 추출 (빈 값 제거)
         essential_data = {}
-        for key, value in profile_data.items():
+        for field, value in profile_data.items():
             if value and value != '' and value != [] and value != None:
-                essential_data[key] = value
+                essential_data[field] = value
         
         prompt = f"""
         당신은 전문 데이트 코스 추천사입니다. 
@@ -70,6 +83,9 @@ class SmartCategoryRecommender:
             
             recommendations = [CategoryRecommendation(**rec) for rec in data["recommendations"]]
             print(f"[SMART_CATEGORY] 추천 생성 성공: {len(recommendations)}개")
+            if key is not None:
+                # 개인화된 결과는 공유하지 않고, 유형 대표 프로필로 만든 추천을 백그라운드에서 테이블에 저장
+                category_archetypes.schedule_refresh(key, self._regenerate_archetype)
             return recommendations
             
         except Exception as e:
@@ -78,6 +94,9 @@ class SmartCategoryRecommender:
             # 기본 추천 반환
             return self._get_default_recommendations(place_count)
     
+    async def _regenerate_archetype(self, key: tuple) -> Optional[List[CategoryRecommendation]]:
+        return await IntelligentCategoryGenerator(self.openai_api_key).generate_for_archetype(key)
+
     def _check_time_place_constraints(self, duration: str, place_count: int) -> dict:
         """시간-장소 제약 검증 - GPT 기반 재확인 메시지 생성"""
         try:
@@ -0,0 +1,88 @@
+import fnmatch
+
+class FakeRedis:
+    """RedisBackend/RedisSessionIndex가 쓰는 명령만 구현한 dict 기반 redis-py 대역 (응답은 bytes)"""
+
+    def __init__(self):
+        self.data = {}
+        self.zsets = {}
+        self.ttls = {}
+
+    # 해시
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(field.encode())
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hincrby(self, key, field, amount):
+        fields = self.data.setdefault(key, {})
+        value = int(fields.get(field.encode(), b"0")) + amount
+        fields[field.encode()] = str(value).encode()
+        return value
+
+    def hset(self, key, field, value):
+        value = value.encode() if isinstance(value, str) else value
+        self.data.setdefault(key, {})[field.encode()] = value
+        return 1
+
+    def hdel(self, key, field):
+        return 1 if self.data.get(key, {}).pop(field.encode(), None) is not None else 0
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return True
+
+    def delete(self, key):
+        self.ttls.pop(key, None)
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    def scan_iter(self, match):
+        return iter([key.encode() for key in list(self.data) if fnmatch.fnmatchcase(key, match)])
+
+    # 정렬 집합 (같은 점수는 멤버 역순 - Redis ZREVRANGE와 동일)
+    def _desc(self, key):
+        return sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update({member.encode(): float(score) for member, score in mapping.items()})
+        return len(mapping)
+
+    def zrem(self, key, member):
+        return 1 if self.zsets.get(key, {}).pop(member.encode(), None) is not None else 0
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(member.encode())
+
+    def zrevrank(self, key, member):
+        members = [m for m, _ in self._desc(key)]
+        return members.index(member.encode()) if member.encode() in members else None
+
+    def zrevrange(self, key, start, end, withscores=False):
+        return self._desc(key)[start:end + 1]
+
+    def zrevrangebyscore(self, key, max, min, start=0, num=None, withscores=False):
+        exclusive = isinstance(max, str) and max.startswith("(")
+        high = float(max[1:]) if exclusive else float(max)
+        rows = [(m, s) for m, s in self._desc(key) if (s < high if exclusive else s <= high)]
+        return rows[start:start + num if num is not None else None]
+
+    def zcount(self, key, min, max):
+        return sum(1 for s in self.zsets.get(key, {}).values() if float(min) <= s <= float(max))
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args) for name, args in self.calls]
@@ -0,0 +1,65 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import pytest
+from models.smart_models import CategoryRecommendation
+from services import category_archetypes as archetypes_module
+from services.category_archetypes import CategoryArchetypeTable, archetype_key, archetype_profile
+from services.intelligent_category_generator import IntelligentCategoryGenerator
+from services.llm_cache import LLMResultCache
+from services.smart_category_recommender import SmartCategoryRecommender
+
+PROFILE = {"time_slot": "저녁", "duration": "3시간", "mbti": "ENFP", "address": "서울시 마포구 어딘가",
+           "general_preferences": ["비밀 취향"]}
+
+@pytest.fixture
+def table(monkeypatch):
+    table = CategoryArchetypeTable(cache=LLMResultCache("test_archetype", url="memory"))
+    for module in ("services.category_archetypes", "services.intelligent_category_generator",
+                   "services.smart_category_recommender"):
+        monkeypatch.setattr(f"{module}.category_archetypes", table)
+    return table
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """프롬프트에 들어간 프로필을 추천 이유에 그대로 담는 가짜 생성"""
+    async def generate(self, profile_data, place_count, conversation_context):
+        self._used_fallback = False
+        return [CategoryRecommendation(sequence=i + 1, category="카페", reason=f"{profile_data} {conversation_context}", alternatives=[])
+                for i in range(place_count)]
+    monkeypatch.setattr(IntelligentCategoryGenerator, "_generate_categories", generate)
+
+async def drain(table):
+    while table._tasks:
+        await asyncio.gather(*list(table._tasks))
+
+def test_user_result_is_not_shared_table_gets_archetype_profile(table, fake_llm):
+    async def scenario():
+        generator = IntelligentCategoryGenerator("test-key")
+        personal = await generator.generate_contextual_categories(PROFILE, 2, "대화 내용")
+        await drain(table)
+        return personal, table.lookup(archetype_key(PROFILE, 2))
+
+    personal, cached = asyncio.run(scenario())
+    assert "ENFP" in personal[0].reason
+    recommendations, stale = cached
+    assert not stale
+    assert all("ENFP" not in rec.reason and "마포구" not in rec.reason and "대화 내용" not in rec.reason
+               for rec in recommendations)
+    assert str(archetype_profile(archetype_key(PROFILE, 2))) in recommendations[0].reason
+
+def test_smart_recommender_refreshes_stale_entry(table, fake_llm):
+    key = archetype_key(PROFILE, 2)
+    old = [CategoryRecommendation(sequence=i + 1, category="음식점", reason="예전 추천", alternatives=[]) for i in range(2)]
+    table.store(key, old, generated_at=1.0)
+
+    async def scenario():
+        recommender = SmartCategoryRecommender("test-key")
+        served = await recommender.generate_personalized_categories(PROFILE, 2, "")
+        await drain(table)
+        return served, table.lookup(key)
+
+    served, (refreshed, stale) = asyncio.run(scenario())
+    assert [rec.reason for rec in served] == ["예전 추천", "예전 추천"]
+    assert not stale and refreshed[0].category == "카페"
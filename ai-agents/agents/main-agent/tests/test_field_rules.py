@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
+from core.field_rules import RULE_CONFIDENCE_THRESHOLD, parse_field
+
+# 범위로 답한 경우는 규칙으로 값 하나를 고르지 않고 LLM에 맡겨야 함
+@pytest.mark.parametrize("field_name, user_input", [
+    ("budget", "10~20만원"),
+    ("budget", "3-5만원"),
+    ("budget", "10에서 20만원"),
+    ("place_count", "2~3개"),
+    ("duration", "3-4시간"),
+    ("duration", "2시간부터 3시간까지"),
+    ("age", "20~25살"),
+])
+def test_value_range_is_left_to_llm(field_name, user_input):
+    assert parse_field(field_name, user_input) is None
+
+@pytest.mark.parametrize("field_name, user_input, expected", [
+    ("budget", "5만원", "5만원"),
+    ("budget", "20만원까지", "20만원"),
+    ("place_count", "3개요~", 3),
+    ("duration", "3시간~", "3시간"),
+    ("duration", "세 시간", "3시간"),
+    ("duration", "5시부터 10시까지", "5시간"),  # 시각 범위는 데이트 시간으로 계산
+    ("duration", "5시~10시", "5시간"),
+    ("car_owned", "네~", True),
+])
+def test_single_values_still_parse(field_name, user_input, expected):
+    parsed = parse_field(field_name, user_input)
+    assert parsed is not None and parsed[0] == expected
+
+@pytest.mark.parametrize("field_name, user_input, expected", [
+    ("gender", "남자친구랑 가요", None),  # 상대를 말한 경우는 성별이 아님
+    ("gender", "여자친구랑 데이트해요", None),
+    ("gender", "남친이랑요", None),
+    ("relationship_stage", "남자친구랑 가요", "연인"),
+])
+def test_partner_words_are_not_gender(field_name, user_input, expected):
+    parsed = parse_field(field_name, user_input)
+    assert (parsed[0] if parsed else None) == expected
+
+@pytest.mark.parametrize("user_input, expected", [("남자", "남"), ("여성", "여"), ("f", "여")])
+def test_exact_gender_answers_pass_threshold(user_input, expected):
+    assert parse_field("gender", user_input) == (expected, 0.95)
+
+def test_gender_substring_hit_is_left_to_llm():
+    value, confidence = parse_field("gender", "저는 남자인데요")
+    assert value == "남" and confidence < RULE_CONFIDENCE_THRESHOLD
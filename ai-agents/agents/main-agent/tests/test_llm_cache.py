@@ -0,0 +1,40 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import threading
+from services.llm_cache import LLMResultCache
+from services.session_store import session_scope
+
+def test_async_get_set_run_off_event_loop_and_share_with_sync(tmp_path):
+    cache = LLMResultCache("test", url=f"sqlite:///{tmp_path / 'llm.db'}")
+    threads = []
+    original_set = cache.store.backend.set
+
+    def recording_set(*args):
+        threads.append(threading.get_ident())
+        return original_set(*args)
+
+    cache.store.backend.set = recording_set
+
+    async def turn():
+        # 요청 스코프 안에서도 공유 캐시는 바로 저장되어야 함
+        async with session_scope():
+            await cache.aset(("duration", "5시부터 10시까지"), "반나절")
+            stored = await LLMResultCache("test", url=f"sqlite:///{tmp_path / 'llm.db'}").aget(("duration", "5시부터 10시까지"))
+        return stored, threading.get_ident()
+
+    stored, loop_thread = asyncio.run(turn())
+    assert stored == "반나절"
+    assert threads and loop_thread not in threads
+    # 같은 턴의 동기 조회는 최근 결과에서 (백엔드 호출 없음)
+    cache.store.backend.get = cache.store.backend.version = None
+    assert cache.get(("duration", "5시부터 10시까지")) == "반나절"
+    assert cache.stats()["hits"] == 1
+
+def test_none_is_not_stored():
+    cache = LLMResultCache("test_none", url="memory")
+    cache.set(("field", "모르겠어요"), None)
+    assert cache.get(("field", "모르겠어요")) is None
+    assert asyncio.run(cache.aget_or_compute(("field", "네"), lambda: asyncio.sleep(0, result={"value": True}))) == {"value": True}
+    assert cache.get(("field", "네")) == {"value": True}
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import pytest
+from services.recommendation_jobs import RecommendationJobQueue
+from services.session_store import PersistentSessionStore, SQLiteBackend, session_scope
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / "jobs.db"))
+
+def make_queue(backend, runner):
+    queue = RecommendationJobQueue(runner=runner, workers=2, max_queue=10)
+    queue.jobs = PersistentSessionStore(backend, "recommendation_jobs", scoped=False)
+    return queue
+
+def test_submit_worker_wait_with_sqlite_backend(backend):
+    other_process = PersistentSessionStore(backend, "recommendation_jobs")
+    seen_by_other = []
+
+    async def runner(session_id, progress):
+        await progress("place_agent", "장소 검색 중")
+        # 진행 이벤트가 작업 종료 전에 저장소에 반영되어야 다른 프로세스가 볼 수 있음
+        job = next(other_process[job_id] for job_id in other_process if other_process[job_id]["session_id"] == session_id)
+        seen_by_other.append(job["stage"])
+        return {"success": True, "session_id": session_id}
+
+    async def scenario():
+        queue = make_queue(backend, runner)
+        try:
+            # start-recommendation 핸들러처럼 요청 스코프 안에서 등록 후 대기
+            async with session_scope():
+                jobs = [await queue.submit(f"sess_{i}") for i in range(5)]
+                finals = [await queue.wait(job["job_id"], timeout=5) for job in jobs]
+            return queue, finals
+        finally:
+            await queue.stop()
+
+    queue, finals = asyncio.run(scenario())
+    assert [job["status"] for job in finals] == ["completed"] * 5
+    assert [event["stage"] for event in finals[0]["events"]] == ["queued", "started", "place_agent", "completed"]
+    assert seen_by_other and all(stage == "place_agent" for stage in seen_by_other)
+    assert queue._active_by_session == {} and queue._conditions == {}
+
+def test_missing_job_is_released_instead_of_blocking(backend):
+    async def runner(session_id, progress):
+        return {"success": True}
+
+    async def scenario():
+        queue = make_queue(backend, runner)
+        try:
+            job = await queue.submit("sess_1")
+            await queue.jobs.apop(job["job_id"])  # 워커가 꺼내기 전에 만료된 경우
+            final = await queue.wait(job["job_id"], timeout=5)
+            await queue._queue.join()
+            return queue, final
+        finally:
+            await queue.stop()
+
+    queue, final = asyncio.run(scenario())
+    assert final is None
+    assert queue._active_by_session == {} and queue._conditions == {}
@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+import pytest
+from tests.fake_redis import FakeRedis
+from services.session_index import (
+    MemorySessionIndex, RedisSessionIndex, SQLiteSessionIndex, create_session_index, encode_cursor
+)
+from services.session_store import MemorySessionStore, RedisBackend, SQLiteBackend
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def index(request, tmp_path):
+    if request.param == "memory":
+        return MemorySessionIndex()
+    if request.param == "sqlite":
+        return SQLiteSessionIndex(SQLiteBackend(str(tmp_path / "index.db")))
+    return RedisSessionIndex(RedisBackend(FakeRedis()))
+
+def walk(index, user_id, status="all", limit=3):
+    """커서로 끝까지 조회한 session_id 목록"""
+    seen, cursor = [], None
+    while True:
+        items, cursor = index.page(user_id, status, limit, cursor)
+        seen.extend(items)
+        if cursor is None:
+            return seen
+
+def test_pages_by_recent_activity_with_status_filter(index):
+    for i in range(7):
+        index.upsert("u1", f"s{i}", "COMPLETED" if i % 2 else "ACTIVE", f"2024-01-01T10:0{i}:00Z")
+    index.upsert("u2", "other", "ACTIVE", "2024-01-01T11:00:00Z")
+    assert walk(index, "u1") == [f"s{i}" for i in range(6, -1, -1)]
+    assert walk(index, "u1", "COMPLETED") == ["s5", "s3", "s1"]
+    assert index.count("u1") == 7 and index.count("u1", "ACTIVE") == 4
+    index.upsert("u1", "s0", "COMPLETED", "2024-01-01T12:00:00Z")  # 갱신 시 맨 앞으로 이동
+    assert index.page("u1", "all", 1)[0] == ["s0"]
+    assert index.count("u1", "ACTIVE") == 3 and index.count("u1", "COMPLETED") == 4
+    index.remove("u1", "s0")
+    assert index.count("u1") == 6 and "s0" not in walk(index, "u1")
+
+def test_same_activity_time_is_paged_without_gaps(index):
+    for i in range(8):
+        index.upsert("u1", f"s{i}", "ACTIVE", "2024-01-01T10:00:00Z")
+    seen = walk(index, "u1")
+    assert sorted(seen) == [f"s{i}" for i in range(8)] and len(seen) == 8
+
+def test_redis_cursor_fallback_keeps_same_score_members():
+    index = RedisSessionIndex(RedisBackend(FakeRedis()))
+    for i in range(6):
+        index.upsert("u1", f"s{i}", "ACTIVE", "2024-01-01T10:00:00Z")
+    first, cursor = index.page("u1", "all", 2)
+    # 커서 항목이 이후 갱신되어 이동하면 점수 기준으로 이어서 조회 (같은 점수 항목 누락 없음)
+    index.upsert("u1", first[-1], "ACTIVE", "2024-01-01T11:00:00Z")
+    rest, _ = index.page("u1", "all", 10, cursor)
+    assert sorted(first + rest) == [f"s{i}" for i in range(6)]
+
+def test_invalid_cursor_is_rejected(index):
+    with pytest.raises(ValueError):
+        index.page("u1", "all", 3, "not-a-cursor")
+    assert index.page("u1", "all", 3, encode_cursor(0.0, "x")) == ([], None)
+
+def test_memory_index_follows_store_eviction():
+    sessions = MemorySessionStore(max_entries=3, ttl_seconds=60)
+    index = create_session_index("memory", sessions=sessions)
+    for i in range(5):
+        session = {"session_id": f"s{i}", "user_id": "u1", "session_status": "ACTIVE",
+                   "last_activity_at": f"2024-01-01T10:0{i}:00Z"}
+        sessions[f"s{i}"] = session
+        index.upsert_session(session)
+    # LRU로 밀려난 세션은 인덱스에서도 제거 (인덱스 크기 <= 저장소 크기)
+    assert index.count("u1") == 3 and walk(index, "u1") == ["s4", "s3", "s2"]
+
+def test_memory_index_drops_expired_sessions():
+    sessions = MemorySessionStore(ttl_seconds=0.01)
+    index = create_session_index("memory", sessions=sessions)
+    for i in range(3):
+        session = {"session_id": f"s{i}", "user_id": "u1", "last_activity_at": f"2024-01-01T10:0{i}:00Z"}
+        sessions[f"s{i}"] = session
+        index.upsert_session(session)
+    time.sleep(0.02)
+    assert sessions.purge_expired() == 3
+    assert index.count("u1") == 0 and len(sessions) == 0
+
+def test_peek_does_not_refresh_lru_or_ttl():
+    sessions = MemorySessionStore(max_entries=2, ttl_seconds=60)
+    sessions["a"] = {"n": 1}
+    sessions["b"] = {"n": 2}
+    expires_at = sessions._data["a"][0]
+    assert sessions.peek("a") == {"n": 1} and sessions.peek("missing") is None
+    assert sessions._data["a"][0] == expires_at and next(iter(sessions._data)) == "a"
@@ -0,0 +1,87 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import asyncio
+import threading
+import pytest
+from models.request_models import UserProfile
+from tests.fake_redis import FakeRedis
+from services.session_store import (
+    PersistentSessionStore, RedisBackend, SQLiteBackend, session_scope
+)
+
+@pytest.fixture(params=["redis", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "redis":
+        return RedisBackend(FakeRedis())
+    return SQLiteBackend(str(tmp_path / "sessions.db"))
+
+def test_round_trip_keeps_models(backend):
+    store = PersistentSessionStore(backend, "session_info")
+    store["s1"] = {"profile": UserProfile(age=25, mbti="ENFP"), "step": 2}
+    # 다른 워커(같은 백엔드, 별도 저장소 객체)에서 읽기
+    other = PersistentSessionStore(backend, "session_info")
+    loaded = other["s1"]
+    assert isinstance(loaded["profile"], UserProfile)
+    assert loaded["profile"].mbti == "ENFP" and loaded["step"] == 2
+    assert "s1" in other and list(other) == ["s1"] and len(other) == 1
+    del other["s1"]
+    assert "s1" not in store and store.get("s1") is None
+
+def test_commit_persists_in_place_changes_and_other_worker_reloads(backend):
+    store = PersistentSessionStore(backend, "sessions")
+    other = PersistentSessionStore(backend, "sessions")
+    store["s1"] = {"message_count": 1}
+    assert other["s1"]["message_count"] == 1
+    store["s1"]["message_count"] = 2
+    store.commit("s1")
+    assert other["s1"]["message_count"] == 2
+    assert other.load_count == 2
+
+def test_scope_defers_writes_until_exit(backend):
+    store = PersistentSessionStore(backend, "session_info")
+    other = PersistentSessionStore(backend, "session_info")
+
+    async def turn():
+        async with session_scope():
+            store["s1"] = {"step": 1}
+            store["s1"]["step"] = 2
+            store["s1"] = store["s1"]
+            assert "s1" in store
+            assert other.get("s1") is None  # 스코프가 끝나기 전에는 저장되지 않음
+        return other.get("s1")
+
+    assert asyncio.run(turn()) == {"step": 2}
+
+def test_acommit_writes_immediately_inside_scope(backend):
+    store = PersistentSessionStore(backend, "sessions")
+    other = PersistentSessionStore(backend, "sessions")
+
+    async def turn():
+        async with session_scope():
+            store["s1"] = {"has_course": True}
+            await store.acommit("s1")
+            return other.get("s1")
+
+    assert asyncio.run(turn()) == {"has_course": True}
+
+def test_async_access_runs_off_event_loop(backend):
+    store = PersistentSessionStore(backend, "sessions")
+    store["s1"] = {"step": 1}
+    threads = []
+    original_get = backend.get
+
+    def recording_get(key):
+        threads.append(threading.get_ident())
+        return original_get(key)
+
+    backend.get = recording_get
+
+    async def turn():
+        async with session_scope():
+            value = await PersistentSessionStore(backend, "sessions").aget("s1")
+            return value, threading.get_ident()
+
+    value, loop_thread = asyncio.run(turn())
+    assert value == {"step": 1}
+    assert threads and loop_thread not in threads
@@ -23,11 +23,22 @@ class Settings:
     DEFAULT_PLACE_COUNT: int = 3
     MAX_PLACE_COUNT: int = 10
     COORDINATE_PRECISION: int = 6  # 소수점 자리수
+    COORDINATE_SPACING_M: float = 300.0  # 같은 지역 내 좌표 간 최소 간격 (미터)
     
     # LLM 설정
     LLM_TEMPERATURE: float = 0.7
     LLM_MAX_TOKENS: int = 500
     LLM_TIMEOUT: float = 30.0
+    LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))  # 동시 LLM 호출 상한
+    
+    # 카카오 API 설정
+    KAKAO_TIMEOUT: float = 10.0
+    KAKAO_MAX_CONNECTIONS: int = int(os.getenv("KAKAO_MAX_CONNECTIONS", "20"))
+    KAKAO_CACHE_SIZE: int = 2048
+    KAKAO_CACHE_TTL: float = float(os.getenv("KAKAO_CACHE_TTL", "3600"))  # 초
+    
+    # 동일 요청 병합 설정
+    RESULT_CACHE_TTL: float = float(os.getenv("RESULT_CACHE_TTL", "30"))  # 성공 결과 재사용 시간 (초)
     
     @classmethod
     def validate_settings(cls) -> bool:
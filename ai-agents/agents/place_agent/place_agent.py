@@ -7,13 +7,17 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 import httpx
-import asyncio
-from openai import OpenAI
 import os
 from datetime import datetime
 import json
 from dotenv import load_dotenv
-import math
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+from src.data.seoul_gazetteer import gazetteer
+from src.core.llm_client import chat_completion
+from src.core.place_engine import place_engine, haversine_km, spiral_coordinates, normalize_coordinates as _normalize_coordinates
+from src.core.request_coalescer import place_request_coalescer, request_fingerprint
 
 # 환경변수 로드
 load_dotenv()
@@ -21,9 +25,6 @@ load_dotenv()
 # FastAPI 앱 초기화
 app = FastAPI(title="Place Agent", description="지역 분석 및 좌표 반환 서비스", version="3.0.0")
 
-# OpenAI 클라이언트 초기화
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
 # 좌표 정확도 설정
 COORDINATE_PRECISION = 4  # 소수점 4자리로 고정
 MIN_DISTANCE_METERS = 200  # 최소 거리 200미터
@@ -31,26 +32,11 @@ MIN_DISTANCE_METERS = 200  # 최소 거리 200미터
 # 좌표 정규화 함수
 def normalize_coordinates(lat: float, lng: float) -> tuple:
     """좌표를 지정된 정확도로 정규화"""
-    return (
-        round(float(lat), COORDINATE_PRECISION),
-        round(float(lng), COORDINATE_PRECISION)
-    )
+    return _normalize_coordinates(lat, lng, COORDINATE_PRECISION)
 
 def calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """두 좌표 간 거리 계산 (미터 단위)"""
-    # Haversine 공식 사용
-    R = 6371000  # 지구 반지름 (미터)
-    
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lng = math.radians(lng2 - lng1)
-    
-    a = (math.sin(delta_lat / 2) ** 2 +
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    return R * c
+    """두 좌표 간 거리 계산 (미터 단위) - 공통 엔진의 Haversine 사용"""
+    return haversine_km(lat1, lng1, lat2, lng2) * 1000
 
 # 메인 에이전트 스펙에 맞춘 요청 모델들
 class LocationRequest(BaseModel):
@@ -105,145 +91,33 @@ class PlaceAgentResponse(BaseModel):
 
 class PlaceAgent:
     def __init__(self):
-        self.kakao_api_key = os.getenv("KAKAO_API_KEY")
+        # 카카오 API 접근/캐시/거리 계산은 공통 엔진(src/core/place_engine.py)이 담당
+        self.engine = place_engine
+        self.kakao_api_key = self.engine.kakao_api_key
         if not self.kakao_api_key:
             print("⚠️ KAKAO_API_KEY가 설정되지 않았습니다. Kakao API 기능이 제한됩니다.")
 
     async def get_coordinates_from_kakao(self, area_name: str) -> Optional[Dict]:
-        """Kakao API로 지역 정보 조회 - 정확한 지역 매칭"""
-        if not self.kakao_api_key:
-            print(f"Kakao API 키가 없어 지역 조회 불가: {area_name}")
-            return None
-            
-        try:
-            headers = {"Authorization": f"KakaoAK {self.kakao_api_key}"}
-            async with httpx.AsyncClient() as client_session:
-                # 여러 검색 패턴으로 정확한 위치 찾기
-                search_queries = [
-                    f"서울 {area_name}",  # 기본 검색
-                    f"서울 {area_name}동",  # 동 단위 검색
-                    f"서울 {area_name}역",  # 역 단위 검색
-                    f"{area_name} 서울"   # 순서 바꾼 검색
-                ]
-                
-                print(f"🔍 {area_name} 정확한 좌표 검색 중...")
-                
-                for query in search_queries:
-                    response = await client_session.get(
-                        "https://dapi.kakao.com/v2/local/search/keyword.json",
-                        params={
-                            "query": query,
-                            "size": 5  # 여러 결과 확인
-                        },
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get("documents"):
-                            # 가장 적합한 결과 선택
-                            for place in data["documents"]:
-                                place_name = place.get("place_name", "")
-                                address = place.get("address_name", "")
-                                
-                                # 지역명이 정확히 매칭되는지 확인
-                                if (area_name in place_name or 
-                                    area_name in address or 
-                                    place_name in area_name):
-                                    
-                                    # 좌표 정규화
-                                    lat, lng = normalize_coordinates(
-                                        float(place["y"]), float(place["x"])
-                                    )
-                                    
-                                    print(f"✅ {area_name} 좌표 발견: {place_name} ({lat}, {lng})")
-                                    
-                                    return {
-                                        "lat": lat,
-                                        "lng": lng,
-                                        "address": address,
-                                        "place_name": place_name
-                                    }
-                
-                print(f"❌ {area_name} 정확한 좌표를 찾을 수 없음")
-                        
-        except Exception as e:
-            print(f"Kakao API 요청 실패: {e}")
-        
-        return None
+        """Kakao API로 지역 정보 조회 - 정확한 지역 매칭 (공통 엔진, 캐시 적용)"""
+        print(f"🔍 {area_name} 정확한 좌표 검색 중...")
+        coord = await self.engine.kakao_geocode(area_name, strict=True)
+        if coord:
+            print(f"✅ {area_name} 좌표 발견: {coord['place_name']} ({coord['lat']}, {coord['lng']})")
+        return coord
+
+    async def resolve_area_coordinates(self, area_name: str) -> Optional[Dict]:
+        """지역 좌표 조회 - 가제티어 우선, 없으면 Kakao API"""
+        if gazetteer.lookup(area_name):
+            print(f"📚 {area_name} 가제티어 좌표 사용")
+            return await self.engine.geocode(area_name)
+        return await self.get_coordinates_from_kakao(area_name)
 
     async def find_nearby_areas(self, center_lat: float, center_lng: float, radius_km: float = 3.0) -> List[Dict]:
         """중심 좌표 주변 지역들 검색"""
-        if not self.kakao_api_key:
-            return []
-            
         try:
-            headers = {"Authorization": f"KakaoAK {self.kakao_api_key}"}
-            nearby_areas = []
-            
-            async with httpx.AsyncClient() as client_session:
-                # 반경 내 장소들 검색 (여러 카테고리)
-                categories = ["CE7", "FD6", "CT1", "AT4", "PK6", "SW8"]
-                
-                for category in categories[:5]:  # 상위 5개 카테고리만
-                    response = await client_session.get(
-                        "https://dapi.kakao.com/v2/local/search/category.json",
-                        params={
-                            "category_group_code": category,
-                            "x": center_lng,
-                            "y": center_lat,
-                            "radius": int(radius_km * 1000),  # 미터 단위
-                            "size": 15,
-                            "sort": "distance"
-                        },
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        for place in data.get("documents", []):
-                            place_lat, place_lng = normalize_coordinates(
-                                float(place["y"]), float(place["x"])
-                            )
-                            
-                            # 중복 체크
-                            is_duplicate = False
-                            for existing in nearby_areas:
-                                if calculate_distance(
-                                    place_lat, place_lng,
-                                    existing["lat"], existing["lng"]
-                                ) < MIN_DISTANCE_METERS:
-                                    is_duplicate = True
-                                    break
-                            
-                            if not is_duplicate:
-                                # 지역명 추출 (주소에서)
-                                address_parts = place.get("address_name", "").split()
-                                area_name = ""
-                                if len(address_parts) >= 3:
-                                    area_name = address_parts[2]  # 동/면 단위
-                                elif len(address_parts) >= 2:
-                                    area_name = address_parts[1]  # 구 단위
-                                else:
-                                    area_name = place.get("place_name", "알 수 없는 지역")
-                                
-                                nearby_areas.append({
-                                    "lat": place_lat,
-                                    "lng": place_lng,
-                                    "area_name": area_name,
-                                    "place_name": place.get("place_name", ""),
-                                    "category": place.get("category_name", ""),
-                                    "address": place.get("address_name", ""),
-                                    "distance": calculate_distance(center_lat, center_lng, place_lat, place_lng)
-                                })
-                        
-                        if len(nearby_areas) >= 20:  # 충분한 후보 확보시 중단
-                            break
-            
-            # 거리순 정렬
-            nearby_areas.sort(key=lambda x: x["distance"])
-            return nearby_areas[:15]  # 상위 15개 반환
-            
+            return await self.engine.find_nearby_areas(
+                center_lat, center_lng, radius_km, min_distance_m=MIN_DISTANCE_METERS
+            )
         except Exception as e:
             print(f"주변 지역 검색 실패: {e}")
             return []
@@ -332,15 +206,13 @@ class PlaceAgent:
     async def analyze_with_llm(self, prompt: str) -> Dict[str, List[str]]:
         """LLM을 활용한 지역 분석"""
         try:
-            response = await asyncio.to_thread(
-                client.chat.completions.create,
+            # 공유 AsyncOpenAI 클라이언트 (동시 호출 수 제한)
+            llm_text = await chat_completion(
+                [{"role": "user", "content": prompt}],
                 model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
                 temperature=0.7,
                 max_tokens=600
             )
-            
-            llm_text = response.choices[0].message.content
             print(f"LLM 응답: {llm_text}")
             
             return self.parse_llm_response(llm_text)
@@ -350,62 +222,21 @@ class PlaceAgent:
             return {"areas": [], "reasons": []}
 
     def generate_area_coordinates(self, area_name: str, count: int, base_lat: float, base_lng: float) -> List[Dict]:
-        """지역 내 여러 좌표 생성"""
-        coordinates = []
+        """지역 내 여러 좌표 생성 (황금각 나선 - 최소 간격 보장, 지역명 기준 결정적)"""
+        points = spiral_coordinates(
+            base_lat, base_lng, max(count, 1), MIN_DISTANCE_METERS,
+            seed_key=area_name, precision=COORDINATE_PRECISION
+        )
         
         # 첫 번째는 기본 좌표
-        norm_lat, norm_lng = normalize_coordinates(base_lat, base_lng)
-        coordinates.append({
-            "lat": norm_lat,
-            "lng": norm_lng,
-            "sub_location": area_name,
-            "detail": "메인 지역"
-        })
-        
-        if count <= 1:
-            return coordinates
-        
-        # 나머지는 반경 500m 내에서 생성
-        import random
-        random.seed(hash(area_name))  # 일관성 유지
-        
-        attempt = 0
-        max_attempts = 50
-        
-        while len(coordinates) < count and attempt < max_attempts:
-            attempt += 1
-            
-            # 반경 500m 내에서 랜덤 좌표 생성
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(100, 500)  # 100m~500m
-            
-            # 좌표 변환
-            lat_offset = (distance * math.cos(angle)) / 111000
-            lng_offset = (distance * math.sin(angle)) / (111000 * math.cos(math.radians(base_lat)))
-            
-            new_lat = base_lat + lat_offset
-            new_lng = base_lng + lng_offset
-            
-            norm_new_lat, norm_new_lng = normalize_coordinates(new_lat, new_lng)
-            
-            # 중복 체크
-            is_duplicate = False
-            for existing in coordinates:
-                distance_check = calculate_distance(
-                    norm_new_lat, norm_new_lng, 
-                    existing["lat"], existing["lng"]
-                )
-                if distance_check < MIN_DISTANCE_METERS:
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                coordinates.append({
-                    "lat": norm_new_lat,
-                    "lng": norm_new_lng,
-                    "sub_location": f"{area_name} {len(coordinates)}",
-                    "detail": f"{area_name} 주변"
-                })
+        coordinates = []
+        for i, (lat, lng) in enumerate(points):
+            coordinates.append({
+                "lat": float(lat),
+                "lng": float(lng),
+                "sub_location": area_name if i == 0 else f"{area_name} {i}",
+                "detail": "메인 지역" if i == 0 else f"{area_name} 주변"
+            })
         
         return coordinates
 
@@ -535,66 +366,11 @@ class PlaceAgent:
 
     async def get_area_coordinates_from_kakao_search(self, area_name: str, count: int) -> List[Dict]:
         """카카오 API로 해당 지역의 실제 장소들 검색하여 좌표 반환"""
-        results = []
-        
-        if not self.kakao_api_key:
-            return results
-            
         try:
-            headers = {"Authorization": f"KakaoAK {self.kakao_api_key}"}
-            
-            async with httpx.AsyncClient() as client_session:
-                # 다양한 카테고리로 검색
-                categories = ["CE7", "FD6", "CT1", "AT4", "SW8"]  # 카페, 음식점, 문화시설, 관광명소, 지하철역
-                
-                for category in categories:
-                    if len(results) >= count:
-                        break
-                        
-                    response = await client_session.get(
-                        "https://dapi.kakao.com/v2/local/search/category.json",
-                        params={
-                            "category_group_code": category,
-                            "query": area_name,
-                            "size": 15,
-                            "sort": "accuracy"
-                        },
-                        headers=headers
-                    )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        for place in data.get("documents", []):
-                            if len(results) >= count:
-                                break
-                                
-                            place_lat, place_lng = normalize_coordinates(
-                                float(place["y"]), float(place["x"])
-                            )
-                            
-                            # 중복 체크
-                            is_duplicate = False
-                            for existing in results:
-                                if calculate_distance(
-                                    place_lat, place_lng,
-                                    existing["lat"], existing["lng"]
-                                ) < MIN_DISTANCE_METERS:
-                                    is_duplicate = True
-                                    break
-                            
-                            if not is_duplicate:
-                                results.append({
-                                    "lat": place_lat,
-                                    "lng": place_lng,
-                                    "sub_location": place.get("place_name", area_name),
-                                    "detail": place.get("category_name", "일반"),
-                                    "address": place.get("address_name", "")
-                                })
-                
+            return await self.engine.search_area_places(area_name, count, min_distance_m=MIN_DISTANCE_METERS)
         except Exception as e:
             print(f"카카오 API 검색 실패: {e}")
-        
-        return results
+            return []
 
     async def process_with_ai_clustering(self, request: PlaceAgentRequest, location_clustering: dict, ai_instructions: dict) -> List[LocationResponse]:
         """AI 중심의 location clustering 처리"""
@@ -617,7 +393,7 @@ class PlaceAgent:
             
             area_name = reference_areas[0]
             # 해당 지역의 대표 좌표 검색
-            base_coord = await self.get_coordinates_from_kakao(area_name)
+            base_coord = await self.resolve_area_coordinates(area_name)
             
             if not base_coord:
                 return []
@@ -642,57 +418,36 @@ class PlaceAgent:
             
             # 첫 번째 지역 기준으로 주변 다른 지역들 검색
             base_area = reference_areas[0] if reference_areas else "서울"
-            base_coord = await self.get_coordinates_from_kakao(base_area)
+            base_coord = await self.resolve_area_coordinates(base_area)
             
             if not base_coord:
                 return []
             
-            # 반경을 넓혀서 다양한 지역 검색 (더 넓게)
-            nearby_areas = await self.find_nearby_areas(base_coord["lat"], base_coord["lng"], radius_km=15.0)
-            
-            # 서울 주요 지역들도 후보에 추가 (사용자가 모르는 좋은 지역들)
-            major_seoul_areas = [
-                {"area_name": "강남역", "category": "상권", "distance": 0, "lat": 37.4979, "lng": 127.0276},
-                {"area_name": "홍대", "category": "상권", "distance": 0, "lat": 37.5563, "lng": 126.9236}, 
-                {"area_name": "이태원", "category": "상권", "distance": 0, "lat": 37.5349, "lng": 126.9947},
-                {"area_name": "명동", "category": "상권", "distance": 0, "lat": 37.5636, "lng": 126.9822},
-                {"area_name": "신촌", "category": "상권", "distance": 0, "lat": 37.5596, "lng": 126.9423},
-                {"area_name": "건대", "category": "상권", "distance": 0, "lat": 37.5403, "lng": 127.0695},
-                {"area_name": "잠실", "category": "상권", "distance": 0, "lat": 37.5133, "lng": 127.1028},
-                {"area_name": "성수", "category": "상권", "distance": 0, "lat": 37.5445, "lng": 127.0557},
-                {"area_name": "여의도", "category": "상권", "distance": 0, "lat": 37.5219, "lng": 126.9245}
-            ]
-            
-            # 기존 검색 결과와 주요 지역 합치기 (중복 제거)
-            all_areas = nearby_areas.copy()
-            for major_area in major_seoul_areas:
-                # 중복 체크
-                is_duplicate = False
-                for existing in all_areas:
-                    if major_area["area_name"] in existing["area_name"] or existing["area_name"] in major_area["area_name"]:
-                        is_duplicate = True
-                        break
-                if not is_duplicate:
-                    all_areas.append(major_area)
+            # 가제티어에서 서로 다른 구의 후보 지역을 로컬로 생성 (Kakao/LLM 후보 탐색 불필요)
+            candidate_areas = gazetteer.candidates_for(
+                base_coord["lat"], base_coord["lng"],
+                limit=max(place_count * 3, 8),
+                radius_km=15.0,
+                preferences=request.user_context.preferences,
+                exclude=[base_area]
+            )
             
-            # AI에게 서로 다른 지역 선택 지시
-            enhanced_prompt = self.create_enhanced_ai_prompt_different_areas(request, all_areas, ai_instructions)
+            # AI는 짧은 후보 목록의 순위만 결정
+            enhanced_prompt = self.create_enhanced_ai_prompt_different_areas(request, candidate_areas, ai_instructions)
             llm_result = await self.analyze_with_llm(enhanced_prompt)
             
             locations = []
             if llm_result["areas"] and llm_result["reasons"]:
                 for i, (area_name, reason) in enumerate(zip(llm_result["areas"][:place_count], llm_result["reasons"][:place_count]), 1):
-                    # 각 지역의 좌표 검색
+                    # 후보 목록 → 가제티어 → Kakao 순으로 좌표 매칭
                     matched_area = None
-                    for area in all_areas:
+                    for area in candidate_areas:
                         if area_name in area["area_name"] or area["area_name"] in area_name:
                             matched_area = area
                             break
                     
                     if not matched_area:
-                        coord = await self.get_coordinates_from_kakao(area_name)
-                        if coord:
-                            matched_area = coord
+                        matched_area = await self.resolve_area_coordinates(area_name)
                     
                     if matched_area:
                         locations.append(LocationResponse(
@@ -726,7 +481,7 @@ class PlaceAgent:
                     print(f"📍 [처리 중] 그룹 {group_idx}: {location}에서 {len(places)}개 장소 ({places})")
                     
                     # 해당 지역의 대표 좌표 검색
-                    coord = await self.get_coordinates_from_kakao(location)
+                    coord = await self.resolve_area_coordinates(location)
                     if coord:
                         print(f"✅ [좌표 획득] {location}: {coord['lat']}, {coord['lng']}")
                         # 각 장소 번호에 해당 지역의 같은 좌표 할당
@@ -1208,11 +963,21 @@ class PlaceAgent:
 # Place Agent 인스턴스
 place_agent = PlaceAgent()
 
+@app.on_event("shutdown")
+async def shutdown_engine():
+    """공통 엔진의 HTTP 커넥션 풀 정리"""
+    await place_engine.aclose()
+
 @app.post("/analyze", response_model=PlaceAgentResponse)
 async def analyze_location(request: PlaceAgentRequest):
     """지역 분석 및 좌표 반환 메인 엔드포인트"""
     try:
-        locations = await place_agent.process_request(request)
+        # 동일 요청은 병합, 직전 성공 결과는 재사용
+        locations = await place_request_coalescer.run(
+            request_fingerprint(request.model_dump()),
+            lambda: place_agent.process_request(request),
+            is_cacheable=bool
+        )
         
         if not locations:
             raise HTTPException(status_code=404, detail="추천할 지역을 찾을 수 없습니다.")
@@ -1242,6 +1007,8 @@ async def health_check():
         "status": "healthy", 
         "service": "Place Agent v3.1.0 (완전한 사용자 지정 지역 처리)",
         "kakao_api": "available" if place_agent.kakao_api_key else "not configured",
+        "engine": place_agent.engine.stats(),
+        "coalescer": place_request_coalescer.stats(),
         "features": [
             "location_clustering 우선 처리",
             "폴백 함수로 안전성 보장", 
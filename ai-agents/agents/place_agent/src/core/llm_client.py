@@ -0,0 +1,61 @@
+# 공유 비동기 LLM 클라이언트
+# - 프로세스 전체에서 AsyncOpenAI 클라이언트 1개 재사용
+# - 세마포어로 동시 LLM 호출 수 제한 (기본 스레드풀 사용 안 함)
+
+import asyncio
+import os
+import sys
+from typing import Dict, List, Optional
+
+from openai import AsyncOpenAI
+
+# 상위 디렉토리의 모듈들 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from config.settings import settings
+
+_client: Optional[AsyncOpenAI] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_async_client() -> AsyncOpenAI:
+    """공유 AsyncOpenAI 클라이언트 반환 (최초 호출 시 생성)"""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, timeout=settings.LLM_TIMEOUT)
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """동시 호출 제한용 세마포어 (이벤트 루프 안에서 지연 생성)"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+    return _semaphore
+
+
+async def chat_completion(messages: List[Dict[str, str]], model: Optional[str] = None,
+                          temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                          json_mode: bool = False) -> str:
+    """
+    동시성 제한 하에 Chat Completion 호출
+
+    Args:
+        messages: OpenAI 메시지 리스트
+        model/temperature/max_tokens: 미지정 시 settings 기본값
+        json_mode: True면 JSON 객체 응답 강제
+
+    Returns:
+        응답 텍스트
+    """
+    params = {
+        "model": model or settings.OPENAI_MODEL,
+        "messages": messages,
+        "temperature": settings.LLM_TEMPERATURE if temperature is None else temperature,
+        "max_tokens": max_tokens or settings.LLM_MAX_TOKENS,
+    }
+    if json_mode:
+        params["response_format"] = {"type": "json_object"}
+
+    async with _get_semaphore():
+        response = await get_async_client().chat.completions.create(**params)
+    return response.choices[0].message.content or ""
@@ -2,9 +2,8 @@
 # - 사용자 요청에 맞는 최적 지역 추천
 # - 기존 정의된 지역 + 새로운 지역 하이브리드 지원
 
-import asyncio
+import json
 from typing import Dict, List
-from openai import OpenAI
 import os
 import sys
 
@@ -12,14 +11,18 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.models.request_models import PlaceAgentRequest, UserContext
 from src.data.area_data import get_predefined_areas
+from src.core.llm_client import chat_completion
 from config.settings import settings
 
+# 새 지역 특성 분석 결과 캐시 (지역명 → 특성/분위기, 프로세스 공유)
+_AREA_CHARACTERISTICS_CACHE: Dict[str, Dict] = {}
+
 class LocationAnalyzer:
     """LLM 기반 지역 분석 서비스"""
     
     def __init__(self):
-        """초기화"""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        """초기화 (LLM 호출은 공유 비동기 클라이언트 사용)"""
+        self.characteristics_cache = _AREA_CHARACTERISTICS_CACHE
     
     def create_analysis_prompt(self, request: PlaceAgentRequest) -> str:
         """LLM을 위한 지역 분석 프롬프트 생성 (하이브리드 - 기존지역 + 새지역)"""
@@ -95,10 +98,43 @@ class LocationAnalyzer:
             print(f"LLM 응답 파싱 실패: {e}")
             return {"areas": [], "reasons": []}
 
+    def _default_characteristics(self, area_name: str) -> Dict:
+        """특성 분석 실패 시 기본값"""
+        return {
+            "signature_traits": ["일반지역"],
+            "vibe": "특별한",
+            "reason": f"{area_name} 지역은 사용자 요청에 적합한 선택입니다."
+        }
+
     async def analyze_new_area_characteristics(self, area_name: str, user_context: UserContext) -> Dict:
-        """새로운 지역에 대한 LLM 특성 분석"""
-        try:
-            prompt = f"""'{area_name}' 지역에 대해 분석해주세요.
+        """새로운 지역에 대한 LLM 특성 분석 (단일 지역)"""
+        results = await self.analyze_new_areas_characteristics([area_name], user_context)
+        return results.get(area_name, self._default_characteristics(area_name))
+
+    async def analyze_new_areas_characteristics(self, area_names: List[str], user_context: UserContext) -> Dict[str, Dict]:
+        """
+        여러 새 지역의 특성을 한 번의 구조화된 LLM 호출로 분석
+
+        - 지역명 기준 캐시에 있는 지역은 LLM 호출 없이 재사용
+        - 캐시되는 값은 지역 고유 특성(signature_traits, vibe)이며 reason은 요청마다 생성
+
+        Returns:
+            {지역명: {"signature_traits", "vibe", "reason"}}
+        """
+        unique_names = list(dict.fromkeys(name for name in area_names if name))
+        results: Dict[str, Dict] = {}
+        missing = []
+        for name in unique_names:
+            cached = self.characteristics_cache.get(name)
+            if cached:
+                results[name] = {**cached, "reason": f"{name} 지역은 {cached['vibe']} 분위기로 사용자 요청에 적합합니다."}
+            else:
+                missing.append(name)
+
+        if not missing:
+            return results
+
+        prompt = f"""다음 서울 지역들을 각각 분석해주세요: {', '.join(missing)}
 
 사용자 정보:
 - 나이: {user_context.demographics.age}세
@@ -108,51 +144,39 @@ class LocationAnalyzer:
 - 예산: {user_context.requirements.budget_level}
 - 시간대: {user_context.requirements.time_preference}
 
-다음 형식으로 정확히 응답해주세요:
-특성:|키워드1,키워드2,키워드3
-분위기:|한단어설명
-이유:|사용자에게적합한상세이유문장
+다음 JSON 형식으로만 응답해주세요:
+{{"areas": [{{"name": "지역명", "traits": ["키워드1", "키워드2", "키워드3"], "vibe": "한단어설명", "reason": "사용자에게적합한상세이유문장"}}]}}
 
 예시:
-특성:|주거지역,조용한분위기,가족친화적
-분위기:|평온한
-이유:|조용한 주거지역으로 {user_context.demographics.age}세 {user_context.demographics.relationship_stage}가 편안하게 대화하기 좋은 환경입니다. 지하철 접근성도 우수합니다."""
-
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=settings.OPENAI_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=settings.LLM_TEMPERATURE,
-                max_tokens=settings.LLM_MAX_TOKENS
+{{"areas": [{{"name": "마포구", "traits": ["주거지역", "조용한분위기", "가족친화적"], "vibe": "평온한", "reason": "조용한 주거지역으로 {user_context.demographics.age}세 {user_context.demographics.relationship_stage}가 편안하게 대화하기 좋은 환경입니다."}}]}}"""
+
+        try:
+            llm_text = await chat_completion(
+                [{"role": "user", "content": prompt}],
+                max_tokens=max(settings.LLM_MAX_TOKENS, 200 * len(missing)),
+                json_mode=True
             )
-            
-            llm_text = response.choices[0].message.content.strip()
-            print(f"새 지역 '{area_name}' 특성 분석: {llm_text}")
-            
-            # 응답 파싱
-            result = {"signature_traits": ["일반지역"], "vibe": "특별한", "reason": f"{area_name} 지역 추천"}
-            
-            lines = llm_text.split('\n')
-            for line in lines:
-                if '특성:' in line:
-                    traits_part = line.split('|')[1] if '|' in line else ""
-                    result["signature_traits"] = [t.strip() for t in traits_part.split(',')]
-                elif '분위기:' in line:
-                    vibe_part = line.split('|')[1] if '|' in line else "특별한"
-                    result["vibe"] = vibe_part.strip()
-                elif '이유:' in line:
-                    reason_part = line.split('|')[1] if '|' in line else f"{area_name} 지역 추천"
-                    result["reason"] = reason_part.strip()
-            
-            return result
-            
+            print(f"새 지역 {missing} 특성 일괄 분석: {llm_text}")
+
+            for item in json.loads(llm_text).get("areas", []):
+                name = item.get("name", "")
+                if name not in missing:
+                    continue
+                traits = [t.strip() for t in item.get("traits", []) if str(t).strip()] or ["일반지역"]
+                vibe = (item.get("vibe") or "특별한").strip()
+                self.characteristics_cache[name] = {"signature_traits": traits, "vibe": vibe}
+                results[name] = {
+                    "signature_traits": traits,
+                    "vibe": vibe,
+                    "reason": (item.get("reason") or f"{name} 지역 추천").strip()
+                }
+
         except Exception as e:
             print(f"새 지역 특성 분석 실패: {e}")
-            return {
-                "signature_traits": ["일반지역"],
-                "vibe": "특별한",
-                "reason": f"{area_name} 지역은 사용자 요청에 적합한 선택입니다."
-            }
+
+        for name in missing:
+            results.setdefault(name, self._default_characteristics(name))
+        return results
 
     async def analyze_locations(self, request: PlaceAgentRequest) -> Dict[str, List[str]]:
         """요청에 맞는 최적 지역들을 분석하여 반환"""
@@ -161,15 +185,7 @@ class LocationAnalyzer:
             prompt = self.create_analysis_prompt(request)
             
             # LLM 호출
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=settings.OPENAI_MODEL,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=settings.LLM_TEMPERATURE,
-                max_tokens=settings.LLM_MAX_TOKENS
-            )
-            
-            llm_text = response.choices[0].message.content
+            llm_text = await chat_completion([{"role": "user", "content": prompt}])
             print(f"LLM 지역 분석 결과: {llm_text}")
             
             # 응답 파싱
@@ -0,0 +1,430 @@
+# Place Agent 공통 엔진
+# - place_agent.py(/analyze)와 start_server.py(/place-agent) 양쪽이 공유하는 핵심 로직
+# - 커넥션 풀을 재사용하는 카카오 로컬 API 클라이언트 + 응답 캐시
+# - NumPy 기반 벡터화 거리 계산 (Haversine)
+
+import asyncio
+import math
+import os
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+import numpy as np
+
+# 상위 디렉토리의 모듈들 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.data.seoul_gazetteer import gazetteer
+from config.settings import settings
+
+EARTH_RADIUS_KM = 6371.0
+METERS_PER_DEGREE = EARTH_RADIUS_KM * 1000 * math.pi / 180
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))  # 약 137.5도
+KAKAO_BASE_URL = "https://dapi.kakao.com"
+KEYWORD_SEARCH_PATH = "/v2/local/search/keyword.json"
+CATEGORY_SEARCH_PATH = "/v2/local/search/category.json"
+
+# 주변 지역 탐색에 사용하는 카테고리 (카페, 음식점, 문화시설, 관광명소, 주차장)
+NEARBY_AREA_CATEGORIES = ["CE7", "FD6", "CT1", "AT4", "PK6"]
+# 지역 내 장소 탐색에 사용하는 카테고리 (카페, 음식점, 문화시설, 관광명소, 지하철역)
+AREA_PLACE_CATEGORIES = ["CE7", "FD6", "CT1", "AT4", "SW8"]
+
+
+# ---------------------------------------------------------------------------
+# 거리 계산
+# ---------------------------------------------------------------------------
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 간 거리 (km)"""
+    lat1_rad, lat2_rad = math.radians(lat1), math.radians(lat2)
+    d_lat = lat2_rad - lat1_rad
+    d_lng = math.radians(lng2 - lng1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(d_lng / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def haversine_km_many(lat: float, lng: float, lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+    """한 좌표에서 여러 좌표까지의 거리 (km) - 벡터화"""
+    lats_rad = np.radians(np.asarray(lats, dtype=float))
+    lngs_rad = np.radians(np.asarray(lngs, dtype=float))
+    lat_rad, lng_rad = math.radians(lat), math.radians(lng)
+    a = (np.sin((lats_rad - lat_rad) / 2) ** 2
+         + math.cos(lat_rad) * np.cos(lats_rad) * np.sin((lngs_rad - lng_rad) / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def pairwise_haversine_km(lats: Sequence[float], lngs: Sequence[float]) -> np.ndarray:
+    """좌표 목록 간 거리 행렬 (km) - 벡터화"""
+    lats_rad = np.radians(np.asarray(lats, dtype=float))
+    lngs_rad = np.radians(np.asarray(lngs, dtype=float))
+    d_lat = lats_rad[:, None] - lats_rad[None, :]
+    d_lng = lngs_rad[:, None] - lngs_rad[None, :]
+    a = (np.sin(d_lat / 2) ** 2
+         + np.cos(lats_rad)[:, None] * np.cos(lats_rad)[None, :] * np.sin(d_lng / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(np.clip(1 - a, 0.0, None)))
+
+
+def cross_haversine_km(lats_a: Sequence[float], lngs_a: Sequence[float],
+                       lats_b: Sequence[float], lngs_b: Sequence[float]) -> np.ndarray:
+    """두 좌표 목록 간 거리 행렬 (len(a) x len(b), km) - 벡터화"""
+    lat_a = np.radians(np.asarray(lats_a, dtype=float))[:, None]
+    lng_a = np.radians(np.asarray(lngs_a, dtype=float))[:, None]
+    lat_b = np.radians(np.asarray(lats_b, dtype=float))[None, :]
+    lng_b = np.radians(np.asarray(lngs_b, dtype=float))[None, :]
+    a = np.sin((lat_b - lat_a) / 2) ** 2 + np.cos(lat_a) * np.cos(lat_b) * np.sin((lng_b - lng_a) / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(np.clip(1 - a, 0.0, None)))
+
+
+def filter_min_spacing(points: List[Dict], min_distance_km: float, limit: Optional[int] = None,
+                       existing: Optional[List[Dict]] = None) -> List[Dict]:
+    """
+    순서를 유지하며 서로 min_distance_km 이상 떨어진 좌표만 선택
+
+    Args:
+        points: "lat", "lng" 키를 가진 후보 목록 (우선순위 순)
+        limit: 최대 선택 개수
+        existing: 이미 선택된 좌표 (이들과도 간격 유지)
+    """
+    if not points:
+        return []
+    lats = np.array([p["lat"] for p in points], dtype=float)
+    lngs = np.array([p["lng"] for p in points], dtype=float)
+    dist = pairwise_haversine_km(lats, lngs)
+
+    blocked = np.zeros(len(points), dtype=bool)
+    if existing:
+        to_existing = cross_haversine_km(lats, lngs, [e["lat"] for e in existing], [e["lng"] for e in existing])
+        blocked |= (to_existing < min_distance_km).any(axis=1)
+
+    selected = []
+    for idx in range(len(points)):
+        if blocked[idx]:
+            continue
+        selected.append(points[idx])
+        if limit is not None and len(selected) >= limit:
+            break
+        blocked |= dist[idx] < min_distance_km
+    return selected
+
+
+# ---------------------------------------------------------------------------
+# 좌표 생성
+# ---------------------------------------------------------------------------
+
+def golden_spiral_offsets(count: int, spacing_m: float, rotation: float = 0.0) -> np.ndarray:
+    """
+    Vogel 나선(r = s·√k, θ = k·황금각) 오프셋 생성 (미터, [북, 동])
+
+    k=0은 중심점이며, 임의 두 점 사이 최소 거리는 k=0과 k=1 사이의 s이므로
+    재시도/비교 없이 한 번에 간격이 보장된 점들을 얻을 수 있다.
+    """
+    k = np.arange(count, dtype=float)
+    radius = spacing_m * np.sqrt(k)
+    theta = k * GOLDEN_ANGLE + rotation
+    return np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
+
+
+def spiral_coordinates(lat: float, lng: float, count: int, min_spacing_m: float,
+                       seed_key: str = "", precision: Optional[int] = None) -> np.ndarray:
+    """
+    중심 좌표 주변에 서로 min_spacing_m 이상 떨어진 count개 좌표 생성
+
+    Args:
+        seed_key: 나선 회전각을 정하는 키 (같은 키 → 항상 같은 결과)
+        precision: 반올림 자릿수 (반올림 오차만큼 간격에 여유를 둠)
+
+    Returns:
+        (count, 2) 배열 [[위도, 경도], ...] - 첫 번째는 중심 좌표
+    """
+    if count <= 0:
+        return np.empty((0, 2))
+
+    spacing = min_spacing_m * 1.01  # 평면 근사 오차 여유
+    if precision is not None:
+        # 각 점의 반올림 오차(최대 반 자리 × √2)가 두 점에서 반대로 생길 수 있음
+        spacing += 2 * math.sqrt(2) * 0.5 * 10 ** (-precision) * METERS_PER_DEGREE
+
+    rotation = (zlib.crc32(seed_key.encode("utf-8")) / 2 ** 32) * 2 * math.pi if seed_key else 0.0
+    offsets = golden_spiral_offsets(count, spacing, rotation)
+    lats = lat + offsets[:, 0] / METERS_PER_DEGREE
+    lngs = lng + offsets[:, 1] / (METERS_PER_DEGREE * math.cos(math.radians(lat)))
+    points = np.column_stack((lats, lngs))
+    if precision is not None:
+        points = np.round(points, precision)
+    return points
+
+
+def normalize_coordinates(lat: float, lng: float, precision: int = 4) -> Tuple[float, float]:
+    """좌표를 지정된 정확도로 정규화"""
+    return round(float(lat), precision), round(float(lng), precision)
+
+
+# ---------------------------------------------------------------------------
+# 캐시
+# ---------------------------------------------------------------------------
+
+class TTLCache:
+    """크기 제한이 있는 LRU + TTL 캐시"""
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Any, value: Any):
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Any) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] >= time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+# ---------------------------------------------------------------------------
+# 엔진
+# ---------------------------------------------------------------------------
+
+class PlaceEngine:
+    """지오코딩, 주변 지역/장소 검색을 담당하는 공통 엔진"""
+
+    def __init__(self):
+        """초기화 (HTTP 클라이언트는 첫 요청 시 생성)"""
+        self.kakao_api_key = os.getenv("KAKAO_API_KEY")
+        self._http: Optional[httpx.AsyncClient] = None
+        self.kakao_cache = TTLCache(max_size=settings.KAKAO_CACHE_SIZE, ttl_seconds=settings.KAKAO_CACHE_TTL)
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """카카오 API용 공유 AsyncClient (keep-alive 커넥션 풀)"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=KAKAO_BASE_URL,
+                headers={"Authorization": f"KakaoAK {self.kakao_api_key}"},
+                timeout=settings.KAKAO_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=settings.KAKAO_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.KAKAO_MAX_CONNECTIONS
+                )
+            )
+        return self._http
+
+    async def aclose(self):
+        """HTTP 커넥션 풀 정리 (서버 종료 시 호출)"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+
+    async def kakao_get(self, path: str, params: Dict[str, Any]) -> List[Dict]:
+        """
+        카카오 로컬 API GET (캐시 적용)
+
+        Returns:
+            documents 리스트 (실패 시 빈 리스트)
+        """
+        if not self.kakao_api_key:
+            return []
+
+        cache_key = (path, tuple(sorted(params.items())))
+        cached = self.kakao_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.http.get(path, params=params)
+        except httpx.HTTPError as e:
+            print(f"❌ 카카오 API 요청 실패: {e}")
+            return []
+
+        if response.status_code != 200:
+            print(f"❌ 카카오 API 오류: {response.status_code}")
+            return []
+
+        documents = response.json().get("documents", [])
+        self.kakao_cache.set(cache_key, documents)
+        return documents
+
+    async def kakao_geocode(self, area_name: str, strict: bool = True) -> Optional[Dict]:
+        """
+        카카오 키워드 검색으로 지역 좌표 조회
+
+        Args:
+            strict: True면 장소명/주소에 지역명이 포함된 결과만 허용,
+                    False면 매칭 결과가 없을 때 첫 검색 결과 사용
+
+        Returns:
+            {"lat", "lng", "address", "place_name"} 또는 None
+        """
+        if not self.kakao_api_key:
+            print(f"Kakao API 키가 없어 지역 조회 불가: {area_name}")
+            return None
+
+        search_queries = [
+            f"서울 {area_name}",
+            f"서울 {area_name}동",
+            f"서울 {area_name}역",
+            f"{area_name} 서울"
+        ]
+        # 기본 검색이 정확히 매칭되면 추가 호출 없이 반환, 아니면 나머지 패턴을 병렬 검색
+        first_results = [await self.kakao_get(KEYWORD_SEARCH_PATH, {"query": search_queries[0], "size": 5})]
+        first_document = first_results[0][0] if first_results[0] else None
+        matched = self._match_area(area_name, first_results)
+        if matched is None:
+            rest_results = await asyncio.gather(*(
+                self.kakao_get(KEYWORD_SEARCH_PATH, {"query": query, "size": 5})
+                for query in search_queries[1:]
+            ))
+            matched = self._match_area(area_name, rest_results)
+            if first_document is None:
+                first_document = next((docs[0] for docs in rest_results if docs), None)
+
+        if matched is not None:
+            return self._to_coordinate(matched)
+
+        if not strict and first_document:
+            return self._to_coordinate(first_document)
+
+        print(f"❌ {area_name} 정확한 좌표를 찾을 수 없음")
+        return None
+
+    def _match_area(self, area_name: str, results: List[List[Dict]]) -> Optional[Dict]:
+        """검색 결과 중 장소명/주소에 지역명이 포함된 첫 결과"""
+        for documents in results:
+            for place in documents:
+                place_name = place.get("place_name", "")
+                address = place.get("address_name", "")
+                if area_name in place_name or area_name in address or place_name in area_name:
+                    return place
+        return None
+
+    def _to_coordinate(self, place: Dict) -> Dict:
+        """카카오 검색 결과를 좌표 딕셔너리로 변환"""
+        lat, lng = normalize_coordinates(float(place["y"]), float(place["x"]))
+        return {
+            "lat": lat,
+            "lng": lng,
+            "address": place.get("address_name", ""),
+            "place_name": place.get("place_name", "")
+        }
+
+    async def geocode(self, area_name: str, strict: bool = True) -> Optional[Dict]:
+        """지역 좌표 조회 - 가제티어 우선, 없으면 카카오 API"""
+        area = gazetteer.lookup(area_name)
+        if area:
+            lat, lng = normalize_coordinates(area.lat, area.lng)
+            return {
+                "lat": lat,
+                "lng": lng,
+                "address": f"서울 {area.district} {area.name}",
+                "place_name": area.name
+            }
+        return await self.kakao_geocode(area_name, strict=strict)
+
+    async def find_nearby_areas(self, center_lat: float, center_lng: float, radius_km: float = 3.0,
+                                min_distance_m: float = 200, limit: int = 15) -> List[Dict]:
+        """중심 좌표 주변 지역들 검색 (카테고리별 요청 병렬 수행)"""
+        results = await asyncio.gather(*(
+            self.kakao_get(CATEGORY_SEARCH_PATH, {
+                "category_group_code": category,
+                "x": center_lng,
+                "y": center_lat,
+                "radius": int(radius_km * 1000),
+                "size": 15,
+                "sort": "distance"
+            })
+            for category in NEARBY_AREA_CATEGORIES
+        ))
+
+        candidates = []
+        for documents in results:
+            for place in documents:
+                place_lat, place_lng = normalize_coordinates(float(place["y"]), float(place["x"]))
+                address_parts = place.get("address_name", "").split()
+                if len(address_parts) >= 3:
+                    area_name = address_parts[2]  # 동/면 단위
+                elif len(address_parts) >= 2:
+                    area_name = address_parts[1]  # 구 단위
+                else:
+                    area_name = place.get("place_name", "알 수 없는 지역")
+                candidates.append({
+                    "lat": place_lat,
+                    "lng": place_lng,
+                    "area_name": area_name,
+                    "place_name": place.get("place_name", ""),
+                    "category": place.get("category_name", ""),
+                    "address": place.get("address_name", "")
+                })
+
+        nearby_areas = filter_min_spacing(candidates, min_distance_m / 1000)
+        if not nearby_areas:
+            return []
+
+        distances = haversine_km_many(
+            center_lat, center_lng,
+            [a["lat"] for a in nearby_areas], [a["lng"] for a in nearby_areas]
+        ) * 1000
+        for area, distance in zip(nearby_areas, distances):
+            area["distance"] = float(distance)
+
+        nearby_areas.sort(key=lambda x: x["distance"])
+        return nearby_areas[:limit]
+
+    async def search_area_places(self, area_name: str, count: int, min_distance_m: float = 200) -> List[Dict]:
+        """해당 지역의 실제 장소들을 카테고리별로 검색하여 서로 떨어진 좌표 반환"""
+        results = await asyncio.gather(*(
+            self.kakao_get(CATEGORY_SEARCH_PATH, {
+                "category_group_code": category,
+                "query": area_name,
+                "size": 15,
+                "sort": "accuracy"
+            })
+            for category in AREA_PLACE_CATEGORIES
+        ))
+
+        candidates = []
+        for documents in results:
+            for place in documents:
+                place_lat, place_lng = normalize_coordinates(float(place["y"]), float(place["x"]))
+                candidates.append({
+                    "lat": place_lat,
+                    "lng": place_lng,
+                    "sub_location": place.get("place_name", area_name),
+                    "detail": place.get("category_name", "일반"),
+                    "address": place.get("address_name", "")
+                })
+
+        return filter_min_spacing(candidates, min_distance_m / 1000, limit=count)
+
+    def stats(self) -> Dict[str, Any]:
+        """엔진 상태 (헬스 체크용)"""
+        return {
+            "kakao_api": "available" if self.kakao_api_key else "not configured",
+            "kakao_cache": self.kakao_cache.stats(),
+            "gazetteer_areas": len(gazetteer)
+        }
+
+
+# 엔진 인스턴스 (두 엔트리포인트가 공유)
+place_engine = PlaceEngine()
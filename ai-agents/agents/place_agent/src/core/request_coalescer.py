@@ -0,0 +1,95 @@
+# 동일 요청 병합 (Single-flight)
+# - request_id/timestamp를 제외한 요청 본문의 정규화 해시를 키로 사용
+# - 처리 중인 동일 요청은 같은 작업(Task)의 결과를 함께 기다림
+# - 성공한 결과는 짧은 TTL 동안 캐시하여 즉시 재시도를 흡수
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import sys
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# 상위 디렉토리의 모듈들 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.core.place_engine import TTLCache
+from config.settings import settings
+
+# 재시도마다 새로 생성되어 결과에 영향을 주지 않는 필드
+VOLATILE_FIELDS = ("request_id", "timestamp")
+
+
+def request_fingerprint(request_data: Dict[str, Any]) -> str:
+    """요청 본문의 정규화 해시 (키 순서/공백 무관, 휘발성 필드 제외)"""
+    body = {key: value for key, value in request_data.items() if key not in VOLATILE_FIELDS}
+    canonical = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RequestCoalescer:
+    """동일 요청 병합 + 단기 결과 캐시"""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 256):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._results = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.executed = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[Any]],
+                  is_cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        key에 해당하는 작업을 최대 1회만 실행하고 결과를 공유
+
+        Args:
+            key: request_fingerprint()로 만든 요청 키
+            factory: 실제 처리 코루틴을 생성하는 함수
+            is_cacheable: 결과를 TTL 캐시에 저장할지 판단 (기본: 모두 저장)
+
+        Returns:
+            처리 결과의 복사본 (호출자별로 안전하게 수정 가능)
+        """
+        cached = self._results.get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            print(f"♻️ 동일 요청 캐시 적중: {key[:12]}")
+            return copy.deepcopy(cached)
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(self._execute(key, factory, is_cacheable))
+            # 모든 대기자가 취소돼도 예외가 미확인 상태로 남지 않도록 처리
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+            print(f"🔗 처리 중인 동일 요청에 합류: {key[:12]}")
+
+        # 한 호출자가 연결을 끊어도 공유 작업은 계속 진행
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    async def _execute(self, key: str, factory: Callable[[], Awaitable[Any]],
+                       is_cacheable: Optional[Callable[[Any], bool]]) -> Any:
+        try:
+            result = await factory()
+            if is_cacheable is None or is_cacheable(result):
+                self._results.set(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """병합/캐시 통계 (헬스 체크용)"""
+        return {
+            "inflight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits
+        }
+
+
+# Place Agent 요청 병합기 인스턴스
+place_request_coalescer = RequestCoalescer(ttl_seconds=settings.RESULT_CACHE_TTL)
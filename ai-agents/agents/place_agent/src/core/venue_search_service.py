@@ -3,13 +3,21 @@
 # - 1.5km 이내 제한 로직 구현
 
 import asyncio
-import httpx
-import math
 import os
 import random
+import sys
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+# 상위 디렉토리의 모듈들 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.core.place_engine import (
+    place_engine, haversine_km, cross_haversine_km, pairwise_haversine_km,
+    CATEGORY_SEARCH_PATH, KEYWORD_SEARCH_PATH
+)
+from src.data.seoul_gazetteer import gazetteer
+from src.data.area_data import get_area_coordinates
+
 @dataclass
 class VenueInfo:
     """검색된 장소 정보"""
@@ -27,7 +35,8 @@ class VenueSearchService:
     
     def __init__(self):
         """초기화"""
-        self.kakao_api_key = os.getenv("KAKAO_API_KEY")
+        self.engine = place_engine
+        self.kakao_api_key = self.engine.kakao_api_key
         
         # 카카오 API 카테고리 코드 매핑
         self.category_codes = {
@@ -49,19 +58,24 @@ class VenueSearchService:
         
     def calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """두 좌표 간의 거리 계산 (km)"""
-        def to_radians(degree):
-            return degree * math.pi / 180
+        return haversine_km(lat1, lng1, lat2, lng2)
 
-        R = 6371  # 지구의 반지름 (km)
-        dLat = to_radians(lat2 - lat1)
-        dLng = to_radians(lng2 - lng1)
-        
-        a = (math.sin(dLat/2) * math.sin(dLat/2) + 
-             math.cos(to_radians(lat1)) * math.cos(to_radians(lat2)) * 
-             math.sin(dLng/2) * math.sin(dLng/2))
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+    def _area_center(self, area_name: str) -> Dict[str, float]:
+        """검색 중심 좌표 (가제티어 → 기본 지역 데이터)"""
+        return gazetteer.get_coordinates(area_name) or get_area_coordinates(area_name)
+
+    def _to_venue(self, place: Dict, category: str, area_name: str) -> VenueInfo:
+        """카카오 검색 결과를 VenueInfo로 변환"""
+        return VenueInfo(
+            name=place["place_name"],
+            latitude=float(place["y"]),
+            longitude=float(place["x"]),
+            address=place.get("address_name", ""),
+            category=category,
+            area_name=area_name,
+            distance=0.0,  # 거리는 나중에 계산
+            phone=place.get("phone", "")
+        )
     
     async def search_venues_by_category(self, area_name: str, category: str) -> List[VenueInfo]:
         """카테고리별 실제 장소 검색"""
@@ -89,97 +103,49 @@ class VenueSearchService:
     
     async def _search_by_category_code(self, area_name: str, category: str, category_code: str) -> List[VenueInfo]:
         """카테고리 코드로 검색"""
-        url = "https://dapi.kakao.com/v2/local/search/category.json"
-        headers = {"Authorization": f"KakaoAK {self.kakao_api_key}"}
         # 먼저 해당 지역의 중심 좌표를 가져와서 반경 검색
-        from src.data.area_data import get_area_coordinates
-        area_coords = get_area_coordinates(area_name)
+        area_coords = self._area_center(area_name)
         
-        params = {
+        documents = await self.engine.kakao_get(CATEGORY_SEARCH_PATH, {
             "category_group_code": category_code,
             "x": area_coords["longitude"],  # 경도
             "y": area_coords["latitude"],   # 위도
             "radius": 3000,  # 3km 반경으로 검색
             "size": 15,
             "sort": "distance"
-        }
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers, params=params)
-            
-        if response.status_code == 200:
-            data = response.json()
-            venues = []
-            
-            for place in data.get("documents", []):
-                venue_lat = float(place["y"])
-                venue_lng = float(place["x"])
-                
-                venues.append(VenueInfo(
-                    name=place["place_name"],
-                    latitude=venue_lat,
-                    longitude=venue_lng,
-                    address=place.get("address_name", ""),
-                    category=category,
-                    area_name=area_name,
-                    distance=0.0,  # 거리는 나중에 계산
-                    phone=place.get("phone", "")
-                ))
-            
-            return venues
-        else:
-            print(f"❌ 카카오 API 오류: {response.status_code}")
-            return []
+        })
+        return [self._to_venue(place, category, area_name) for place in documents]
     
     async def _search_by_keywords(self, area_name: str, category: str) -> List[VenueInfo]:
-        """키워드로 검색 (술집, 바 등)"""
-        url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-        headers = {"Authorization": f"KakaoAK {self.kakao_api_key}"}
-        
-        all_venues = []
+        """키워드로 검색 (술집, 바 등) - 키워드별 요청 병렬 수행"""
         keywords = self.bar_keywords if category in ["술집", "바"] else [category]
         
         # 먼저 해당 지역의 중심 좌표를 가져와서 반경 검색
-        from src.data.area_data import get_area_coordinates
-        area_coords = get_area_coordinates(area_name)
+        area_coords = self._area_center(area_name)
         
-        for keyword in keywords:
-            params = {
+        results = await asyncio.gather(*(
+            self.engine.kakao_get(KEYWORD_SEARCH_PATH, {
                 "query": f"{area_name} {keyword}",
                 "x": area_coords["longitude"],  # 경도
                 "y": area_coords["latitude"],   # 위도
                 "radius": 3000,  # 3km 반경으로 검색
                 "size": 10,
                 "sort": "distance"
-            }
-            
-            try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(url, headers=headers, params=params)
-                    
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    for place in data.get("documents", []):
-                        venue_lat = float(place["y"])
-                        venue_lng = float(place["x"])
-                        
-                        # 중복 제거 (같은 이름의 장소)
-                        if not any(v.name == place["place_name"] for v in all_venues):
-                            all_venues.append(VenueInfo(
-                                name=place["place_name"],
-                                latitude=venue_lat,
-                                longitude=venue_lng,
-                                address=place.get("address_name", ""),
-                                category=category,
-                                area_name=area_name,
-                                distance=0.0,  # 거리는 나중에 계산
-                                phone=place.get("phone", "")
-                            ))
-                
-            except Exception as e:
-                print(f"❌ 키워드 '{keyword}' 검색 실패: {e}")
+            })
+            for keyword in keywords
+        ), return_exceptions=True)
+        
+        all_venues = []
+        seen_names = set()
+        for keyword, documents in zip(keywords, results):
+            if isinstance(documents, Exception):
+                print(f"❌ 키워드 '{keyword}' 검색 실패: {documents}")
                 continue
+            for place in documents:
+                # 중복 제거 (같은 이름의 장소)
+                if place["place_name"] not in seen_names:
+                    seen_names.add(place["place_name"])
+                    all_venues.append(self._to_venue(place, category, area_name))
         
         return all_venues
     
@@ -193,30 +159,16 @@ class VenueSearchService:
             print(f"❌ {area_name}에서 {category} 장소를 찾을 수 없음")
             return None
         
-        # 같은 지역 내 기존 장소들과의 1.5km 이내 제약 확인
+        # 같은 지역 내 기존 장소들과의 1.5km 이내 제약 확인 (거리 행렬 한 번에 계산)
         if existing_venues:
             same_area_venues = [v for v in existing_venues if v.area_name == area_name]
             if same_area_venues:
-                filtered_venues = []
-                for venue in venues:
-                    is_within_constraint = True
-                    
-                    # 같은 지역 내 모든 기존 장소들과의 거리 확인
-                    for existing in same_area_venues:
-                        distance = self.calculate_distance(
-                            venue.latitude, venue.longitude,
-                            existing.latitude, existing.longitude
-                        )
-                        print(f"🔍 거리 확인: {venue.name} ↔ {existing.name} = {distance:.2f}km")
-                        if distance > max_distance_between_venues:  # 1.5km 초과시 제외
-                            is_within_constraint = False
-                            print(f"❌ {venue.name}이 {existing.name}로부터 {distance:.2f}km로 1.5km 초과")
-                            break
-                        else:
-                            print(f"✅ {venue.name}이 {existing.name}로부터 {distance:.2f}km로 1.5km 이내")
-                    
-                    if is_within_constraint:
-                        filtered_venues.append(venue)
+                distances = cross_haversine_km(
+                    [v.latitude for v in venues], [v.longitude for v in venues],
+                    [e.latitude for e in same_area_venues], [e.longitude for e in same_area_venues]
+                )
+                within = (distances <= max_distance_between_venues).all(axis=1)
+                filtered_venues = [venue for venue, ok in zip(venues, within) if ok]
                 
                 if filtered_venues:
                     venues = filtered_venues
@@ -242,19 +194,16 @@ class VenueSearchService:
             if len(group) < 2:
                 continue
                 
-            # 그룹 내 모든 장소 쌍의 거리 확인
-            for i in range(len(group)):
-                for j in range(i + 1, len(group)):
-                    venue1 = venues[group[i] - 1]  # 1-based index
-                    venue2 = venues[group[j] - 1]
-                    
-                    distance = self.calculate_distance(
-                        venue1.latitude, venue1.longitude,
-                        venue2.latitude, venue2.longitude
-                    )
-                    
-                    if distance > max_distance_km:
-                        print(f"❌ 거리 제한 위반: {venue1.name} - {venue2.name} ({distance:.2f}km > {max_distance_km}km)")
-                        return False
+            # 그룹 내 모든 장소 쌍의 거리 확인 (거리 행렬)
+            group_venues = [venues[place_num - 1] for place_num in group]  # 1-based index
+            distances = pairwise_haversine_km(
+                [v.latitude for v in group_venues], [v.longitude for v in group_venues]
+            )
+            violations = list(zip(*(distances > max_distance_km).nonzero()))
+            if violations:
+                i, j = violations[0]
+                venue1, venue2 = group_venues[i], group_venues[j]
+                print(f"❌ 거리 제한 위반: {venue1.name} - {venue2.name} ({distances[i, j]:.2f}km > {max_distance_km}km)")
+                return False
         
         return True
\ No newline at end of file
@@ -0,0 +1,362 @@
+# 서울 지역 가제티어 (Gazetteer)
+# - 동/역/핫플레이스 단위 좌표, 분위기 태그, 인접 지역 데이터
+# - KD-트리 인덱스로 외부 API 없이 근접 지역 검색 및 지오코딩
+
+import math
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 상위 디렉토리의 모듈들 import
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+from src.data.area_data import AREA_CENTERS
+
+# 인접 지역으로 간주하는 반경 (km)
+ADJACENCY_RADIUS_KM = 2.5
+
+# 위도 1도당 거리 (km) - 서울 위도 기준 평면 근사에 사용
+KM_PER_DEG_LAT = 110.574
+SEOUL_REFERENCE_LAT = 37.55
+KM_PER_DEG_LNG = 111.320 * math.cos(math.radians(SEOUL_REFERENCE_LAT))
+
+# AREA_CENTERS에 정의된 지역의 부가 정보: (유형, 구, 분위기 태그, 별칭)
+_AREA_CENTER_META = {
+    "홍대": ("핫플", "마포구", ("트렌디", "활기찬", "나이트라이프", "문화예술"), ("홍대입구", "홍익대")),
+    "강남": ("핫플", "강남구", ("세련된", "쇼핑", "맛집", "나이트라이프"), ()),
+    "강남역": ("역", "강남구", ("활기찬", "쇼핑", "맛집"), ()),
+    "이태원": ("핫플", "용산구", ("이색", "글로벌", "나이트라이프", "맛집"), ()),
+    "성수": ("핫플", "성동구", ("힙", "트렌디", "카페", "문화예술"), ("성수동", "성수역")),
+    "연남": ("동", "마포구", ("감성", "조용한", "카페", "산책"), ("연남동", "연트럴파크")),
+    "신촌": ("핫플", "서대문구", ("대학가", "활기찬", "가성비"), ("신촌역",)),
+    "명동": ("핫플", "중구", ("쇼핑", "관광", "활기찬"), ("명동역",)),
+    "인사동": ("핫플", "종로구", ("전통", "문화예술", "조용한"), ()),
+    "압구정": ("핫플", "강남구", ("고급", "세련된", "쇼핑"), ("압구정역", "압구정동")),
+    "건대": ("핫플", "광진구", ("대학가", "활기찬", "가성비", "맛집"), ("건대입구", "건국대")),
+    "여의도": ("핫플", "영등포구", ("한강", "야경", "산책", "세련된"), ("여의도동",)),
+    "잠실": ("핫플", "송파구", ("쇼핑", "활기찬", "야경", "테마파크"), ("잠실역", "롯데월드")),
+    "고대": ("핫플", "성북구", ("대학가", "가성비", "조용한"), ("고려대", "안암")),
+    "이촌동": ("동", "용산구", ("한강", "조용한", "산책"), ("이촌",)),
+}
+
+# 추가 지역: (이름, 유형, 구, 위도, 경도, 분위기 태그, 별칭)
+_EXTRA_AREAS = [
+    ("합정", "역", "마포구", 37.5495, 126.9139, ("감성", "카페", "맛집"), ("합정역", "합정동")),
+    ("망원", "동", "마포구", 37.5560, 126.9101, ("감성", "가성비", "맛집", "시장"), ("망원동", "망리단길")),
+    ("상수", "역", "마포구", 37.5478, 126.9229, ("감성", "카페", "나이트라이프"), ("상수역", "상수동")),
+    ("망원한강공원", "핫플", "마포구", 37.5551, 126.8950, ("한강", "산책", "자연", "야경"), ()),
+    ("공덕", "역", "마포구", 37.5443, 126.9515, ("맛집", "활기찬"), ("공덕역",)),
+    ("상암", "동", "마포구", 37.5770, 126.8900, ("자연", "산책", "문화예술"), ("DMC", "상암동", "하늘공원")),
+    ("이대", "핫플", "서대문구", 37.5567, 126.9460, ("대학가", "쇼핑", "가성비"), ("이대입구", "이화여대")),
+    ("연희동", "동", "서대문구", 37.5680, 126.9310, ("조용한", "감성", "카페"), ("연희",)),
+    ("서촌", "동", "종로구", 37.5794, 126.9706, ("전통", "감성", "조용한", "산책"), ("통인시장", "경복궁역")),
+    ("북촌", "동", "종로구", 37.5826, 126.9836, ("전통", "한옥", "산책", "조용한"), ("북촌한옥마을", "안국")),
+    ("삼청동", "동", "종로구", 37.5847, 126.9811, ("전통", "감성", "카페", "산책"), ("삼청",)),
+    ("익선동", "동", "종로구", 37.5743, 126.9895, ("한옥", "감성", "트렌디", "맛집"), ("익선",)),
+    ("종로3가", "역", "종로구", 37.5714, 126.9918, ("가성비", "맛집", "나이트라이프"), ("종로",)),
+    ("광화문", "핫플", "종로구", 37.5709, 126.9768, ("전통", "관광", "산책"), ("광화문광장",)),
+    ("경복궁", "핫플", "종로구", 37.5796, 126.9770, ("전통", "관광", "산책"), ()),
+    ("광장시장", "핫플", "종로구", 37.5700, 126.9996, ("시장", "맛집", "가성비", "전통"), ()),
+    ("대학로", "핫플", "종로구", 37.5822, 127.0019, ("문화예술", "공연", "대학가"), ("혜화", "혜화역")),
+    ("낙산공원", "핫플", "종로구", 37.5806, 127.0074, ("야경", "산책", "자연"), ("이화벽화마을",)),
+    ("동묘", "역", "종로구", 37.5733, 127.0165, ("시장", "이색", "가성비"), ("동묘앞", "동묘벼룩시장")),
+    ("을지로", "핫플", "중구", 37.5660, 126.9910, ("힙", "레트로", "나이트라이프", "맛집"), ("힙지로", "을지로3가")),
+    ("시청", "역", "중구", 37.5658, 126.9751, ("전통", "산책", "관광"), ("덕수궁", "시청역", "서울시청")),
+    ("청계천", "핫플", "중구", 37.5690, 126.9787, ("산책", "야경", "도심"), ("청계광장",)),
+    ("남산", "핫플", "중구", 37.5512, 126.9882, ("야경", "산책", "자연", "관광"), ("남산타워", "N서울타워")),
+    ("충무로", "역", "중구", 37.5612, 126.9942, ("레트로", "맛집"), ("충무로역",)),
+    ("동대문", "핫플", "중구", 37.5663, 127.0092, ("쇼핑", "야경", "문화예술"), ("DDP", "동대문디자인플라자")),
+    ("신당동", "동", "중구", 37.5659, 127.0178, ("힙", "맛집", "레트로"), ("신당", "힙당동")),
+    ("서울역", "역", "중구", 37.5547, 126.9707, ("교통중심", "쇼핑"), ("서울로7017",)),
+    ("용산", "역", "용산구", 37.5298, 126.9648, ("쇼핑", "교통중심"), ("용산역", "아이파크몰")),
+    ("용리단길", "핫플", "용산구", 37.5295, 126.9680, ("트렌디", "맛집", "감성"), ("신용산",)),
+    ("삼각지", "역", "용산구", 37.5347, 126.9731, ("문화예술", "레트로", "맛집"), ("삼각지역", "전쟁기념관")),
+    ("해방촌", "동", "용산구", 37.5420, 126.9865, ("이색", "야경", "감성"), ("해방촌오거리",)),
+    ("경리단길", "핫플", "용산구", 37.5392, 126.9880, ("이색", "글로벌", "카페"), ("경리단",)),
+    ("한남동", "동", "용산구", 37.5346, 127.0027, ("고급", "세련된", "문화예술", "카페"), ("한남",)),
+    ("서울숲", "핫플", "성동구", 37.5444, 127.0374, ("자연", "산책", "감성"), ("서울숲공원",)),
+    ("뚝섬", "역", "성동구", 37.5472, 127.0474, ("힙", "카페"), ("뚝섬역",)),
+    ("왕십리", "역", "성동구", 37.5612, 127.0371, ("쇼핑", "가성비", "교통중심"), ("왕십리역",)),
+    ("뚝섬유원지", "핫플", "광진구", 37.5317, 127.0668, ("한강", "산책", "야경"), ("뚝섬한강공원",)),
+    ("어린이대공원", "핫플", "광진구", 37.5481, 127.0748, ("자연", "산책", "테마파크"), ()),
+    ("석촌호수", "핫플", "송파구", 37.5093, 127.1043, ("산책", "야경", "자연"), ("석촌",)),
+    ("송리단길", "핫플", "송파구", 37.5097, 127.1083, ("트렌디", "카페", "맛집"), ("송파동",)),
+    ("방이동", "동", "송파구", 37.5146, 127.1159, ("맛집", "나이트라이프", "가성비"), ("방이",)),
+    ("올림픽공원", "핫플", "송파구", 37.5207, 127.1214, ("자연", "산책", "공연"), ()),
+    ("천호", "역", "강동구", 37.5386, 127.1236, ("쇼핑", "맛집", "가성비"), ("천호역",)),
+    ("신논현", "역", "강남구", 37.5045, 127.0250, ("맛집", "나이트라이프", "활기찬"), ("신논현역",)),
+    ("가로수길", "핫플", "강남구", 37.5207, 127.0229, ("트렌디", "쇼핑", "카페", "세련된"), ("신사동", "신사역")),
+    ("압구정로데오", "핫플", "강남구", 37.5274, 127.0405, ("트렌디", "고급", "맛집"), ("로데오",)),
+    ("청담", "동", "강남구", 37.5249, 127.0472, ("고급", "세련된", "쇼핑"), ("청담동", "청담역")),
+    ("삼성", "핫플", "강남구", 37.5116, 127.0595, ("쇼핑", "문화예술", "실내"), ("코엑스", "삼성역", "별마당도서관")),
+    ("선릉", "역", "강남구", 37.5045, 127.0490, ("조용한", "산책", "전통"), ("선릉역", "선정릉")),
+    ("역삼", "역", "강남구", 37.5006, 127.0364, ("맛집", "세련된"), ("역삼역", "역삼동")),
+    ("양재", "역", "서초구", 37.4841, 127.0346, ("조용한", "맛집"), ("양재역",)),
+    ("양재시민의숲", "핫플", "서초구", 37.4700, 127.0385, ("자연", "산책", "조용한"), ("시민의숲",)),
+    ("서래마을", "동", "서초구", 37.4980, 126.9975, ("글로벌", "조용한", "고급", "카페"), ("서래",)),
+    ("교대", "역", "서초구", 37.4934, 127.0141, ("맛집", "가성비"), ("교대역",)),
+    ("고속터미널", "역", "서초구", 37.5049, 127.0049, ("쇼핑", "교통중심", "실내"), ("고터", "센트럴시티")),
+    ("반포한강공원", "핫플", "서초구", 37.5104, 126.9961, ("한강", "야경", "산책"), ("세빛섬", "반포대교")),
+    ("사당", "역", "동작구", 37.4765, 126.9816, ("맛집", "가성비", "나이트라이프"), ("사당역",)),
+    ("노량진", "역", "동작구", 37.5130, 126.9425, ("시장", "가성비", "맛집"), ("노량진수산시장",)),
+    ("여의나루", "핫플", "영등포구", 37.5271, 126.9326, ("한강", "야경", "산책"), ("여의도한강공원",)),
+    ("영등포", "역", "영등포구", 37.5157, 126.9076, ("쇼핑", "가성비"), ("영등포역", "타임스퀘어")),
+    ("문래", "동", "영등포구", 37.5150, 126.8950, ("힙", "레트로", "문화예술"), ("문래동", "문래창작촌")),
+    ("당산", "역", "영등포구", 37.5343, 126.9020, ("한강", "맛집"), ("당산역",)),
+    ("목동", "동", "양천구", 37.5268, 126.8752, ("조용한", "쇼핑", "맛집"), ("목동역",)),
+    ("신도림", "역", "구로구", 37.5088, 126.8913, ("쇼핑", "실내", "교통중심"), ("신도림역",)),
+    ("구로디지털단지", "역", "구로구", 37.4852, 126.9015, ("맛집", "가성비"), ("구디",)),
+    ("가산디지털단지", "역", "금천구", 37.4815, 126.8826, ("쇼핑", "가성비"), ("가디", "가산")),
+    ("마곡", "동", "강서구", 37.5602, 126.8254, ("자연", "조용한", "산책"), ("마곡나루",)),
+    ("서울식물원", "핫플", "강서구", 37.5695, 126.8350, ("자연", "산책", "실내"), ("식물원",)),
+    ("신림", "역", "관악구", 37.4842, 126.9297, ("가성비", "맛집", "나이트라이프"), ("신림역",)),
+    ("샤로수길", "핫플", "관악구", 37.4812, 126.9527, ("트렌디", "맛집", "가성비"), ("서울대입구",)),
+    ("성신여대", "역", "성북구", 37.5927, 127.0166, ("대학가", "가성비", "쇼핑"), ("성신여대입구",)),
+    ("성북동", "동", "성북구", 37.5927, 126.9989, ("전통", "조용한", "고급", "문화예술"), ("성북",)),
+    ("청량리", "역", "동대문구", 37.5800, 127.0470, ("시장", "가성비", "교통중심"), ("청량리역", "경동시장")),
+    ("회기", "역", "동대문구", 37.5895, 127.0578, ("대학가", "가성비"), ("회기역", "경희대")),
+    ("수유", "역", "강북구", 37.6380, 127.0257, ("가성비", "맛집"), ("수유역",)),
+    ("창동", "역", "도봉구", 37.6532, 127.0477, ("문화예술", "공연"), ("창동역",)),
+    ("노원", "역", "노원구", 37.6552, 127.0616, ("대학가", "가성비", "쇼핑"), ("노원역",)),
+    ("경춘선숲길", "핫플", "노원구", 37.6256, 127.0730, ("자연", "산책", "감성"), ("공릉", "공릉동")),
+    ("불광", "역", "은평구", 37.6103, 126.9297, ("자연", "산책"), ("불광역", "북한산")),
+    ("연신내", "역", "은평구", 37.6190, 126.9210, ("가성비", "맛집", "나이트라이프"), ("연신내역",)),
+]
+
+
+@dataclass
+class GazetteerArea:
+    """가제티어에 등록된 지역 정보"""
+    name: str
+    lat: float
+    lng: float
+    kind: str  # "동", "역", "핫플"
+    district: str  # 소속 구
+    vibe_tags: Tuple[str, ...]
+    aliases: Tuple[str, ...] = ()
+    neighbors: List[str] = field(default_factory=list)  # 인접 지역명 (거리순)
+
+    def to_candidate(self, distance_m: float = 0.0) -> Dict:
+        """LLM 프롬프트/좌표 매칭에 쓰이는 후보 딕셔너리로 변환"""
+        return {
+            "area_name": self.name,
+            "lat": self.lat,
+            "lng": self.lng,
+            "category": f"{self.kind} · {', '.join(self.vibe_tags)}",
+            "district": self.district,
+            "distance": distance_m,
+        }
+
+
+def _project(lat: float, lng: float) -> Tuple[float, float]:
+    """위경도를 서울 기준 평면 좌표(km)로 근사 변환"""
+    return (lng * KM_PER_DEG_LNG, lat * KM_PER_DEG_LAT)
+
+
+def _normalize_name(name: str) -> str:
+    """지역명 비교용 정규화 (공백/접두어/접미어 제거)"""
+    normalized = name.replace(" ", "").strip()
+    if normalized.startswith("서울특별시"):
+        normalized = normalized[len("서울특별시"):]
+    elif normalized.startswith("서울시"):
+        normalized = normalized[len("서울시"):]
+    elif normalized.startswith("서울") and len(normalized) > 2 and normalized != "서울역" and normalized != "서울숲":
+        normalized = normalized[len("서울"):]
+    for suffix in ("입구역", "역", "동"):
+        if normalized.endswith(suffix) and len(normalized) > len(suffix) + 1:
+            return normalized[:-len(suffix)]
+    return normalized
+
+
+class _KDTree:
+    """2차원 KD-트리 (평면 근사 좌표, km 단위)"""
+
+    def __init__(self, points: List[Tuple[float, float, int]]):
+        self._root = self._build(points, depth=0)
+
+    def _build(self, points: List[Tuple[float, float, int]], depth: int):
+        if not points:
+            return None
+        axis = depth % 2
+        points = sorted(points, key=lambda p: p[axis])
+        median = len(points) // 2
+        return (
+            points[median],
+            axis,
+            self._build(points[:median], depth + 1),
+            self._build(points[median + 1:], depth + 1),
+        )
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[float, int]]:
+        """반경 내 모든 점 반환: [(거리, 인덱스)] (거리순)"""
+        found = []
+        stack = [self._root]
+        radius_sq = radius * radius
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            point, axis, left, right = node
+            dx, dy = point[0] - x, point[1] - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq <= radius_sq:
+                found.append((math.sqrt(dist_sq), point[2]))
+            diff = (x, y)[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append(near)
+            if diff * diff <= radius_sq:
+                stack.append(far)
+        found.sort()
+        return found
+
+    def query_nearest(self, x: float, y: float, k: int) -> List[Tuple[float, int]]:
+        """가장 가까운 k개 점 반환: [(거리, 인덱스)] (거리순)"""
+        best: List[Tuple[float, int]] = []
+
+        def visit(node):
+            if node is None:
+                return
+            point, axis, left, right = node
+            dx, dy = point[0] - x, point[1] - y
+            dist_sq = dx * dx + dy * dy
+            if len(best) < k:
+                best.append((dist_sq, point[2]))
+                best.sort()
+            elif dist_sq < best[-1][0]:
+                best[-1] = (dist_sq, point[2])
+                best.sort()
+            diff = (x, y)[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(best) < k or diff * diff < best[-1][0]:
+                visit(far)
+
+        visit(self._root)
+        return [(math.sqrt(d), idx) for d, idx in best]
+
+
+class SeoulGazetteer:
+    """서울 지역 가제티어 - 이름 조회 및 KD-트리 기반 근접 검색"""
+
+    def __init__(self, areas: Optional[Iterable[GazetteerArea]] = None):
+        """초기화 (기본값: AREA_CENTERS + 추가 지역 데이터)"""
+        self.areas: List[GazetteerArea] = list(areas) if areas is not None else build_default_areas()
+        self._name_index: Dict[str, int] = {}
+        for idx, area in enumerate(self.areas):
+            for key in (area.name,) + tuple(area.aliases):
+                self._name_index.setdefault(key, idx)
+                self._name_index.setdefault(_normalize_name(key), idx)
+
+        self._tree = _KDTree([(*_project(a.lat, a.lng), idx) for idx, a in enumerate(self.areas)])
+        self._build_adjacency()
+
+    def _build_adjacency(self):
+        """반경 ADJACENCY_RADIUS_KM 이내 지역을 인접 지역으로 등록"""
+        for idx, area in enumerate(self.areas):
+            x, y = _project(area.lat, area.lng)
+            area.neighbors = [
+                self.areas[other].name
+                for _, other in self._tree.query_radius(x, y, ADJACENCY_RADIUS_KM)
+                if other != idx
+            ]
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def lookup(self, area_name: str) -> Optional[GazetteerArea]:
+        """지역명(별칭 포함)으로 지역 조회"""
+        if not area_name:
+            return None
+        idx = self._name_index.get(area_name)
+        if idx is None:
+            idx = self._name_index.get(_normalize_name(area_name))
+        return self.areas[idx] if idx is not None else None
+
+    def get_coordinates(self, area_name: str) -> Optional[Dict[str, float]]:
+        """지역명으로 좌표 조회 ({"latitude", "longitude"} 형식)"""
+        area = self.lookup(area_name)
+        if not area:
+            return None
+        return {"latitude": area.lat, "longitude": area.lng}
+
+    def nearest(self, lat: float, lng: float, k: int = 5) -> List[Tuple[GazetteerArea, float]]:
+        """좌표에서 가장 가까운 k개 지역: [(지역, 거리(m))]"""
+        x, y = _project(lat, lng)
+        return [(self.areas[idx], dist_km * 1000) for dist_km, idx in self._tree.query_nearest(x, y, k)]
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> List[Tuple[GazetteerArea, float]]:
+        """좌표 반경 내 지역 목록: [(지역, 거리(m))] (거리순)"""
+        x, y = _project(lat, lng)
+        return [(self.areas[idx], dist_km * 1000) for dist_km, idx in self._tree.query_radius(x, y, radius_km)]
+
+    def neighbors(self, area_name: str) -> List[GazetteerArea]:
+        """인접 지역 목록"""
+        area = self.lookup(area_name)
+        if not area:
+            return []
+        return [self.lookup(name) for name in area.neighbors]
+
+    def candidates_for(self, lat: float, lng: float, limit: int = 8, radius_km: float = 15.0,
+                       preferences: Optional[List[str]] = None,
+                       exclude: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        LLM이 순위만 매길 수 있도록 짧은 후보 목록 생성
+
+        - 반경 내 지역 중 구(district)가 겹치지 않게 선별
+        - 사용자 선호 키워드와 분위기 태그가 겹칠수록 우선
+
+        Returns:
+            후보 딕셔너리 리스트 (area_name, lat, lng, category, district, distance)
+        """
+        excluded = {_normalize_name(name) for name in (exclude or [])}
+        preference_text = " ".join(preferences or [])
+
+        scored = []
+        for area, distance_m in self.within_radius(lat, lng, radius_km):
+            if _normalize_name(area.name) in excluded or distance_m < 1.0:
+                continue
+            tag_hits = sum(1 for tag in area.vibe_tags if tag in preference_text)
+            # 태그 1개 일치 = 약 3km 가까운 것과 동일하게 취급
+            score = distance_m / 1000 - tag_hits * 3.0
+            scored.append((score, distance_m, area))
+        scored.sort(key=lambda item: (item[0], item[1]))
+
+        candidates = []
+        used_districts = set()
+        for _, distance_m, area in scored:
+            if area.district in used_districts:
+                continue
+            used_districts.add(area.district)
+            candidates.append(area.to_candidate(distance_m))
+            if len(candidates) >= limit:
+                return candidates
+
+        # 구 단위 다양성만으로 부족하면 남은 지역으로 채움
+        chosen = {c["area_name"] for c in candidates}
+        for _, distance_m, area in scored:
+            if len(candidates) >= limit:
+                break
+            if area.name not in chosen:
+                candidates.append(area.to_candidate(distance_m))
+        return candidates
+
+
+def build_default_areas() -> List[GazetteerArea]:
+    """AREA_CENTERS와 추가 지역 데이터를 합쳐 가제티어 레코드 생성"""
+    areas = []
+    for name, info in AREA_CENTERS.items():
+        kind, district, tags, aliases = _AREA_CENTER_META.get(name, ("핫플", "", ("일반",), ()))
+        areas.append(GazetteerArea(
+            name=name, lat=info["lat"], lng=info["lng"],
+            kind=kind, district=district, vibe_tags=tags, aliases=aliases
+        ))
+    for name, kind, district, lat, lng, tags, aliases in _EXTRA_AREAS:
+        areas.append(GazetteerArea(
+            name=name, lat=lat, lng=lng,
+            kind=kind, district=district, vibe_tags=tags, aliases=aliases
+        ))
+    return areas
+
+
+# 가제티어 인스턴스 (모듈 로드 시 1회 인덱싱)
+gazetteer = SeoulGazetteer()
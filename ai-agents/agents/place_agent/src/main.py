@@ -15,6 +15,7 @@ from src.models.response_models import PlaceAgentResponse, LocationResponse, Coo
 from src.core.location_analyzer import LocationAnalyzer
 from src.core.coordinates_service import CoordinatesService
 from src.core.venue_search_service import VenueSearchService
+from src.core.place_engine import place_engine
 from config.settings import settings
 
 class PlaceAgent:
@@ -70,21 +71,16 @@ class PlaceAgent:
                     error_message="적합한 지역을 찾을 수 없습니다."
                 ).model_dump()
             
-            # 3. 각 지역에 대한 좌표 조회
+            # 3. 각 지역에 대한 좌표 조회 (동시 조회 + 새 지역 LLM 분석 일괄 처리)
+            coords_by_area = await self.coordinates_service.get_coordinates_for_areas(
+                areas, request.user_context
+            )
+            # 같은 지역 내 다양성을 위한 좌표 분산 (지역별 한 번에 생성)
+            diversified = self.coordinates_service.diversify_area_coordinates(areas, coords_by_area)
             locations = []
             for i, (area_name, reason) in enumerate(zip(areas, reasons)):
                 try:
-                    # 좌표 조회
-                    coords = await self.coordinates_service.get_coordinates_for_area(
-                        area_name, request.user_context
-                    )
-                    
-                    # 같은 지역 내 다양성을 위한 미세 조정
-                    if len([a for a in areas if a == area_name]) > 1:
-                        same_area_index = [j for j, a in enumerate(areas[:i+1]) if a == area_name][-1]
-                        coords = self.coordinates_service.adjust_coordinates_for_diversity(
-                            coords, same_area_index, len([a for a in areas if a == area_name])
-                        )
+                    coords = diversified[i]
                     
                     # 좌표 유효성 검증
                     if not self.coordinates_service.validate_coordinates(coords):
@@ -368,21 +364,16 @@ class PlaceAgent:
             
             print(f"🎯 [PRIORITY] 처리된 지역 목록: {areas}")
             
-            # 3. 각 지역에 대한 좌표 조회
+            # 3. 각 지역에 대한 좌표 조회 (동시 조회 + 새 지역 LLM 분석 일괄 처리)
+            coords_by_area = await self.coordinates_service.get_coordinates_for_areas(
+                areas, request.user_context
+            )
+            # 같은 지역 내 다양성을 위한 좌표 분산 (지역별 한 번에 생성)
+            diversified = self.coordinates_service.diversify_area_coordinates(areas, coords_by_area)
             locations = []
             for i, (area_name, reason) in enumerate(zip(areas, reasons)):
                 try:
-                    # 좌표 조회
-                    coords = await self.coordinates_service.get_coordinates_for_area(
-                        area_name, request.user_context
-                    )
-                    
-                    # 같은 지역 내 다양성을 위한 미세 조정
-                    if len([a for a in areas if a == area_name]) > 1:
-                        same_area_index = [j for j, a in enumerate(areas[:i+1]) if a == area_name][-1]
-                        coords = self.coordinates_service.adjust_coordinates_for_diversity(
-                            coords, same_area_index, len([a for a in areas if a == area_name])
-                        )
+                    coords = diversified[i]
                     
                     # 좌표 유효성 검증
                     if not self.coordinates_service.validate_coordinates(coords):
@@ -431,13 +422,14 @@ class PlaceAgent:
                 error_message=f"사용자 지정 지역 처리 중 오류가 발생했습니다: {str(e)}"
             ).model_dump()
     
-    async def health_check(self) -> Dict[str, str]:
+    async def health_check(self) -> Dict[str, Any]:
         """헬스 체크"""
         return {
             "status": "healthy",
             "service": "place-agent",
             "version": "2.0.0",
-            "port": str(settings.SERVER_PORT)
+            "port": str(settings.SERVER_PORT),
+            "engine": place_engine.stats()
         }
 
 # 직접 실행 테스트용
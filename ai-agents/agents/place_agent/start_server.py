@@ -14,6 +14,8 @@ from typing import Dict, Any
 sys.path.append(os.path.dirname(__file__))
 from src.main import PlaceAgent
 from src.models.request_models import PlaceAgentRequest
+from src.core.place_engine import place_engine
+from src.core.request_coalescer import place_request_coalescer, request_fingerprint
 from config.settings import settings
 
 # FastAPI 앱 생성
@@ -35,6 +37,11 @@ app.add_middleware(
 # Place Agent 인스턴스
 place_agent = PlaceAgent()
 
+@app.on_event("shutdown")
+async def shutdown_engine():
+    """공통 엔진의 HTTP 커넥션 풀 정리"""
+    await place_engine.aclose()
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -48,7 +55,9 @@ async def root():
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return await place_agent.health_check()
+    status = await place_agent.health_check()
+    status["coalescer"] = place_request_coalescer.stats()
+    return status
 
 @app.post("/place-agent")
 async def process_place_request(request_data: Dict[str, Any]):
@@ -64,8 +73,13 @@ async def process_place_request(request_data: Dict[str, Any]):
     try:
         print(f"📥 Place Agent 요청 수신: {request_data.get('request_id', 'unknown')}")
         
-        # Place Agent로 요청 처리
-        result = await place_agent.process_request(request_data)
+        # Place Agent로 요청 처리 (동일 요청은 병합, 직전 성공 결과는 재사용)
+        result = await place_request_coalescer.run(
+            request_fingerprint(request_data),
+            lambda: place_agent.process_request(request_data),
+            is_cacheable=lambda r: r.get("success", False)
+        )
+        result["request_id"] = request_data.get("request_id", result.get("request_id"))
         
         return result
         
@@ -0,0 +1,144 @@
+"""
+메인 에이전트 HTTP 클라이언트 (백엔드 → 메인 에이전트)
+- 앱 수명 동안 aiohttp 세션 1개를 공유해 연결을 재사용 (요청마다 새 세션/핸드셰이크 없음)
+- 엔드포인트 종류별 타임아웃: 채팅(짧게), 추천(길게), 조회(GET)
+- 멱등 GET은 연결 오류/타임아웃/5xx 시 재시도
+- 엔드포인트별 지연시간 히스토그램은 /health/agent-client로 노출
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+AGENT_BASE_URL = os.getenv("AGENT_BASE_URL", "http://localhost:8001")
+AGENT_CHAT_TIMEOUT = float(os.getenv("AGENT_CHAT_TIMEOUT", 60))  # 새 세션/메시지 전송 (LLM 1턴)
+AGENT_RECOMMENDATION_TIMEOUT = float(os.getenv("AGENT_RECOMMENDATION_TIMEOUT", 120))  # 코스 추천 (작업 완료까지)
+AGENT_GET_TIMEOUT = float(os.getenv("AGENT_GET_TIMEOUT", 10))  # 상태/프로필 조회
+AGENT_GET_RETRIES = int(os.getenv("AGENT_GET_RETRIES", 2))
+AGENT_RETRY_BACKOFF = 0.2  # 재시도 대기 (초, 시도마다 2배)
+AGENT_POOL_LIMIT = int(os.getenv("AGENT_POOL_LIMIT", 100))  # 동시 연결 수
+AGENT_KEEPALIVE_SECONDS = 30
+
+# 히스토그램 구간 상한 (ms)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class LatencyHistogram:
+    """엔드포인트 1개의 지연시간 분포"""
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # 마지막은 상한 초과
+        self.total = 0
+        self.errors = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float, ok: bool):
+        index = next((i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound), len(LATENCY_BUCKETS_MS))
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not ok:
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.total,
+            "errors": self.errors,
+            "avg_ms": round(self.sum_ms / self.total, 1) if self.total else 0.0,
+            "max_ms": round(self.max_ms, 1),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class AgentClient:
+    """메인 에이전트 API 클라이언트 (앱 수명 동안 공유)"""
+
+    def __init__(self, base_url: str = AGENT_BASE_URL, pool_limit: int = AGENT_POOL_LIMIT,
+                 get_retries: int = AGENT_GET_RETRIES):
+        self.base_url = base_url
+        self.pool_limit = pool_limit
+        self.get_retries = get_retries
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.retries = 0
+
+    async def start(self):
+        """공유 세션 생성 (이미 있으면 무시)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_limit, keepalive_timeout=AGENT_KEEPALIVE_SECONDS)
+            self._session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None,
+                      timeout: float = None, label: str = None) -> Dict[str, Any]:
+        """에이전트 API 호출 (실패 시 {"success": False, "error": ...} 반환)
+
+        label: 히스토그램 이름 (경로에 ID가 들어가는 엔드포인트는 템플릿 경로로 지정)
+        """
+        if self._session is None or self._session.closed:
+            # 앱 수명 밖(스크립트 등)에서 호출된 경우
+            await self.start()
+        if timeout is None:
+            timeout = AGENT_GET_TIMEOUT if method == "GET" else AGENT_CHAT_TIMEOUT
+        attempts = 1 + (self.get_retries if method == "GET" else 0)
+        histogram = self.histograms.setdefault(f"{method} {label or endpoint}", LatencyHistogram())
+        url = f"{self.base_url}{endpoint}"
+
+        result: Dict[str, Any] = {}
+        for attempt in range(attempts):
+            if attempt:
+                self.retries += 1
+                await asyncio.sleep(AGENT_RETRY_BACKOFF * (2 ** (attempt - 1)))
+
+            started = time.perf_counter()
+            ok = False
+            retryable = False
+            try:
+                async with self._session.request(method, url, json=payload,
+                                                 timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    if response.status in (200, 202):
+                        result = await response.json()
+                        ok = True
+                    else:
+                        error_text = await response.text()
+                        print(f"에이전트 API 오류: {response.status} - {error_text}")
+                        result = {"success": False, "error": error_text}
+                        retryable = response.status >= 500
+            except asyncio.TimeoutError:
+                print(f"에이전트 API 타임아웃: {endpoint}")
+                result = {"success": False, "error": "API 타임아웃"}
+                retryable = True
+            except aiohttp.ClientConnectionError as e:
+                print(f"에이전트 API 연결 오류: {e}")
+                result = {"success": False, "error": str(e)}
+                retryable = True
+            except Exception as e:
+                print(f"에이전트 API 호출 오류: {e}")
+                result = {"success": False, "error": str(e)}
+
+            histogram.observe((time.perf_counter() - started) * 1000, ok)
+            if not retryable:
+                break
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "pool_limit": self.pool_limit,
+            "open": self._session is not None and not self._session.closed,
+            "retries": self.retries,
+            "endpoints": {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+        }
+
+
+agent_client = AgentClient()
@@ -35,7 +35,7 @@ config = CONFIGS[CURRENT_ENV]
 API_URL = config["api_url"]
 FRONTEND_URL = config["frontend_url"]
 DEBUG = config["debug"]
-DATABASE_URL = config["database_url"]
+DATABASE_URL = os.getenv("DATABASE_URL", config["database_url"])  # 환경변수가 있으면 우선
 BACKEND_HOST = config["backend_host"]
 BACKEND_PORT = config["backend_port"]
 KAKAO_REST_API_KEY = config["kakao_rest_api_key"]
@@ -1,15 +1,17 @@
 import json
-import aiohttp
 import asyncio
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, delete, func
 
 from models.chat_session import ChatSession
+from models.chat_message import ChatMessage
 from models.user import User
+from crud.pagination import after_cursor, clamp_page_size, decode_cursor, split_page
+from clients.agent_client import agent_client, AGENT_RECOMMENDATION_TIMEOUT
 from schemas.chat import (
     ChatSessionCreate, 
     ChatMessageCreate, 
@@ -18,9 +20,9 @@ from schemas.chat import (
     SessionInfo
 )
 
-# 에이전트 API 설정
-AGENT_BASE_URL = "http://localhost:8001"
-AGENT_TIMEOUT = 120  # 120초 타임아웃 (코스 추천은 시간이 오래 걸림)
+# 에이전트 API 설정 (주소/타임아웃은 clients/agent_client.py)
+RECOMMENDATION_POLL_INTERVAL = 1.0  # 추천 작업 상태 폴링 간격 (초)
+PREVIEW_LENGTH = 100  # 세션 목록 미리보기 길이
 
 class ChatCRUD:
     
@@ -39,24 +41,7 @@ class ChatCRUD:
             
             # DB에 세션 저장
             session_id = agent_response['session_id']
-            initial_messages = [
-                {
-                    "message_id": 1,
-                    "message_type": "USER",
-                    "message_content": chat_data.initial_message,
-                    "sent_at": datetime.now().isoformat()
-                },
-                {
-                    "message_id": 2,
-                    "message_type": "ASSISTANT",
-                    "message_content": agent_response['response']['message'],
-                    "sent_at": datetime.now().isoformat()
-                }
-            ]
-            
             print(f"[DEBUG] 새 세션 생성 - 세션 ID: {session_id}")
-            print(f"[DEBUG] 초기 메시지 개수: {len(initial_messages)}")
-            print(f"[DEBUG] 초기 메시지: {initial_messages}")
             
             chat_session = ChatSession(
                 session_id=session_id,
@@ -64,22 +49,21 @@ class ChatCRUD:
                 session_title=agent_response['session_info']['session_title'],
                 session_status=agent_response['session_info']['session_status'],
                 is_active=True,
-                messages=initial_messages,
+                message_count=0,
+                has_course=False,
                 started_at=datetime.now(),
                 last_activity_at=datetime.now(),
                 expires_at=datetime.now() + timedelta(hours=24)
             )
             
-            # JSON 필드 변경 감지를 위한 플래그
-            from sqlalchemy.orm.attributes import flag_modified
-            
             db.add(chat_session)
-            await db.flush()  # 먼저 flush로 ID 할당
-            flag_modified(chat_session, "messages")  # JSON 필드 변경 감지
+            await db.flush()  # 메시지 행의 외래키 대상이므로 세션 먼저 저장
+            self._append_messages(db, chat_session, [
+                {"message_type": "USER", "message_content": chat_data.initial_message},
+                {"message_type": "ASSISTANT", "message_content": agent_response['response']['message']}
+            ])
             await db.commit()
-            await db.refresh(chat_session)
-            print(f"[DEBUG] 새 세션 저장 완료")
-            print(f"[DEBUG] 저장 후 메시지 개수 확인: {len(chat_session.messages) if chat_session.messages else 0}")
+            print(f"[DEBUG] 새 세션 저장 완료 - 메시지 개수: {chat_session.message_count}")
             
             return agent_response
             
@@ -110,42 +94,15 @@ class ChatCRUD:
             if not agent_response.get('success'):
                 return None
             
-            # 메시지 추가
-            messages = session.messages or []
-            new_message_id = len(messages) + 1
-            
-            messages.extend([
-                {
-                    "message_id": new_message_id,
-                    "message_type": "USER",
-                    "message_content": message_data.message,
-                    "sent_at": datetime.now().isoformat()
-                },
-                {
-                    "message_id": new_message_id + 1,
-                    "message_type": "ASSISTANT",
-                    "message_content": agent_response['response']['message'],
-                    "sent_at": datetime.now().isoformat()
-                }
+            # 메시지 추가 (기존 대화는 읽지 않고 행만 추가)
+            self._append_messages(db, session, [
+                {"message_type": "USER", "message_content": message_data.message},
+                {"message_type": "ASSISTANT", "message_content": agent_response['response']['message']}
             ])
-            
-            # DB 업데이트
-            print(f"[DEBUG] 메시지 저장 전 - 세션 ID: {session.session_id}")
-            print(f"[DEBUG] 저장할 메시지 개수: {len(messages)}")
-            print(f"[DEBUG] 저장할 메시지: {messages}")
-            
-            # JSON 필드 업데이트를 SQLAlchemy에 명시적으로 알리기
-            from sqlalchemy.orm.attributes import flag_modified
-            
-            session.messages = messages
-            flag_modified(session, "messages")  # JSON 필드 변경 감지
-            session.last_activity_at = datetime.now()
             session.session_status = agent_response['session_info']['session_status']
             
             await db.commit()
-            await db.refresh(session)  # 세션 새로고침
-            print(f"[DEBUG] 메시지 저장 완료")
-            print(f"[DEBUG] 저장 후 메시지 개수 확인: {len(session.messages) if session.messages else 0}")
+            print(f"[DEBUG] 메시지 저장 완료 - 세션 ID: {session.session_id}, 메시지 개수: {session.message_count}")
             
             # 저장 여부 확인 및 자동 저장
             await self._handle_profile_save(db, agent_response, message_data.user_id)
@@ -182,24 +139,16 @@ class ChatCRUD:
             
             # 세션 업데이트
             session.session_status = "COMPLETED"
-            session.last_activity_at = datetime.now()
-            
-            # 추천 완료 메시지 추가
-            messages = session.messages or []
-            new_message_id = len(messages) + 1
             
             # 메시지 필드 확인 및 처리
             message_content = agent_response.get('message') or agent_response.get('response', {}).get('message') or "코스 추천이 완료되었습니다!"
             
-            messages.append({
-                "message_id": new_message_id,
+            # 추천 완료 메시지 추가
+            self._append_messages(db, session, [{
                 "message_type": "ASSISTANT",
                 "message_content": message_content,
-                "sent_at": datetime.now().isoformat(),
                 "course_data": agent_response.get('course_data')
-            })
-            
-            session.messages = messages
+            }])
             
             await db.commit()
             
@@ -220,25 +169,32 @@ class ChatCRUD:
         db: AsyncSession, 
         user_id: str,
         limit: Optional[int] = None,
-        offset: int = 0
-    ) -> List[Dict[str, Any]]:
-        """사용자 채팅 세션 목록 조회"""
+        cursor: Optional[str] = None,
+        status: str = "all"
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """사용자 채팅 세션 목록 한 페이지 조회 (최근 활동순 커서 페이지) -> (세션 목록, 다음 커서)
+
+        cursor 형식이 잘못되면 InvalidCursorError
+        """
+        limit = clamp_page_size(limit)
+        cursor_value = decode_cursor(cursor) if cursor else None
         try:
-            query = select(ChatSession).where(ChatSession.user_id == user_id).order_by(desc(ChatSession.last_activity_at))
-            
-            if limit is not None:
-                query = query.limit(limit)
-            if offset > 0:
-                query = query.offset(offset)
+            query = select(ChatSession).where(ChatSession.user_id == user_id)
+            if status != "all":
+                # 페이지가 비지 않도록 상태 필터도 쿼리에서 적용
+                query = query.where(func.lower(ChatSession.session_status) == status.lower())
+            if cursor_value:
+                query = query.where(after_cursor(ChatSession.last_activity_at, ChatSession.session_id, cursor_value))
+            query = query.order_by(desc(ChatSession.last_activity_at), desc(ChatSession.session_id)).limit(limit + 1)
                 
             result = await db.execute(query)
-            sessions = result.scalars().all()
+            sessions, next_cursor = split_page(
+                result.scalars().all(), limit, lambda session: (session.last_activity_at, session.session_id)
+            )
             
+            # 메시지 본문은 읽지 않고 세션 집계 컬럼만 사용
             session_list = []
             for session in sessions:
-                messages = session.messages or []
-                last_message = messages[-1] if messages else None
-                
                 session_list.append({
                     "session_id": session.session_id,
                     "session_title": session.session_title,
@@ -246,16 +202,16 @@ class ChatCRUD:
                     "created_at": session.started_at.isoformat(),
                     "last_activity_at": session.last_activity_at.isoformat(),
                     "expires_at": session.expires_at.isoformat() if session.expires_at else None,
-                    "message_count": len(messages),
-                    "has_course": any(msg.get('course_data') for msg in messages),
-                    "preview_message": last_message.get('message_content', '')[:100] if last_message else ""
+                    "message_count": session.message_count or 0,
+                    "has_course": bool(session.has_course),
+                    "preview_message": session.preview_message or ""
                 })
             
-            return session_list
+            return session_list, next_cursor
             
         except Exception as e:
             print(f"세션 목록 조회 오류: {e}")
-            return []
+            return [], None
     
     async def get_session_detail(
         self, 
@@ -282,9 +238,15 @@ class ChatCRUD:
                 print(f"[DEBUG] 세션을 찾을 수 없음: {session_id}")
                 return None
             
+            messages_result = await db.execute(
+                select(ChatMessage)
+                .where(ChatMessage.session_id == session_id)
+                .order_by(ChatMessage.seq)
+            )
+            messages = [self._message_to_dict(message) for message in messages_result.scalars().all()]
+            
             print(f"[DEBUG] 세션 찾음: {session.session_id}")
-            print(f"[DEBUG] 메시지 개수: {len(session.messages) if session.messages else 0}")
-            print(f"[DEBUG] 메시지 내용: {session.messages}")
+            print(f"[DEBUG] 메시지 개수: {len(messages)}")
             
             return {
                 "session": {
@@ -296,7 +258,7 @@ class ChatCRUD:
                     "last_activity_at": session.last_activity_at.isoformat(),
                     "expires_at": session.expires_at.isoformat() if session.expires_at else None
                 },
-                "messages": session.messages or []
+                "messages": messages
             }
             
         except Exception as e:
@@ -318,6 +280,8 @@ class ChatCRUD:
             if not session:
                 return False
             
+            # SQLite는 외래키 CASCADE가 기본 비활성화라 메시지 먼저 삭제
+            await db.execute(delete(ChatMessage).where(ChatMessage.session_id == session_id))
             await db.delete(session)
             await db.commit()
             
@@ -328,6 +292,44 @@ class ChatCRUD:
             print(f"세션 삭제 오류: {e}")
             return False
     
+    def _append_messages(
+        self,
+        db: AsyncSession,
+        session: ChatSession,
+        messages: List[Dict[str, Any]]
+    ) -> None:
+        """메시지 행 추가 + 세션 집계 컬럼 갱신 (커밋은 호출 측에서)"""
+        now = datetime.now()
+        seq = session.message_count or 0
+        for message in messages:
+            seq += 1
+            db.add(ChatMessage(
+                session_id=session.session_id,
+                seq=seq,
+                message_type=message["message_type"],
+                message_content=message["message_content"],
+                course_data=message.get("course_data"),
+                sent_at=now
+            ))
+            if message.get("course_data"):
+                session.has_course = True
+        
+        session.message_count = seq
+        session.preview_message = (messages[-1]["message_content"] or "")[:PREVIEW_LENGTH]
+        session.last_activity_at = now
+    
+    def _message_to_dict(self, message: ChatMessage) -> Dict[str, Any]:
+        """메시지 행 → 기존 messages JSON과 같은 형태"""
+        message_dict = {
+            "message_id": message.seq,
+            "message_type": message.message_type,
+            "message_content": message.message_content,
+            "sent_at": message.sent_at.isoformat() if message.sent_at else None
+        }
+        if message.course_data is not None:
+            message_dict["course_data"] = message.course_data
+        return message_dict
+    
     # 에이전트 API 호출 메서드들
     async def _call_agent_new_session(self, chat_data: ChatSessionCreate) -> Dict[str, Any]:
         """에이전트 새 세션 API 호출"""
@@ -365,32 +367,34 @@ class ChatCRUD:
         return await self._make_agent_request("POST", "/chat/send-message", payload)
     
     async def _call_agent_start_recommendation(self, session_id: str) -> Dict[str, Any]:
-        """에이전트 추천 시작 API 호출"""
+        """에이전트 추천 시작 API 호출 - 작업 등록 후 완료될 때까지 짧은 요청으로 상태 폴링"""
         payload = {"session_id": session_id}
         
-        return await self._make_agent_request("POST", "/chat/start-recommendation", payload)
+        submitted = await self._make_agent_request("POST", "/chat/start-recommendation", payload,
+                                                   timeout=AGENT_RECOMMENDATION_TIMEOUT)
+        job_id = submitted.get("job_id")
+        if not job_id:
+            # 세션/프로필 검증 실패 등은 작업 없이 바로 응답
+            return submitted
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + AGENT_RECOMMENDATION_TIMEOUT
+        while loop.time() < deadline:
+            await asyncio.sleep(RECOMMENDATION_POLL_INTERVAL)
+            job = await self._make_agent_request("GET", f"/chat/recommendation-jobs/{job_id}",
+                                                 label="/chat/recommendation-jobs/{job_id}")
+            if not job.get("success"):
+                return job
+            if job.get("status") in ("completed", "failed"):
+                return job.get("result") or {"success": False, "error": "추천 결과가 없습니다"}
+        
+        print(f"추천 작업 대기 시간 초과: {job_id}")
+        return {"success": False, "error": "API 타임아웃"}
     
-    async def _make_agent_request(self, method: str, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """에이전트 API 공통 요청 메서드"""
-        try:
-            timeout = aiohttp.ClientTimeout(total=AGENT_TIMEOUT)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                url = f"{AGENT_BASE_URL}{endpoint}"
-                
-                async with session.request(method, url, json=payload) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        error_text = await response.text()
-                        print(f"에이전트 API 오류: {response.status} - {error_text}")
-                        return {"success": False, "error": error_text}
-                        
-        except asyncio.TimeoutError:
-            print(f"에이전트 API 타임아웃: {endpoint}")
-            return {"success": False, "error": "API 타임아웃"}
-        except Exception as e:
-            print(f"에이전트 API 호출 오류: {e}")
-            return {"success": False, "error": str(e)}
+    async def _make_agent_request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None,
+                                  timeout: float = None, label: str = None) -> Dict[str, Any]:
+        """에이전트 API 공통 요청 메서드 (앱 전체에서 공유하는 연결 풀 사용)"""
+        return await agent_client.request(method, endpoint, payload, timeout=timeout, label=label)
     
     def _filter_and_map_profile(self, profile_dict: Dict[str, Any]) -> Dict[str, Any]:
         """유저 프로필 빈값 필터링 및 필드명 매핑"""
@@ -431,7 +435,8 @@ class ChatCRUD:
         """메인 에이전트에서 세션의 프로필 데이터 가져오기"""
         try:
             # 메인 에이전트 API 호출
-            response = await self._make_agent_request("GET", f"/chat/session-profile/{session_id}")
+            response = await self._make_agent_request("GET", f"/chat/session-profile/{session_id}",
+                                                      label="/chat/session-profile/{session_id}")
             if response.get("success"):
                 return response.get("profile_data", {})
             return {}
@@ -4,12 +4,14 @@ from sqlalchemy import or_
 from models.couple import Couple
 from models.user import User
 from schemas.couple import CoupleCreate
+from db.cache import response_cache
 
 # 연인 관계 생성
 async def create_couple(db: AsyncSession, couple_in: CoupleCreate):
     couple = Couple(**couple_in.model_dump())
     db.add(couple)
     await db.commit()
+    await response_cache.invalidate_users(couple.user1_id, couple.user2_id)
     await db.refresh(couple)
     return couple
 
@@ -43,6 +45,7 @@ async def delete_couple(db: AsyncSession, couple_id: int, user_id: str):
     
     await db.delete(couple)
     await db.commit()
+    await response_cache.invalidate_users(couple.user1_id, couple.user2_id)
     return True
 
 # 연인 관계 존재 여부 확인
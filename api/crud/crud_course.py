@@ -1,105 +1,98 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import and_, bindparam, insert, or_, union_all
+from sqlalchemy.exc import IntegrityError
 from models.course import Course
+from models.course_place import CoursePlace
+from models.place import Place
 from models.place_category import PlaceCategory
+from models.couple import Couple
+from models.comment import Comment
 from schemas.course import CourseCreate
+from crud.pagination import DEFAULT_PAGE_SIZE, after_cursor, clamp_page_size, decode_cursor, split_page
+
+COMMENT_PAGE_SIZE = 50  # 코스 상세의 댓글 한 페이지
 
 async def get_or_create_category(db: AsyncSession, category_name: str) -> int:
-    """카테고리가 있으면 반환, 없으면 생성 후 반환"""
+    """카테고리가 있으면 반환, 없으면 생성 후 반환 (ID는 DB 자동 증가, 커밋은 호출 측 트랜잭션에서)"""
+    result = await db.execute(
+        select(PlaceCategory.category_id).where(PlaceCategory.category_name == category_name)
+    )
+    category_id = result.scalar_one_or_none()
+    if category_id is not None:
+        return category_id
+    
     try:
-        # 기존 카테고리 찾기
+        # 세이브포인트 안에서 생성 - 동시에 같은 이름이 생성돼 충돌해도 바깥 트랜잭션은 유지
+        async with db.begin_nested():
+            new_category = PlaceCategory(category_name=category_name)
+            db.add(new_category)
+        return new_category.category_id
+    except IntegrityError:
         result = await db.execute(
-            select(PlaceCategory).where(PlaceCategory.category_name == category_name)
-        )
-        existing_category = result.scalar_one_or_none()
-        
-        if existing_category:
-            return existing_category.category_id
-        
-        # 새 카테고리 생성
-        # 기존 최대 ID 찾기
-        max_id_result = await db.execute(
-            select(PlaceCategory.category_id).order_by(PlaceCategory.category_id.desc()).limit(1)
+            select(PlaceCategory.category_id).where(PlaceCategory.category_name == category_name)
         )
-        max_id = max_id_result.scalar_one_or_none()
-        new_id = (max_id or 0) + 1
-        
-        new_category = PlaceCategory(
-            category_id=new_id,
-            category_name=category_name
-        )
-        db.add(new_category)
-        await db.commit()
-        await db.refresh(new_category)
+        return result.scalar_one()
+
+def _course_place_rows(course_id: int, places_data: list, existing_place_ids: set) -> list:
+    """course_places에 넣을 행 목록 (place_id 없음/없는 장소/중복 순서는 건너뜀)"""
+    rows = []
+    used_sequences = set()
+    for index, place_data in enumerate(places_data, start=1):
+        place_id = place_data.get("place_id")
+        if not place_id:
+            print(f"place_id 없음, 건너뛰기: {place_data}")
+            continue
+        if place_id not in existing_place_ids:
+            print(f"장소를 찾을 수 없음: {place_id}")
+            continue
         
-        return new_category.category_id
+        sequence_order = place_data.get("sequence") or index
+        if sequence_order in used_sequences:
+            print(f"중복된 장소 순서, 건너뛰기: {sequence_order} ({place_id})")
+            continue
+        used_sequences.add(sequence_order)
         
-    except Exception as e:
-        print(f"카테고리 생성/조회 실패: {e}")
-        await db.rollback()
-        return 1  # 기본 카테고리 ID
+        rows.append({
+            "course_id": course_id,
+            "place_id": place_id,
+            "sequence_order": sequence_order,
+            "estimated_duration": place_data.get("estimated_duration"),
+            "estimated_cost": place_data.get("estimated_cost")
+        })
+    return rows
 
 async def create_course(db: AsyncSession, course_in: CourseCreate):
     course_data = course_in.model_dump()
     # places는 별도 처리, user_request, preferences만 제거
-    places_data = course_data.pop('places', [])
+    places_data = [place for place in course_data.pop('places', None) or [] if isinstance(place, dict)]
     course_data.pop('user_request', None) 
     course_data.pop('preferences', None)
     
-    # 코스 기본 정보 저장
+    # 코스 기본 정보 저장 (커밋은 장소 연결까지 끝난 뒤 한 번만)
     db_course = Course(**course_data)
     db.add(db_course)
-    await db.commit()
-    await db.refresh(db_course)
+    await db.flush()  # course_id 할당
     
-    # places 정보 저장 (place_id 기반으로 변경)
+    # places 정보 저장 - 장소 존재 확인 1회(IN 조회) + course_places 일괄 삽입 1회
     if places_data:
         try:
-            from models.place import Place
-            from models.course_place import CoursePlace
+            place_ids = {place.get("place_id") for place in places_data if place.get("place_id")}
+            result = await db.execute(select(Place.place_id).where(Place.place_id.in_(place_ids)))
+            existing_place_ids = set(result.scalars().all())
             
-            for place_data in places_data:
-                try:
-                    # place_id 받아오기 (AI가 기존 장소의 place_id를 보냄)
-                    place_id = place_data.get("place_id")
-                    
-                    if not place_id:
-                        print(f"place_id 없음, 건너뛰기: {place_data}")
-                        continue
-                    
-                    # 기존 places 테이블에서 place_id로 장소 찾기
-                    result = await db.execute(
-                        select(Place).where(Place.place_id == place_id)
-                    )
-                    existing_place = result.scalar_one_or_none()
-                    
-                    if not existing_place:
-                        print(f"장소를 찾을 수 없음: {place_id}")
-                        continue
-                    
-                    # course_places 테이블에 연결 정보만 저장
-                    db_course_place = CoursePlace(
-                        course_id=db_course.course_id,
-                        place_id=existing_place.place_id,
-                        sequence_order=place_data.get("sequence", 1),
-                        estimated_duration=place_data.get("estimated_duration"),
-                        estimated_cost=place_data.get("estimated_cost")
-                    )
-                    db.add(db_course_place)
-                    await db.commit()
-                    
-                    print(f"✅ 장소 연결 성공: {existing_place.name} ({place_id})")
-                    
-                except Exception as place_error:
-                    print(f"장소 연결 실패: {place_error}")
-                    await db.rollback()
-                    continue
-                    
+            rows = _course_place_rows(db_course.course_id, places_data, existing_place_ids)
+            if rows:
+                # 세이브포인트 - 장소 연결이 실패해도 코스는 저장되도록 함
+                async with db.begin_nested():
+                    await db.execute(insert(CoursePlace), rows)
+                print(f"✅ 장소 연결 성공: {len(rows)}개 ({', '.join(row['place_id'] for row in rows)})")
+                
         except Exception as places_error:
             print(f"Places 연결 전체 실패: {places_error}")
-            # places 연결 실패해도 코스는 저장되도록 함
-            pass
     
+    await db.commit()
+    await db.refresh(db_course)
     return db_course
 
 async def get_course(db: AsyncSession, course_id: int):
@@ -110,301 +103,183 @@ async def get_all_courses(db: AsyncSession):
     result = await db.execute(select(Course))
     return result.scalars().all()
 
-async def get_all_courses_for_user(db: AsyncSession, user_id: str):
-    # 자신의 코스 조회
-    my_courses_result = await db.execute(select(Course).where(Course.user_id == user_id))
-    my_courses = my_courses_result.scalars().all()
-    
-    # 커플 관계 확인하여 공유된 코스도 조회
-    try:
-        from models.couple import Couple
-        
-        # 커플 관계 찾기 (user1_id 또는 user2_id로 등록된 경우)
-        couple_result = await db.execute(
-            select(Couple).where(
-                (Couple.user1_id == user_id) | (Couple.user2_id == user_id)
-            )
-        )
-        couple = couple_result.scalar_one_or_none()
-        
-        if couple:
-            # 상대방 user_id 찾기
-            partner_id = couple.user2_id if couple.user1_id == user_id else couple.user1_id
-            
-            # 상대방의 공유된 코스 조회
-            shared_courses_result = await db.execute(
-                select(Course).where(
-                    (Course.user_id == partner_id) & 
-                    (Course.is_shared_with_couple == True)
-                )
-            )
-            shared_courses = shared_courses_result.scalars().all()
-            
-            # 내 코스 + 공유받은 코스 합치기
-            all_courses = list(my_courses) + list(shared_courses)
-            return all_courses
-        
-    except Exception as e:
-        print(f"커플 코스 조회 실패: {e}")
+def _partner_join_condition(user_id):
+    """커플 테이블에서 user_id의 상대방이 Course.user_id인 행 (user1/user2 어느 쪽이든)"""
+    return or_(
+        and_(Couple.user1_id == user_id, Couple.user2_id == Course.user_id),
+        and_(Couple.user2_id == user_id, Couple.user1_id == Course.user_id)
+    )
+
+def _visible_course_condition(user_id):
+    """내 코스이거나 연인이 공유한 코스 (커플 조회를 서브쿼리로 포함)"""
+    partner_shared = select(Couple.couple_id).where(_partner_join_condition(user_id)).exists()
+    return or_(
+        Course.user_id == user_id,
+        and_(Course.is_shared_with_couple == True, partner_shared)
+    )
+
+# 조회 문장은 생성/컴파일 비용이 쿼리 실행보다 커서 모듈 로드 시 한 번만 만들고 파라미터만 바인딩
+_user_id = bindparam("user_id")
+_limit = bindparam("limit")
+
+def _visible_courses_page_query(with_cursor: bool):
+    """내 코스 + 연인이 공유한 코스 한 페이지 (UNION ALL, 최신순)
+
+    각 쪽에서 (created_at, course_id) 커서 이후를 limit개만 읽은 뒤 합쳐서 다시 limit개로 자름
+    """
+    # 모듈 로드 시점에 매퍼 설정이 일어나지 않도록 안쪽 쿼리는 테이블(Core) 컬럼으로 구성
+    courses = Course.__table__
+    own = select(courses).where(courses.c.user_id == _user_id)
+    shared = (
+        select(courses)
+        .join(Couple, _partner_join_condition(_user_id))
+        .where(courses.c.is_shared_with_couple == True)
+    )
+    if with_cursor:
+        cursor = (bindparam("cursor_created_at"), bindparam("cursor_course_id"))
+        own = own.where(after_cursor(courses.c.created_at, courses.c.course_id, cursor))
+        shared = shared.where(after_cursor(courses.c.created_at, courses.c.course_id, cursor))
+
+    newest_first = (courses.c.created_at.desc(), courses.c.course_id.desc())
+    pages = union_all(*(
+        select(side.order_by(*newest_first).limit(_limit).subquery())
+        for side in (own, shared)
+    ))
+    return select(Course).from_statement(
+        pages.order_by(pages.selected_columns.created_at.desc(), pages.selected_columns.course_id.desc())
+        .limit(_limit)
+    )
+
+VISIBLE_COURSES_QUERY = _visible_courses_page_query(with_cursor=False)  # 첫 페이지
+VISIBLE_COURSES_AFTER_QUERY = _visible_courses_page_query(with_cursor=True)  # 다음 페이지
+
+# 접근 권한 확인 + 코스 + 장소 + 카테고리 (장소 순서대로, 장소가 없어도 코스 1행)
+COURSE_WITH_PLACES_QUERY = (
+    select(Course, CoursePlace, Place, PlaceCategory.category_name)
+    .outerjoin(CoursePlace, CoursePlace.course_id == Course.course_id)
+    .outerjoin(Place, CoursePlace.place_id == Place.place_id)
+    .outerjoin(PlaceCategory, Place.category_id == PlaceCategory.category_id)
+    .where(Course.course_id == bindparam("course_id"), _visible_course_condition(_user_id))
+    .order_by(CoursePlace.sequence_order)
+)
+
+async def get_all_courses_for_user(db: AsyncSession, user_id: str, limit: int = None, cursor: str = None):
+    """내 코스 + 연인이 공유한 코스 한 페이지를 한 번의 쿼리로 조회 -> (코스 목록, 다음 커서)
+
+    cursor 형식이 잘못되면 InvalidCursorError
+    """
+    limit = clamp_page_size(limit, DEFAULT_PAGE_SIZE)
+    params = {"user_id": user_id, "limit": limit + 1}
+    query = VISIBLE_COURSES_QUERY
+    if cursor:
+        params["cursor_created_at"], params["cursor_course_id"] = decode_cursor(cursor)
+        query = VISIBLE_COURSES_AFTER_QUERY
+    result = await db.execute(query, params)
+    return split_page(result.scalars().all(), limit, lambda course: (course.created_at, course.course_id))
+
+def _place_to_dict(course_place: CoursePlace, place: Place, category_name: str) -> dict:
+    return {
+        "sequence": course_place.sequence_order,
+        "place_id": place.place_id,
+        "name": place.name,
+        "address": place.address,
+        "category": category_name or "기타",
+        "coordinates": {
+            "latitude": place.latitude,
+            "longitude": place.longitude
+        },
+        "description": place.description,
+        "summary": place.summary,
+        "phone": place.phone,
+        "kakao_url": place.kakao_url,
+        "info_urls": place.info_urls,
+        "estimated_duration": course_place.estimated_duration,
+        "estimated_cost": course_place.estimated_cost
+    }
+
+def _comment_to_dict(comment: Comment) -> dict:
+    return {
+        "comment_id": comment.comment_id,
+        "course_id": comment.course_id,
+        "user_id": comment.user_id,
+        "nickname": comment.nickname,
+        "comment": comment.comment,
+        "timestamp": comment.timestamp.isoformat() if comment.timestamp else None
+    }
+
+async def _get_visible_course_with_places(db: AsyncSession, course_id: int, user_id: str):
+    """접근 권한 확인 + 코스 + 장소 + 카테고리를 한 번의 쿼리로 조회 (권한 없으면 None)"""
+    result = await db.execute(COURSE_WITH_PLACES_QUERY, {"course_id": course_id, "user_id": user_id})
+    rows = result.all()
+    if not rows:
+        return None
     
-    # 커플 관계가 없거나 오류 시 자신의 코스만 반환
-    return my_courses
+    course = rows[0][0]
+    places_data = [
+        _place_to_dict(course_place, place, category_name)
+        for _, course_place, place, category_name in rows
+        if course_place is not None and place is not None
+    ]
+    return course, places_data
 
 async def get_course_detail(db: AsyncSession, course_id: int, user_id: str):
-    # 먼저 자신의 코스인지 확인
-    result = await db.execute(select(Course).where(Course.course_id == course_id, Course.user_id == user_id))
-    course = result.scalar_one_or_none()
-    
-    # 자신의 코스가 아니라면 커플의 공유된 코스인지 확인
-    if not course:
-        try:
-            from models.couple import Couple
-            
-            # 커플 관계 찾기
-            couple_result = await db.execute(
-                select(Couple).where(
-                    (Couple.user1_id == user_id) | (Couple.user2_id == user_id)
-                )
-            )
-            couple = couple_result.scalar_one_or_none()
-            
-            if couple:
-                # 상대방 user_id 찾기
-                partner_id = couple.user2_id if couple.user1_id == user_id else couple.user1_id
-                
-                # 상대방의 공유된 코스인지 확인
-                shared_result = await db.execute(
-                    select(Course).where(
-                        (Course.course_id == course_id) & 
-                        (Course.user_id == partner_id) & 
-                        (Course.is_shared_with_couple == True)
-                    )
-                )
-                course = shared_result.scalar_one_or_none()
-                
-        except Exception as e:
-            print(f"공유 코스 조회 실패: {e}")
+    found = await _get_visible_course_with_places(db, course_id, user_id)
+    if not found:
+        return None
+    course, places_data = found
     
-    if not course:
+    return {
+        "course_id": course.course_id,
+        "title": course.title,
+        "description": course.description,
+        "user_id": course.user_id,
+        "total_duration": course.total_duration,
+        "estimated_cost": course.estimated_cost,
+        "is_shared_with_couple": course.is_shared_with_couple,
+        "created_at": course.created_at,
+        "places": places_data
+    }
+
+async def get_course_with_comments(db: AsyncSession, course_id: int, user_id: str,
+                                   comment_limit: int = None, comment_cursor: str = None):
+    # 1) 권한 + 코스 + 장소, 2) 댓글 한 페이지 - 커플 여부와 무관하게 두 번의 쿼리
+    # 댓글은 오래된 순 (timestamp, comment_id) 커서 페이지 (comment_cursor 형식 오류 시 InvalidCursorError)
+    comment_limit = clamp_page_size(comment_limit, COMMENT_PAGE_SIZE)
+    cursor_value = decode_cursor(comment_cursor) if comment_cursor else None
+
+    found = await _get_visible_course_with_places(db, course_id, user_id)
+    if not found:
         return None
+    course, places_data = found
     
-    # course_places와 places 정보 함께 조회
-    try:
-        from models.course_place import CoursePlace
-        from models.place import Place
-        
-        # course_places, places, place_category를 조인하여 상세 장소 정보 조회
-        from models.place_category import PlaceCategory
-        
-        places_result = await db.execute(
-            select(CoursePlace, Place, PlaceCategory.category_name)
-            .join(Place, CoursePlace.place_id == Place.place_id)
-            .outerjoin(PlaceCategory, Place.category_id == PlaceCategory.category_id)
-            .where(CoursePlace.course_id == course_id)
-            .order_by(CoursePlace.sequence_order)
+    comments_query = select(Comment).where(Comment.course_id == course.course_id)
+    if cursor_value:
+        comments_query = comments_query.where(
+            after_cursor(Comment.timestamp, Comment.comment_id, cursor_value, descending=False)
         )
-        
-        places_data = []
-        for course_place, place, category_name in places_result:
-            places_data.append({
-                "sequence": course_place.sequence_order,
-                "place_id": place.place_id,
-                "name": place.name,
-                "address": place.address,
-                "category": category_name or "기타",
-                "coordinates": {
-                    "latitude": place.latitude,
-                    "longitude": place.longitude
-                },
-                "description": place.description,
-                "summary": place.summary,
-                "phone": place.phone,
-                "kakao_url": place.kakao_url,
-                "estimated_duration": course_place.estimated_duration,
-                "estimated_cost": course_place.estimated_cost
-            })
-        
-        # 코스 정보에 장소 데이터 추가
-        course_dict = {
+    comments_result = await db.execute(
+        comments_query
+        .order_by(Comment.timestamp.asc(), Comment.comment_id.asc())
+        .limit(comment_limit + 1)
+    )
+    comments, next_comment_cursor = split_page(
+        comments_result.scalars().all(), comment_limit, lambda comment: (comment.timestamp, comment.comment_id)
+    )
+    comments_data = [_comment_to_dict(comment) for comment in comments]
+    
+    return {
+        "course": {
             "course_id": course.course_id,
             "title": course.title,
             "description": course.description,
             "user_id": course.user_id,
-            "total_duration": course.total_duration,
-            "estimated_cost": course.estimated_cost,
             "is_shared_with_couple": course.is_shared_with_couple,
             "created_at": course.created_at,
             "places": places_data
-        }
-        
-        return course_dict
-        
-    except Exception as e:
-        print(f"장소 정보 조회 실패: {e}")
-        # 에러 발생 시에도 코스 기본 정보는 반환
-        return {
-            "course_id": course.course_id,
-            "title": course.title,
-            "description": course.description,
-            "user_id": course.user_id,
-            "total_duration": course.total_duration,
-            "estimated_cost": course.estimated_cost,
-            "is_shared_with_couple": course.is_shared_with_couple,
-            "created_at": course.created_at,
-            "places": []
-        }
-
-async def get_course_with_comments(db: AsyncSession, course_id: int, user_id: str):
-    # 먼저 자신의 코스인지 확인
-    course_result = await db.execute(select(Course).where(Course.course_id == course_id, Course.user_id == user_id))
-    course = course_result.scalar_one_or_none()
-    
-    # 자신의 코스가 아니라면 커플의 공유된 코스인지 확인
-    if not course:
-        try:
-            from models.couple import Couple
-            
-            # 커플 관계 찾기
-            couple_result = await db.execute(
-                select(Couple).where(
-                    (Couple.user1_id == user_id) | (Couple.user2_id == user_id)
-                )
-            )
-            couple = couple_result.scalar_one_or_none()
-            
-            if couple:
-                # 상대방 user_id 찾기
-                partner_id = couple.user2_id if couple.user1_id == user_id else couple.user1_id
-                
-                # 상대방의 공유된 코스인지 확인
-                shared_result = await db.execute(
-                    select(Course).where(
-                        (Course.course_id == course_id) & 
-                        (Course.user_id == partner_id) & 
-                        (Course.is_shared_with_couple == True)
-                    )
-                )
-                course = shared_result.scalar_one_or_none()
-                
-        except Exception as e:
-            print(f"공유 코스 조회 실패: {e}")
-    
-    if not course:
-        return None
-    
-    # course_places와 places 정보 함께 조회
-    try:
-        from models.course_place import CoursePlace
-        from models.place import Place
-        
-        # course_places, places, place_category를 조인하여 상세 장소 정보 조회
-        from models.place_category import PlaceCategory
-        
-        result = await db.execute(
-            select(CoursePlace, Place, PlaceCategory.category_name)
-            .join(Place, CoursePlace.place_id == Place.place_id)
-            .outerjoin(PlaceCategory, Place.category_id == PlaceCategory.category_id)
-            .where(CoursePlace.course_id == course.course_id)
-            .order_by(CoursePlace.sequence_order)
-        )
-        
-        places_data = []
-        for course_place, place, category_name in result:
-            places_data.append({
-                "sequence": course_place.sequence_order,
-                "place_id": place.place_id,
-                "name": place.name,
-                "address": place.address,
-                "category": category_name or "기타",
-                "coordinates": {
-                    "latitude": place.latitude,
-                    "longitude": place.longitude
-                },
-                "description": place.description,
-                "summary": place.summary,
-                "phone": place.phone,
-                "kakao_url": place.kakao_url,
-                "estimated_duration": course_place.estimated_duration,
-                "estimated_cost": course_place.estimated_cost
-            })
-        
-        # 댓글 조회
-        comments_data = []
-        try:
-            from models.comment import Comment
-            
-            comments_result = await db.execute(
-                select(Comment)
-                .where(Comment.course_id == course.course_id)
-                .order_by(Comment.timestamp.asc())
-            )
-            comments = comments_result.scalars().all()
-            
-            for comment in comments:
-                comments_data.append({
-                    "comment_id": comment.comment_id,
-                    "course_id": comment.course_id,
-                    "user_id": comment.user_id,
-                    "nickname": comment.nickname,
-                    "comment": comment.comment,
-                    "timestamp": comment.timestamp.isoformat() if comment.timestamp else None
-                })
-                
-        except Exception as comment_error:
-            print(f"댓글 조회 실패: {comment_error}")
-        
-        return {
-            "course": {
-                "course_id": course.course_id,
-                "title": course.title,
-                "description": course.description,
-                "user_id": course.user_id,
-                "is_shared_with_couple": course.is_shared_with_couple,
-                "created_at": course.created_at,
-                "places": places_data
-            },
-            "comments": comments_data
-        }
-        
-    except Exception as e:
-        print(f"장소 정보 조회 실패: {e}")
-        # 에러 발생 시에도 코스 기본 정보와 댓글은 조회 시도
-        comments_data = []
-        try:
-            from models.comment import Comment
-            
-            comments_result = await db.execute(
-                select(Comment)
-                .where(Comment.course_id == course.course_id)
-                .order_by(Comment.timestamp.asc())
-            )
-            comments = comments_result.scalars().all()
-            
-            for comment in comments:
-                comments_data.append({
-                    "comment_id": comment.comment_id,
-                    "course_id": comment.course_id,
-                    "user_id": comment.user_id,
-                    "nickname": comment.nickname,
-                    "comment": comment.comment,
-                    "timestamp": comment.timestamp.isoformat() if comment.timestamp else None
-                })
-                
-        except Exception as comment_error:
-            print(f"댓글 조회 실패: {comment_error}")
-        
-        return {
-            "course": {
-                "course_id": course.course_id,
-                "title": course.title,
-                "description": course.description,
-                "user_id": course.user_id,
-                "is_shared_with_couple": course.is_shared_with_couple,
-                "created_at": course.created_at,
-                "places": []
-            },
-            "comments": comments_data
-        }
+        },
+        "comments": comments_data,
+        "comments_next_cursor": next_comment_cursor
+    }
 
 async def share_course(db: AsyncSession, course_id: int, user_id: str):
     # ORM 객체를 직접 조회
@@ -4,6 +4,7 @@ from sqlalchemy.sql import func
 from models.user import User
 from models.user_oauth import UserOAuth
 from schemas.user import UserCreate
+from db.cache import response_cache
 
 async def get_user_by_email(db: AsyncSession, email: str):
     result = await db.execute(select(User).where(User.email == email))
@@ -64,6 +65,7 @@ async def update_user(db: AsyncSession, user_id: str, user_in: UserCreate):
     for key, value in user_in.model_dump(exclude_unset=True).items():
         setattr(db_user, key, value)
     await db.commit()
+    await response_cache.invalidate_users(user_id)
     await db.refresh(db_user)
     return db_user
 
@@ -74,6 +76,7 @@ async def update_user_nickname(db: AsyncSession, user_id: str, nickname: str):
         return None
     db_user.nickname = nickname
     await db.commit()
+    await response_cache.invalidate_users(user_id)
     await db.refresh(db_user)
     return db_user
 
@@ -109,6 +112,7 @@ async def update_user_profile(db: AsyncSession, user_id: str, update_data: dict)
             return None
             
         await db.commit()
+        await response_cache.invalidate_users(user_id)
     
     # 업데이트된 사용자 정보 반환
     return await get_user(db, user_id)
@@ -120,6 +124,7 @@ async def delete_user(db: AsyncSession, user_id: str):
         return None
     await db.delete(db_user)
     await db.commit()
+    await response_cache.invalidate_users(user_id)
     return db_user
 
 async def update_profile_detail(db: AsyncSession, user_id: str, profile_data: dict):
@@ -162,6 +167,7 @@ async def update_profile_detail(db: AsyncSession, user_id: str, profile_data: di
     stmt = sqlalchemy_update(User).where(User.user_id == user_id).values(**update_values)
     result = await db.execute(stmt)
     await db.commit()
+    await response_cache.invalidate_users(user_id)
     
     if result.rowcount > 0:
         # 업데이트된 사용자 정보 반환
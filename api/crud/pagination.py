@@ -0,0 +1,59 @@
+"""
+커서(keyset) 페이지네이션 공통 함수
+- 정렬 키 (시각, ID)의 마지막 값을 커서로 내려주고, 다음 페이지는 그 값 이후만 조회 (OFFSET 없음)
+- 커서는 클라이언트가 해석하지 않는 불투명 문자열 (base64url JSON)
+- 페이지 크기는 MAX_PAGE_SIZE로 제한
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_, type_coerce
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """커서 형식 오류 (라우터에서 400으로 변환)"""
+
+
+def clamp_page_size(limit: Optional[int], default: int = DEFAULT_PAGE_SIZE) -> int:
+    if limit is None:
+        return default
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(sort_value: datetime, row_id: Any) -> str:
+    payload = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_value), row_id
+    except Exception:
+        raise InvalidCursorError("잘못된 페이지 커서입니다.")
+
+
+def after_cursor(sort_column, id_column, cursor_value: Tuple[Any, Any], descending: bool = True):
+    """(sort_column, id_column)이 커서보다 뒤인 행 조건 - 정렬 방향과 같은 방향으로 비교
+
+    행 값 비교 (a, b) < (x, y)로 만들어 (..., sort_column, id_column) 인덱스에서 커서 위치부터 바로 읽음
+    """
+    sort_value, row_id = cursor_value
+    row = tuple_(sort_column, id_column)
+    cursor = tuple_(type_coerce(sort_value, sort_column.type), type_coerce(row_id, id_column.type))
+    return row < cursor if descending else row > cursor
+
+
+def split_page(rows: Sequence[Any], limit: int, cursor_of) -> Tuple[List[Any], Optional[str]]:
+    """limit + 1개로 조회한 결과를 (이번 페이지, 다음 커서)로 분리 (마지막 페이지면 커서 None)"""
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    return page, encode_cursor(*cursor_of(page[-1]))
@@ -0,0 +1,188 @@
+"""
+페이지 로드마다 호출되는 조회 API 응답 캐시 (read-through + ETag)
+- 대상: /users/profile/me, /users/profile/main, /users/profile/couple-status, /couples/status
+- 기본은 프로세스 내 LRU + TTL, RESPONSE_CACHE_URL=redis://... 이면 워커 간 공유 (redis 패키지 필요)
+- 프로필/닉네임 수정, 연인 수락/해제, 회원 탈퇴 시 crud에서 해당 사용자 캐시를 명시적으로 삭제
+- 응답 본문 해시를 ETag로 내려주고, If-None-Match가 같으면 304 반환
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from responses import fast_json
+
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "")  # 비우면 프로세스 내 LRU
+RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 300))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 10000))
+
+# 사용자별로 캐시되는 화면 (무효화 시 전부 삭제)
+USER_VIEWS = ("profile_me", "profile_main", "profile_couple_status", "couple_status")
+
+
+def user_cache_key(user_id: str, view: str) -> str:
+    return f"user:{user_id}:{view}"
+
+
+def make_etag(body: Any) -> str:
+    payload = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return '"' + hashlib.sha1(payload.encode("utf-8")).hexdigest() + '"'
+
+
+class MemoryBackend:
+    """프로세스 내 LRU + TTL"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, keys: Iterable[str]):
+        for key in keys:
+            self._data.pop(key, None)
+
+    def size(self) -> int:
+        return len(self._data)
+
+
+class RedisBackend:
+    """워커 간 공유 캐시 (redis.asyncio)"""
+
+    def __init__(self, url: str, ttl_seconds: int):
+        import redis.asyncio as redis
+
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(f"response_cache:{key}")
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, value: Dict[str, Any]):
+        await self._redis.set(f"response_cache:{key}", json.dumps(value, ensure_ascii=False), ex=self.ttl_seconds)
+
+    async def delete(self, keys: Iterable[str]):
+        keys = [f"response_cache:{key}" for key in keys]
+        if keys:
+            await self._redis.delete(*keys)
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+def _create_backend():
+    if RESPONSE_CACHE_URL.startswith("redis"):
+        try:
+            return RedisBackend(RESPONSE_CACHE_URL, RESPONSE_CACHE_TTL_SECONDS)
+        except ImportError:
+            print("⚠️ redis 패키지가 없어 응답 캐시는 프로세스 내 LRU를 사용합니다")
+    return MemoryBackend(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+
+
+class ResponseCache:
+    """조회 응답 캐시 (캐시 오류는 무시하고 DB 조회로 진행)"""
+
+    def __init__(self, backend=None):
+        self.backend = backend or _create_backend()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = await self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            print(f"[WARNING] 응답 캐시 조회 실패: {e}")
+            entry = None
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    async def set(self, key: str, body: Any) -> Dict[str, Any]:
+        entry = {"body": body, "etag": make_etag(body)}
+        try:
+            await self.backend.set(key, entry)
+        except Exception as e:
+            self.errors += 1
+            print(f"[WARNING] 응답 캐시 저장 실패: {e}")
+        return entry
+
+    async def invalidate_users(self, *user_ids: Optional[str]):
+        """사용자 화면 캐시 전체 삭제 (프로필/연인 관계 변경 시)"""
+        keys = [user_cache_key(user_id, view) for user_id in user_ids if user_id for view in USER_VIEWS]
+        if not keys:
+            return
+        self.invalidations += 1
+        try:
+            await self.backend.delete(keys)
+        except Exception as e:
+            self.errors += 1
+            print(f"[WARNING] 응답 캐시 삭제 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+        }
+
+
+response_cache = ResponseCache()
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+async def cached_json(request: Request, key: str, build: Callable[[], Awaitable[Any]]) -> Response:
+    """캐시에 있으면 그대로, 없으면 build()로 만들어 저장 후 반환 (ETag 일치 시 304)
+
+    build()에서 HTTPException이 나면 캐시하지 않고 그대로 전달된다.
+    """
+    entry = await response_cache.get(key)
+    if entry is None:
+        entry = await response_cache.set(key, jsonable_encoder(await build()))
+
+    headers = {"ETag": entry["etag"], "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, entry["etag"]):
+        response_cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    return fast_json(entry["body"], headers=headers)
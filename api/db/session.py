@@ -1,8 +1,89 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import os
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from config import DATABASE_URL
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+# 엔진 설정 (환경변수로 조정, 기본값은 운영 기준)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"  # SQL 로그 (모든 쿼리 출력 - 디버깅할 때만)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))  # 유지하는 연결 수
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))  # 몰릴 때 추가로 여는 연결 수
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))  # 연결을 기다리는 최대 시간 (초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # 이보다 오래된 연결은 재생성 (초)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"  # 사용 전 끊긴 연결 확인
+# asyncpg prepared statement 캐시 크기 (pgbouncer transaction 모드면 0)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))  # 쓰기 잠금 대기 시간
+
+# 개발용 SQLite: WAL이면 읽기가 쓰기를 막지 않아 동시 요청에 덜 잠김
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def create_engine_from_env(url: str = DATABASE_URL, **overrides) -> AsyncEngine:
+    """DB URL에 맞는 비동기 엔진 생성 (SQLite: WAL pragma, 그 외: 연결 풀 설정)"""
+    backend = make_url(url).get_backend_name()
+
+    if backend == "sqlite":
+        kwargs: Dict[str, Any] = {"echo": DB_ECHO}
+        kwargs.update(overrides)
+        engine = create_async_engine(url, **kwargs)
+        if make_url(url).database not in (None, "", ":memory:"):
+            event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+        return engine
+
+    kwargs = {
+        "echo": DB_ECHO,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        kwargs["connect_args"] = {
+            "prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE,  # SQLAlchemy 어댑터 캐시
+            "statement_cache_size": DB_STATEMENT_CACHE_SIZE,  # asyncpg 자체 캐시
+        }
+    kwargs.update(overrides)
+    return create_async_engine(url, **kwargs)
+
+
+def pool_stats(target: AsyncEngine = None) -> Dict[str, Any]:
+    """연결 풀 사용 현황 (풀 종류에 따라 없는 값은 None)"""
+    pool = (target or engine).pool
+
+    def _call(name):
+        method = getattr(pool, name, None)
+        return method() if callable(method) else None
+
+    return {
+        "pool_class": type(pool).__name__,
+        "size": _call("size"),
+        "checked_in": _call("checkedin"),
+        "checked_out": _call("checkedout"),
+        "overflow": _call("overflow"),
+        "max_overflow": getattr(pool, "_max_overflow", None),
+        "timeout": _call("timeout"),
+        "status": pool.status(),
+    }
+
+
+engine = create_engine_from_env()
 SessionLocal = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 async def get_db():
@@ -11,6 +11,7 @@ import models.place_category_relation  # ✅ 새로 추가된 모델
 import models.course
 import models.course_place
 import models.chat_session
+import models.chat_message
 import models.couple_request
 import models.couple
 import models.comment
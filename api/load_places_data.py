@@ -4,7 +4,12 @@
 data/ 폴더의 카테고리별 JSON 파일을 읽어서 places 테이블에 저장
 
 사용법:
-python load_places_data.py
+python load_places_data.py [--chunk-size 500] [--update]
+
+- JSON 배열을 한 장소씩 스트리밍 파싱 (ijson이 설치돼 있으면 사용, 없으면 표준 json으로 점진 파싱)
+- 기존 place_id는 시작 시 한 번만 조회하고, 청크 단위로 INSERT ... ON CONFLICT 일괄 삽입 후 커밋
+- --update: 이미 있는 장소도 JSON 내용으로 갱신 (카테고리 관계도 다시 생성)
+- 청크마다 처리 건수, 속도, 최대 메모리(RSS) 출력
 
 data/ 폴더 구조:
 data/
@@ -19,15 +24,25 @@ data/
 └── 휴식시설.json
 """
 
+import argparse
 import asyncio
 import json
 import os
+import resource
+import time
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete
+from sqlalchemy import delete, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+try:
+    import ijson  # 선택: C 백엔드 스트리밍 파서
+except ImportError:
+    ijson = None
 
 from db.session import get_db
 from models.place import Place
@@ -35,6 +50,9 @@ from models.place_category import PlaceCategory
 from models.place_category_relation import PlaceCategoryRelation
 
 
+DEFAULT_CHUNK_SIZE = 500  # 청크당 장소 수 (청크마다 커밋)
+READ_SIZE = 64 * 1024  # 표준 json 점진 파싱 시 한 번에 읽는 크기
+
 # 카테고리 매핑
 CATEGORY_MAPPING = {
     "기타": 1,
@@ -184,71 +202,155 @@ def process_place_data(place_data: Dict[str, Any], file_category: str) -> tuple[
     return place_data_processed, category_ids
 
 
-async def load_category_file(db: AsyncSession, file_path: Path) -> int:
-    """카테고리별 JSON 파일 로딩"""
+def iter_json_array(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """JSON 배열 파일의 원소를 하나씩 반환 (파일 전체를 메모리에 올리지 않음)"""
+    if ijson is not None:
+        with open(file_path, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+        return
+    
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = f.read(READ_SIZE).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError("형식 오류: 배열이 아님")
+        buffer = buffer[1:]
+        eof = False
+        
+        while True:
+            buffer = buffer.lstrip()
+            if buffer.startswith(','):
+                buffer = buffer[1:].lstrip()
+            if buffer.startswith(']'):
+                return
+            
+            try:
+                item, end = decoder.raw_decode(buffer)
+                complete = end < len(buffer) or eof
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            
+            if not complete:
+                # 원소가 읽은 범위 끝에 걸쳐 있음 - 더 읽고 다시 파싱
+                more = f.read(READ_SIZE)
+                eof = not more
+                buffer += more
+                continue
+            
+            yield item
+            buffer = buffer[end:]
+
+
+def _upsert(db: AsyncSession, table, update: bool):
+    """방언별 INSERT ... ON CONFLICT (place_id 기준, update=False면 DO NOTHING)"""
+    insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(table)
+    if not update:
+        return stmt.on_conflict_do_nothing(index_elements=["place_id"])
+    return stmt.on_conflict_do_update(
+        index_elements=["place_id"],
+        set_={column.name: stmt.excluded[column.name]
+              for column in table.columns if column.name not in ("place_id", "created_at")}
+    )
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB 단위
+
+
+async def _flush_chunk(db: AsyncSession, places: List[Dict[str, Any]], relations: List[Dict[str, Any]],
+                       replaced_place_ids: List[str], update: bool):
+    """청크 1개를 Core 일괄 삽입 후 커밋"""
+    if places:
+        await db.execute(_upsert(db, Place.__table__, update), places)
+    if replaced_place_ids:
+        # 갱신 모드: 기존 장소의 카테고리 관계는 새로 계산한 값으로 교체
+        await db.execute(
+            delete(PlaceCategoryRelation).where(PlaceCategoryRelation.place_id.in_(replaced_place_ids))
+        )
+    if relations:
+        await db.execute(PlaceCategoryRelation.__table__.insert(), relations)
+    await db.commit()
+
+
+async def load_category_file(db: AsyncSession, file_path: Path, existing_place_ids: set = None,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE, update: bool = False) -> int:
+    """카테고리별 JSON 파일 스트리밍 로딩 (청크 단위 일괄 삽입, 로딩/갱신한 장소 수 반환)"""
     category_name = file_path.stem  # 파일명에서 확장자 제거
+    if existing_place_ids is None:
+        result = await db.execute(select(Place.place_id))
+        existing_place_ids = set(result.scalars().all())
     
     print(f"📂 {category_name}.json 로딩 중...")
     
+    loaded_count = 0
+    skipped_count = 0
+    chunk_places: List[Dict[str, Any]] = []
+    chunk_relations: List[Dict[str, Any]] = []
+    chunk_replaced: List[str] = []
+    started = time.perf_counter()
+    
+    async def flush():
+        nonlocal loaded_count, chunk_places, chunk_relations, chunk_replaced
+        chunk_started = time.perf_counter()
+        await _flush_chunk(db, chunk_places, chunk_relations, chunk_replaced, update)
+        loaded_count += len(chunk_places)
+        elapsed = time.perf_counter() - started
+        print(f"  ⏳ {category_name}: {loaded_count}개 "
+              f"(청크 {len(chunk_places)}개 {time.perf_counter() - chunk_started:.2f}초, "
+              f"{loaded_count / elapsed:.0f}개/초, 최대 RSS {_peak_rss_mb():.1f}MB)")
+        chunk_places, chunk_relations, chunk_replaced = [], [], []
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            places_data = json.load(f)
-        
-        if not isinstance(places_data, list):
-            print(f"  ❌ {file_path} 형식 오류: 배열이 아님")
-            return 0
-        
-        loaded_count = 0
-        for place_data in places_data:
+        for place_data in iter_json_array(file_path):
             # 데이터 유효성 검사
-            if not validate_place_data(place_data):
+            if not isinstance(place_data, dict) or not validate_place_data(place_data):
                 continue
             
             # 데이터 변환
             processed_data, category_ids = process_place_data(place_data, category_name)
+            place_id = processed_data["place_id"]
             
-            # 중복 확인
-            result = await db.execute(
-                select(Place).where(Place.place_id == processed_data["place_id"])
-            )
-            existing = result.scalar_one_or_none()
-            
-            if existing:
-                print(f"  ⚠️  중복 place_id 건너뛰기: {processed_data['place_id']}")
-                continue
+            # 중복 확인 (DB에 있던 장소 + 이번 로딩에서 이미 넣은 장소)
+            if place_id in existing_place_ids:
+                if not update:
+                    skipped_count += 1
+                    continue
+                chunk_replaced.append(place_id)
+            existing_place_ids.add(place_id)
             
-            # DB에 저장
-            place = Place(**processed_data)
-            db.add(place)
-            
-            # 카테고리 관계 저장
-            for priority, category_id in enumerate(category_ids, 1):
-                relation = PlaceCategoryRelation(
-                    place_id=processed_data["place_id"],
-                    category_id=category_id,
-                    priority=priority
-                )
-                db.add(relation)
+            chunk_places.append(processed_data)
+            chunk_relations.extend(
+                {"place_id": place_id, "category_id": category_id, "priority": priority}
+                for priority, category_id in enumerate(category_ids, 1)
+            )
             
-            loaded_count += 1
+            if len(chunk_places) >= chunk_size:
+                await flush()
         
-        await db.commit()
-        print(f"  ✅ {category_name}: {loaded_count}개 장소 로딩 완료")
+        if chunk_places:
+            await flush()
+        
+        print(f"  ✅ {category_name}: {loaded_count}개 장소 로딩 완료 "
+              f"(중복 건너뜀 {skipped_count}개, {time.perf_counter() - started:.2f}초)")
         return loaded_count
         
     except FileNotFoundError:
         print(f"  ❌ 파일 없음: {file_path}")
         return 0
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, ValueError) as e:
         print(f"  ❌ JSON 파싱 오류: {file_path} - {e}")
-        return 0
+        await db.rollback()
+        return loaded_count
     except Exception as e:
         print(f"  ❌ 로딩 실패: {file_path} - {e}")
         await db.rollback()
-        return 0
+        return loaded_count
 
 
-async def load_all_places_data():
+async def load_all_places_data(chunk_size: int = DEFAULT_CHUNK_SIZE, update: bool = False):
     """전체 장소 데이터 로딩 메인 함수"""
     print("🚀 장소 데이터 로딩 시작...")
     
@@ -270,11 +372,14 @@ async def load_all_places_data():
             if clear_data.lower() in ['y', 'yes']:
                 await clear_existing_places(db)
             
-            # 3. 카테고리별 파일 로딩
+            # 3. 카테고리별 파일 로딩 (기존 place_id는 한 번만 조회해 전체 파일에서 공유)
+            result = await db.execute(select(Place.place_id))
+            existing_place_ids = set(result.scalars().all())
+            
             total_loaded = 0
             for category_name in CATEGORY_MAPPING.keys():
                 file_path = data_dir / f"{category_name}.json"
-                loaded_count = await load_category_file(db, file_path)
+                loaded_count = await load_category_file(db, file_path, existing_place_ids, chunk_size, update)
                 total_loaded += loaded_count
             
             # 4. 결과 출력
@@ -282,17 +387,17 @@ async def load_all_places_data():
             print(f"📊 총 {total_loaded}개 장소 로딩됨")
             
             # 5. 통계 출력
-            result = await db.execute(select(Place))
-            all_places = result.scalars().all()
-            print(f"💾 DB 총 장소 수: {len(all_places)}")
+            result = await db.execute(select(func.count()).select_from(Place))
+            print(f"💾 DB 총 장소 수: {result.scalar_one()}")
+            print(f"📈 최대 메모리(RSS): {_peak_rss_mb():.1f}MB")
             
             # 카테고리별 통계
+            result = await db.execute(
+                select(Place.category_id, func.count()).group_by(Place.category_id)
+            )
+            counts = dict(result.all())
             for category_name, category_id in CATEGORY_MAPPING.items():
-                result = await db.execute(
-                    select(Place).where(Place.category_id == category_id)
-                )
-                count = len(result.scalars().all())
-                print(f"  📍 {category_name}: {count}개")
+                print(f"  📍 {category_name}: {counts.get(category_id, 0)}개")
                 
         except Exception as e:
             print(f"❌ 전체 로딩 실패: {e}")
@@ -303,12 +408,17 @@ async def load_all_places_data():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="장소 데이터 로딩")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 장소 수 (청크마다 커밋)")
+    parser.add_argument("--update", action="store_true", help="이미 있는 장소도 JSON 내용으로 갱신")
+    args = parser.parse_args()
+    
     print("=" * 50)
     print("🏢 장소 데이터 로딩 시스템")
     print("=" * 50)
     
     # 비동기 실행
-    asyncio.run(load_all_places_data())
+    asyncio.run(load_all_places_data(args.chunk_size, args.update))
     
     print("\n✨ 작업 완료!")
     print("💡 이제 AI 에이전트가 place_id를 사용할 수 있습니다.")
\ No newline at end of file
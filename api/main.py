@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import sys
@@ -8,6 +9,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from routers import users, courses, couples, comments, auth, chat
 import config  # config.py의 설정 불러오기
+from db.session import pool_stats
+from clients.agent_client import agent_client
+from db.cache import response_cache
+from responses import DefaultJSONResponse
 
 # ✅ 모든 모델 임포트 (SQLAlchemy 관계 설정을 위해 필수)
 from models.base import Base
@@ -19,15 +24,25 @@ from models.place_category_relation import PlaceCategoryRelation
 from models.course import Course
 from models.course_place import CoursePlace
 from models.chat_session import ChatSession
+from models.chat_message import ChatMessage
 from models.comment import Comment
 from models.couple_request import CoupleRequest
 from models.couple import Couple
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 메인 에이전트 호출용 연결 풀은 앱 수명 동안 공유
+    await agent_client.start()
+    yield
+    await agent_client.close()
+
 app = FastAPI(
     title="My Dating App API",
     description="연인 관리, 추천코스, 댓글, 사용자 인증 등 전체 API",
     version="1.0.0",
     debug=config.DEBUG,  # config의 debug 설정 사용
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,  # orjson 설치 시 ORJSONResponse
 )
 
 # CORS 미들웨어 추가
@@ -56,6 +71,21 @@ def root():
         "kakao_redirect_uri": config.KAKAO_REDIRECT_URI,       # Kakao Redirect URI 반환 예시
     }
 
+@app.get("/health/db-pool")
+def db_pool_status():
+    """DB 연결 풀 사용 현황 (checked_out이 size + max_overflow에 가까우면 풀 부족)"""
+    return pool_stats()
+
+@app.get("/health/agent-client")
+def agent_client_status():
+    """메인 에이전트 호출 현황 (엔드포인트별 지연시간 히스토그램, 재시도 수)"""
+    return agent_client.stats()
+
+@app.get("/health/response-cache")
+def response_cache_status():
+    """프로필/연인 상태 응답 캐시 현황 (적중률, 304 응답 수, 무효화 수)"""
+    return response_cache.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,58 @@
+-- 채팅 메시지 정규화 테이블 생성 (chat_sessions.messages JSON → chat_messages 행)
+-- 실행 순서: 1. 테이블 생성 -> 2. 세션 집계 컬럼 추가 -> 3. 기존 메시지 마이그레이션 -> 4. 집계 컬럼 채우기 -> 5. 기존 컬럼 정리 (선택사항)
+
+-- 1. chat_messages 테이블 생성
+CREATE TABLE IF NOT EXISTS chat_messages (
+    chat_message_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id VARCHAR(100) NOT NULL,
+    seq INTEGER NOT NULL,
+    message_type VARCHAR(20) NOT NULL,
+    message_content TEXT NOT NULL,
+    course_data JSON,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (session_id) REFERENCES chat_sessions(session_id) ON DELETE CASCADE,
+    CONSTRAINT uq_chat_message_session_seq UNIQUE (session_id, seq)
+);
+
+-- 2. 세션 목록 조회용 집계 컬럼 추가
+ALTER TABLE chat_sessions ADD COLUMN message_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chat_sessions ADD COLUMN has_course BOOLEAN NOT NULL DEFAULT false;
+ALTER TABLE chat_sessions ADD COLUMN preview_message VARCHAR(100);
+
+-- 3. 기존 messages JSON 배열을 행으로 마이그레이션 (배열 순서 = seq)
+INSERT OR IGNORE INTO chat_messages (session_id, seq, message_type, message_content, course_data, sent_at)
+SELECT
+    s.session_id,
+    m.key + 1,
+    COALESCE(json_extract(m.value, '$.message_type'), 'ASSISTANT'),
+    COALESCE(json_extract(m.value, '$.message_content'), ''),
+    json_extract(m.value, '$.course_data'),
+    COALESCE(json_extract(m.value, '$.sent_at'), s.last_activity_at)
+FROM chat_sessions s, json_each(s.messages) m
+WHERE s.messages IS NOT NULL;
+
+-- 4. 집계 컬럼 채우기
+UPDATE chat_sessions SET
+    message_count = (SELECT COUNT(*) FROM chat_messages c WHERE c.session_id = chat_sessions.session_id),
+    has_course = EXISTS (
+        SELECT 1 FROM chat_messages c
+        WHERE c.session_id = chat_sessions.session_id AND c.course_data IS NOT NULL
+    ),
+    preview_message = (
+        SELECT substr(c.message_content, 1, 100) FROM chat_messages c
+        WHERE c.session_id = chat_sessions.session_id
+        ORDER BY c.seq DESC LIMIT 1
+    );
+
+-- 5. (선택사항) 기존 messages 컬럼 비우기/삭제
+-- 롤백 대비를 위해 일단 유지
+-- UPDATE chat_sessions SET messages = '[]';
+-- ALTER TABLE chat_sessions DROP COLUMN messages;
+
+-- 6. 확인 쿼리
+SELECT
+    'Migration completed' as status,
+    COUNT(*) as total_messages,
+    COUNT(DISTINCT session_id) as total_sessions
+FROM chat_messages;
@@ -0,0 +1,23 @@
+-- 자주 실행되는 조회 쿼리용 인덱스 추가 (SQLite / PostgreSQL 공통 문법)
+-- 모델의 __table_args__ 인덱스와 동일 - 새 DB는 init_db.py로 생성되므로 기존 DB에만 실행
+-- 확인: python check_query_plans.py (각 쿼리가 인덱스를 사용하는지 EXPLAIN으로 검사)
+
+-- 1. 코스: 내 코스 / 연인 공유 코스 조회 (get_all_courses_for_user)
+CREATE INDEX IF NOT EXISTS idx_course_user_shared ON courses(user_id, is_shared_with_couple);
+
+-- 2. 커플: user1_id OR user2_id 조회 (코스 조회마다 실행)
+CREATE INDEX IF NOT EXISTS idx_couple_user1 ON couples(user1_id);
+CREATE INDEX IF NOT EXISTS idx_couple_user2 ON couples(user2_id);
+
+-- 3. 댓글: 코스별 시간순 조회
+CREATE INDEX IF NOT EXISTS idx_comment_course_timestamp ON comments(course_id, timestamp);
+
+-- 4. 채팅 세션: 사용자별 최근 활동순 목록 (get_user_sessions)
+CREATE INDEX IF NOT EXISTS idx_chat_session_user_activity ON chat_sessions(user_id, last_activity_at);
+
+-- 5. 연인 신청: 받은 신청(닉네임) / 보낸 신청(신청자) 조회
+CREATE INDEX IF NOT EXISTS idx_couple_request_partner_status ON couple_requests(partner_nickname, status, requested_at);
+CREATE INDEX IF NOT EXISTS idx_couple_request_requester_status ON couple_requests(requester_id, status, requested_at);
+
+-- 6. 통계 갱신 (PostgreSQL은 ANALYZE; 도 동일)
+ANALYZE;
@@ -0,0 +1,9 @@
+-- 커서(keyset) 페이지네이션용 인덱스 추가 (SQLite / PostgreSQL 공통 문법)
+-- 모델의 __table_args__ 인덱스와 동일 - 새 DB는 init_db.py로 생성되므로 기존 DB에만 실행
+-- 댓글(course_id, timestamp), 채팅 세션(user_id, last_activity_at)은 add_hot_query_indexes.sql의 인덱스 사용
+
+-- 1. 코스 목록: 내 코스 최신순 (created_at, course_id) 커서 이후 조회
+CREATE INDEX IF NOT EXISTS idx_course_user_created ON courses(user_id, created_at, course_id);
+
+-- 2. 통계 갱신
+ANALYZE;
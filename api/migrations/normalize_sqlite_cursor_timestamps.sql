@@ -0,0 +1,7 @@
+-- SQLite 전용: 커서 페이지 정렬 시각을 'YYYY-MM-DD HH:MM:SS' 형식으로 통일 (PostgreSQL은 실행 불필요)
+-- 모델의 SortableTimestamp와 같은 형식 - 이전에 파이썬 값(마이크로초 포함)으로 저장된 행만 잘라냄
+-- 형식이 섞여 있으면 문자열 비교로 커서 위치가 어긋나 페이지가 반복되거나 행이 빠짐
+
+UPDATE courses SET created_at = substr(created_at, 1, 19) WHERE length(created_at) > 19;
+UPDATE comments SET timestamp = substr(timestamp, 1, 19) WHERE length(timestamp) > 19;
+UPDATE chat_sessions SET last_activity_at = substr(last_activity_at, 1, 19) WHERE length(last_activity_at) > 19;
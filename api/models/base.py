@@ -1,3 +1,13 @@
+from sqlalchemy import TIMESTAMP
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
+
+# 커서 페이지 정렬 키로 쓰는 시각 컬럼 타입
+# SQLite는 시각을 문자열로 비교하므로 server_default(CURRENT_TIMESTAMP)와 같은 'YYYY-MM-DD HH:MM:SS' 형식으로
+# 파이썬 값과 커서 바인딩 값도 저장/비교 (같은 초의 행은 ID로 구분, PostgreSQL은 TIMESTAMP WITH TIME ZONE 그대로)
+SortableTimestamp = TIMESTAMP(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite",
+)
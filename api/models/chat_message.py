@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Text, JSON, TIMESTAMP, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from models.base import Base
+
+class ChatMessage(Base):
+    __tablename__ = "chat_messages"
+    __table_args__ = (
+        UniqueConstraint('session_id', 'seq', name='uq_chat_message_session_seq'),  # 세션 내 순번 + 순서 조회 인덱스
+    )
+
+    chat_message_id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    session_id = Column(String(100), ForeignKey("chat_sessions.session_id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 세션 내 메시지 순번 (1부터, 응답의 message_id)
+    message_type = Column(String(20), nullable=False)  # USER / ASSISTANT
+    message_content = Column(Text, nullable=False)
+    course_data = Column(JSON, nullable=True)
+    sent_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
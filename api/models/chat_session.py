@@ -1,16 +1,26 @@
-from sqlalchemy import Column, BigInteger, String, Boolean, JSON, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, Boolean, JSON, TIMESTAMP, ForeignKey, Index
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from models.base import Base
+from models.base import Base, SortableTimestamp
 
 class ChatSession(Base):
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # 사용자 세션 목록 최근 활동순 조회
+        Index('idx_chat_session_user_activity', 'user_id', 'last_activity_at'),
+    )
 
     session_id = Column(String(100), primary_key=True, index=True)
     user_id = Column(String(36), ForeignKey("users.user_id", ondelete="RESTRICT"), nullable=False)
     session_title = Column(String(200), nullable=True)
     session_status = Column(String(20), nullable=False, server_default="ACTIVE")
     is_active = Column(Boolean, nullable=False, server_default="true")
-    messages = Column(JSON, nullable=True, server_default='[]')
+    # 레거시 JSON (메시지는 chat_messages 테이블에 저장, 세션 조회 시 로드하지 않음)
+    messages = deferred(Column(JSON, nullable=True, server_default='[]'))
+    # 세션 목록 조회용 비정규화 컬럼 (메시지 추가 시 함께 갱신)
+    message_count = Column(Integer, nullable=False, server_default="0")
+    has_course = Column(Boolean, nullable=False, server_default="false")
+    preview_message = Column(String(100), nullable=True)
     started_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
-    last_activity_at = Column(TIMESTAMP(timezone=True), nullable=False, server_default=func.now())
+    last_activity_at = Column(SortableTimestamp, nullable=False, server_default=func.now())
     expires_at = Column(TIMESTAMP(timezone=True), nullable=True)
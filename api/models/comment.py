@@ -1,13 +1,17 @@
-from sqlalchemy import Column, BigInteger, Integer, String, TIMESTAMP, ForeignKey, Text
+from sqlalchemy import Column, BigInteger, Integer, String, ForeignKey, Text, Index
 from sqlalchemy.sql import func
-from models.base import Base
+from models.base import Base, SortableTimestamp
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 코스별 댓글 시간순 조회
+        Index('idx_comment_course_timestamp', 'course_id', 'timestamp'),
+    )
 
     comment_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     course_id = Column(Integer, ForeignKey("courses.course_id"), nullable=False)
     user_id = Column(String(36), nullable=False)
     nickname = Column(String(50), nullable=False)
     comment = Column(Text, nullable=False)
-    timestamp = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    timestamp = Column(SortableTimestamp, server_default=func.now(), nullable=False)
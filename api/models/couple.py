@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func
+from sqlalchemy import Column, Integer, String, TIMESTAMP, Index, func
 from models.base import Base
 
 class Couple(Base):
     __tablename__ = "couples"
+    __table_args__ = (
+        # user1_id OR user2_id 조회 (각 인덱스를 OR로 합쳐 사용)
+        Index('idx_couple_user1', 'user1_id'),
+        Index('idx_couple_user2', 'user2_id'),
+    )
 
     couple_id = Column(Integer, primary_key=True, autoincrement=True, index=True)  # BigInteger → Integer 변경
     user1_id = Column(String(36), nullable=False)
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func
+from sqlalchemy import Column, Integer, String, TIMESTAMP, Index, func
 from models.base import Base
 
 class CoupleRequest(Base):
     __tablename__ = "couple_requests"
+    __table_args__ = (
+        # 받은 신청(닉네임 + 상태), 보낸 신청(신청자 + 상태) 조회
+        Index('idx_couple_request_partner_status', 'partner_nickname', 'status', 'requested_at'),
+        Index('idx_couple_request_requester_status', 'requester_id', 'status', 'requested_at'),
+    )
 
     request_id = Column(Integer, primary_key=True, autoincrement=True, index=True)  # BigInteger → Integer 변경
     requester_id = Column(String(36), nullable=False)  # UUID와 일치
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, BigInteger, String, Text, Boolean, Integer, JSON, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, BigInteger, String, Text, Boolean, Integer, JSON, TIMESTAMP, ForeignKey, Index
 from sqlalchemy.sql import func
-from models.base import Base
+from models.base import Base, SortableTimestamp
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        # 내 코스(user_id) + 연인 공유 코스(user_id, is_shared_with_couple) 조회
+        Index('idx_course_user_shared', 'user_id', 'is_shared_with_couple'),
+        # 코스 목록 커서 페이지 (user_id, 최신순)
+        Index('idx_course_user_created', 'user_id', 'created_at', 'course_id'),
+    )
 
     course_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     user_id = Column(String(36), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
@@ -13,5 +19,5 @@ class Course(Base):
     estimated_cost = Column(Integer, nullable=True)
     is_shared_with_couple = Column(Boolean, nullable=False, server_default="false")
     comments = Column(JSON, nullable=True, server_default="[]")
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(SortableTimestamp, server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
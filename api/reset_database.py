@@ -24,6 +24,7 @@ from models.place_category_relation import PlaceCategoryRelation
 from models.course import Course
 from models.course_place import CoursePlace
 from models.chat_session import ChatSession
+from models.chat_message import ChatMessage
 from models.comment import Comment
 from models.couple_request import CoupleRequest
 from models.couple import Couple
@@ -0,0 +1,47 @@
+"""
+API 응답 직렬화 공통 함수
+- orjson이 설치되어 있으면 ORJSONResponse를 기본 응답 클래스로 사용
+- 큰 응답은 fast_json()으로 바로 직렬화 (jsonable_encoder + response_model 검증 단계 생략)
+- 무거운 필드(description, info_urls)는 fields= 로 요청할 때만 포함하고, None 값은 내려주지 않음
+"""
+
+from typing import Any, Dict, Iterable, Optional, Set
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+    HAS_ORJSON = True
+except ImportError:
+    DefaultJSONResponse = JSONResponse
+    HAS_ORJSON = False
+
+# 목록/상세 화면에서 기본으로 생략하는 필드 (fields=description,info_urls 로 요청 시 포함)
+HEAVY_FIELDS = frozenset({"description", "info_urls"})
+
+
+def parse_fields(fields: Optional[str]) -> Set[str]:
+    """fields 쿼리 파라미터 (쉼표 구분) → 포함할 무거운 필드 집합"""
+    if not fields:
+        return set()
+    return {name.strip() for name in fields.split(",") if name.strip()}
+
+
+def trim(item: Dict[str, Any], include: Iterable[str] = (), heavy: Iterable[str] = HEAVY_FIELDS) -> Dict[str, Any]:
+    """None 값과 요청하지 않은 무거운 필드를 뺀 dict"""
+    include = set(include)
+    heavy = set(heavy)
+    return {
+        key: value for key, value in item.items()
+        if value is not None and (key not in heavy or key in include)
+    }
+
+
+def fast_json(content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    """dict를 바로 JSON 응답으로 (orjson은 datetime 등을 직접 직렬화, 없으면 jsonable_encoder 사용)"""
+    if HAS_ORJSON:
+        return DefaultJSONResponse(content, status_code=status_code, headers=headers)
+    return JSONResponse(jsonable_encoder(content), status_code=status_code, headers=headers)
@@ -5,6 +5,8 @@ from datetime import datetime
 
 from db.session import get_db
 from crud.crud_chat import chat_crud
+from responses import fast_json
+from crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError, clamp_page_size
 from schemas.chat import (
     ChatSessionCreate,
     ChatMessageCreate, 
@@ -101,30 +103,28 @@ async def start_recommendation(
 @router.get("/sessions/user/{user_id}", response_model=ChatSessionListResponse, summary="사용자 채팅 세션 목록 조회")
 async def get_user_sessions(
     user_id: str = Path(..., description="사용자 ID"),
-    limit: Optional[int] = Query(None, ge=1, description="조회할 세션 수 (기본값: 무제한)"),
-    offset: int = Query(0, ge=0, description="오프셋"),
+    limit: Optional[int] = Query(None, ge=1, description=f"조회할 세션 수 (기본 {DEFAULT_PAGE_SIZE}, 최대 {MAX_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 pagination.next_cursor (없으면 첫 페이지)"),
     status: str = Query("all", description="세션 상태 필터 (all, active, completed)"),
     db: AsyncSession = Depends(get_db)
 ):
-    """사용자의 채팅 세션 목록을 조회합니다."""
+    """사용자의 채팅 세션 목록을 최근 활동순으로 한 페이지씩 조회합니다."""
     try:
-        sessions = await chat_crud.get_user_sessions(db, user_id, limit, offset)
-        
-        # 상태 필터링
-        if status != "all":
-            sessions = [s for s in sessions if s["session_status"].lower() == status.lower()]
+        sessions, next_cursor = await chat_crud.get_user_sessions(db, user_id, limit, cursor, status)
         
         return {
             "success": True,
             "sessions": sessions,
             "pagination": {
                 "total_count": len(sessions),
-                "limit": limit,
-                "offset": offset,
-                "has_more": limit is not None and len(sessions) == limit
+                "limit": clamp_page_size(limit),
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None
             }
         }
         
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
 
@@ -140,10 +140,11 @@ async def get_session_detail(
         if not result:
             raise HTTPException(status_code=404, detail="채팅 세션을 찾을 수 없습니다.")
         
-        return {
+        # 메시지 목록이 길어 orjson으로 바로 직렬화
+        return fast_json({
             "success": True,
             **result
-        }
+        })
         
     except HTTPException:
         raise
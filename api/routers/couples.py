@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
+from db.cache import cached_json, user_cache_key
 from schemas.couple_request import CoupleRequestCreate, CoupleRequestRead
 from schemas.couple import CoupleCreate
 from crud import crud_couple_request, crud_couple
@@ -109,18 +110,18 @@ async def respond_to_request(
 
 # 5. 현재 연인 상태 조회
 @router.get("/couples/status", summary="현재 연인 상태 조회")
-async def get_couple_status(user_id: str = Query(..., description="사용자 ID"), db: AsyncSession = Depends(get_db)):
-    try:
+async def get_couple_status(request: Request, user_id: str = Query(..., description="사용자 ID"), db: AsyncSession = Depends(get_db)):
+    async def build():
         couple = await crud_couple.get_couple_by_user_id(db, user_id)
         if not couple:
             return {
                 "has_partner": False,
                 "message": "연인 관계가 없습니다."
             }
-        
+
         partner_id = couple.user2_id if couple.user1_id == user_id else couple.user1_id
         partner_nickname = couple.user2_nickname if couple.user1_id == user_id else couple.user1_nickname
-        
+
         return {
             "has_partner": True,
             "couple_info": {
@@ -130,6 +131,10 @@ async def get_couple_status(user_id: str = Query(..., description="사용자 ID"
                 "created_at": couple.created_at.isoformat()
             }
         }
+
+    try:
+        # 연인 수락/해제 시 crud_couple에서 두 사람의 캐시 삭제
+        return await cached_json(request, user_cache_key(user_id, "couple_status"), build)
     except Exception as e:
         raise HTTPException(status_code=500, detail="연인 상태 조회 중 오류가 발생했습니다.")
 
@@ -1,9 +1,20 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from db.session import get_db
 from schemas.course import CourseCreate, CourseRead
 from crud import crud_course
+from crud.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, InvalidCursorError
+from responses import fast_json, parse_fields, trim
+
+FIELDS_DESCRIPTION = "추가로 포함할 필드 (쉼표 구분: description,info_urls - 기본은 생략)"
+
+def _trim_course(course: dict, include: set) -> dict:
+    """상세 화면용: 코스는 None 값만, 장소는 None 값과 요청하지 않은 무거운 필드까지 제외 (코스 설명은 상세에서 항상 표시)"""
+    trimmed = trim(course, heavy=())
+    if "places" in course:
+        trimmed["places"] = [trim(place, include) for place in course["places"]]
+    return trimmed
 
 router = APIRouter()
 
@@ -69,15 +80,25 @@ async def save_course_endpoint(course_in: CourseCreate, db: AsyncSession = Depen
 
 # ✅ 3-2. 추천 코스 내역 조회 (GET /courses/list)
 @router.get("/courses/list", summary="추천 코스 내역 조회")
-async def list_courses(user_id: str = Query(..., description="사용자 ID"), db: AsyncSession = Depends(get_db)):
-    courses = await crud_course.get_all_courses_for_user(db, user_id=user_id)
-    # 결과를 직렬화 가능한 형태로 변환
+async def list_courses(
+    user_id: str = Query(..., description="사용자 ID"),
+    limit: Optional[int] = Query(None, ge=1, description=f"조회할 코스 수 (기본 {DEFAULT_PAGE_SIZE}, 최대 {MAX_PAGE_SIZE})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 첫 페이지)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        courses, next_cursor = await crud_course.get_all_courses_for_user(db, user_id=user_id, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # 결과를 직렬화 가능한 형태로 변환 (설명 등 무거운 필드는 fields로 요청 시에만)
+    include = parse_fields(fields)
     course_list = []
     for course in courses:
         # 자신의 코스인지 확인
         is_my_course = course.user_id == user_id
         
-        course_list.append({
+        course_list.append(trim({
             "course_id": course.course_id,
             "title": course.title,
             "description": course.description,
@@ -88,32 +109,43 @@ async def list_courses(user_id: str = Query(..., description="사용자 ID"), db
             "creator_nickname": "나" if is_my_course else "상대방",
             "is_my_course": is_my_course,
             "is_shared_course": not is_my_course  # 공유받은 코스인지 표시
-        })
-    return {"courses": course_list}
+        }, include))
+    return fast_json({"courses": course_list, "next_cursor": next_cursor, "has_more": next_cursor is not None})
 
 # ✅ 3-3. 코스 상세 조회 (나만 보는) (GET /courses/detail)
 @router.get("/courses/detail", summary="코스 상세 조회")
 async def read_course_detail(
     user_id: str = Query(..., description="사용자 ID"),
     course_id: int = Query(..., description="코스 ID"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
 ):
     course = await crud_course.get_course_detail(db, user_id=user_id, course_id=course_id)
     if not course:
         raise HTTPException(status_code=404, detail="코스를 찾을 수 없습니다.")
-    return {"course": course}
+    return fast_json({"course": _trim_course(course, parse_fields(fields))})
 
 # ✅ 3-4. 코스 상세 + 댓글 통합 조회 (연인과 공유) (GET /courses/comments)
 @router.get("/courses/comments", summary="코스 + 댓글 통합 조회")
 async def course_with_comments(
     user_id: str = Query(..., description="사용자 ID"),
     course_id: int = Query(..., description="코스 ID"),
+    comment_limit: Optional[int] = Query(None, ge=1, description=f"조회할 댓글 수 (기본 {crud_course.COMMENT_PAGE_SIZE}, 최대 {MAX_PAGE_SIZE})"),
+    comment_cursor: Optional[str] = Query(None, description="이전 응답의 comments_next_cursor (없으면 처음부터)"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
 ):
-    course_with_comments = await crud_course.get_course_with_comments(db, user_id=user_id, course_id=course_id)
+    try:
+        course_with_comments = await crud_course.get_course_with_comments(
+            db, user_id=user_id, course_id=course_id,
+            comment_limit=comment_limit, comment_cursor=comment_cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not course_with_comments:
         raise HTTPException(status_code=404, detail="코스를 찾을 수 없습니다.")
-    return course_with_comments
+    course_with_comments["course"] = _trim_course(course_with_comments["course"], parse_fields(fields))
+    return fast_json(course_with_comments)
 
 # ✅ 3-5. 코스 삭제 (DELETE /courses/delete)
 @router.delete("/courses/delete", summary="코스 삭제")
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from db.session import get_db
+from db.cache import cached_json, user_cache_key
 from crud import crud_user
 from schemas.user import UserCreate, StatusResponse, NicknameCheckRequest, UserProfileSetup, UserProfileResponse, UserProfileUpdate, UserDeleteRequest
 from pydantic import BaseModel
@@ -90,39 +91,46 @@ async def initial_user_setup(req: UserProfileSetup, db: AsyncSession = Depends(g
         }
 
 @router.get("/users/profile/couple-status", summary="커플 연결 페이지 조회")
-async def get_couple_status(user_id: str, db: AsyncSession = Depends(get_db)):
-    user = await crud_user.get_user(db, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-    
-    return {
-        "couple_info": None,
-        "message": "현재 연인과 연결되어 있지 않습니다."
-    }
+async def get_couple_status(user_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    async def build():
+        user = await crud_user.get_user(db, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+
+        return {
+            "couple_info": None,
+            "message": "현재 연인과 연결되어 있지 않습니다."
+        }
+
+    return await cached_json(request, user_cache_key(user_id, "profile_couple_status"), build)
 
 @router.get("/users/profile/me", response_model=dict, summary="마이페이지 전체 정보 조회")
-async def get_my_profile(user_id: str, db: AsyncSession = Depends(get_db)):
-    user = await crud_user.get_user(db, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-    
-    # 실제 DB 데이터만 반환
-    return {
-        "status": "success",
-        "user": {
-            "user_id": user.user_id,
-            "nickname": user.nickname,
-            "email": user.email or "",
-            "profile_detail": user.profile_detail or {
-                "age_range": "",
-                "gender": "",
-                "mbti": "",
-                "car_owner": False,
-                "preferences": ""
-            },
-            "couple_info": user.couple_info
+async def get_my_profile(user_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    async def build():
+        user = await crud_user.get_user(db, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+
+        # 실제 DB 데이터만 반환
+        return {
+            "status": "success",
+            "user": {
+                "user_id": user.user_id,
+                "nickname": user.nickname,
+                "email": user.email or "",
+                "profile_detail": user.profile_detail or {
+                    "age_range": "",
+                    "gender": "",
+                    "mbti": "",
+                    "car_owner": False,
+                    "preferences": ""
+                },
+                "couple_info": user.couple_info
+            }
         }
-    }
+
+    # 수정/탈퇴 시 crud_user에서 캐시 삭제
+    return await cached_json(request, user_cache_key(user_id, "profile_me"), build)
 
 @router.put("/users/profile/update", summary="마이페이지 수정")
 async def update_user_profile(req: UserProfileUpdate, db: AsyncSession = Depends(get_db)):
@@ -174,21 +182,24 @@ async def update_user_profile_with_id(user_id: str, req: UserProfileUpdate, db:
         raise HTTPException(status_code=500, detail=f"프로필 업데이트 실패: {str(e)}")
 
 @router.get("/users/profile/main", summary="메인페이지")
-async def get_main_profile(user_id: str, db: AsyncSession = Depends(get_db)):
-    user = await crud_user.get_user(db, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-    
-    return {
-        "status": "success",
-        "user": {
-            "user_id": user.user_id,
-            "name": user.nickname,
-            "nickname": user.nickname,
-            "login_info": "kakao",
-            "couple_info": None
+async def get_main_profile(user_id: str, request: Request, db: AsyncSession = Depends(get_db)):
+    async def build():
+        user = await crud_user.get_user(db, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+
+        return {
+            "status": "success",
+            "user": {
+                "user_id": user.user_id,
+                "name": user.nickname,
+                "nickname": user.nickname,
+                "login_info": "kakao",
+                "couple_info": None
+            }
         }
-    }
+
+    return await cached_json(request, user_cache_key(user_id, "profile_main"), build)
 
 @router.delete("/users/profile/delete", summary="회원 탈퇴")
 async def delete_user_account(req: UserDeleteRequest, db: AsyncSession = Depends(get_db)):